@@ -0,0 +1,102 @@
+# ------------------------------------------------------------------------------
+# anytime.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Guess selection under a deadline.
+
+Guesses are ordered by a cheap letter frequency heuristic, then scored
+exactly (entropy plus frequency, like WordleAI.rank_guesses) in blocks until
+the deadline. Block sizes grow while there's time and shrink to fit what's
+left, so the best guess found so far is returned close to the deadline. If
+the search finishes, the ranking is the same as rank_guesses'.
+"""
+
+# Python imports
+from collections import namedtuple
+import time
+import numpy as np
+if __name__ == "src.anytime":
+    from src.pattern_codec import WORD_LENGTH
+    from src.pattern_table import LETTER_CODES
+    from src.ranking import top_k
+else:
+    from pattern_codec import WORD_LENGTH
+    from pattern_table import LETTER_CODES
+    from ranking import top_k
+
+# Guesses exactly scored in the first block
+FIRST_BLOCK = 32
+
+# ranking: top (word, score) pairs, scored by the heuristic if evaluated is 0
+# evaluated: guesses exactly scored, out of total
+Selection = namedtuple("Selection", ["ranking", "evaluated", "total", "complete"])
+
+
+def letter_scores(guess_letters, candidate_letters) -> np.ndarray:
+    """
+    Cheap estimate of how well each guess splits the candidates, from
+    (n, 5) letter code arrays. A letter found in a fraction p of the
+    candidates scores p * (1 - p) for each of its distinct letters and
+    again for each position, so letters that split the candidates in half
+    score best.
+    """
+    size = max(1, len(candidate_letters))
+    # Codes outside a-z get columns of their own
+    present = np.zeros((len(candidate_letters), LETTER_CODES), dtype=bool)
+    present[np.arange(len(candidate_letters))[:, None], candidate_letters] = True
+    contains = present.sum(axis=0) / size
+    positions = np.arange(WORD_LENGTH)
+    at = np.zeros((WORD_LENGTH, LETTER_CODES))
+    np.add.at(at, (positions, candidate_letters), 1)
+    at /= size
+
+    # Repeated letters only count once towards contains
+    distinct = np.ones(guess_letters.shape, dtype=bool)
+    for i in range(1, WORD_LENGTH):
+        distinct[:, i] = (guess_letters[:, i, None] != guess_letters[:, :i]).all(axis=1)
+    p = contains[guess_letters]
+    q = at[positions, guess_letters]
+    return (p * (1 - p) * distinct).sum(axis=1) + (q * (1 - q)).sum(axis=1)
+
+
+def select_guesses(ai, deadline, candidate_ids=None, k=10):
+    """
+    Rank guesses for the candidates until deadline, a time.perf_counter()
+    value. Returns a Selection.
+    """
+    if candidate_ids is None:
+        candidate_ids = ai.get_candidate_ids()
+    table = ai.pattern_table
+    guess_ids = table.answer_guess_ids[candidate_ids]
+    guessable = guess_ids >= 0
+    guess_ids = guess_ids[guessable]
+    guesses = [table.guesses[guess_id] for guess_id in guess_ids]
+    total = len(guess_ids)
+
+    candidate_letters = ai.letters[candidate_ids]
+    heuristic = letter_scores(candidate_letters[guessable], candidate_letters)
+    order = np.lexsort((guess_ids, -heuristic))
+    frequencies = ai.guess_priors[guess_ids]
+    scores = np.empty(total)
+
+    evaluated = 0
+    size = FIRST_BLOCK
+    start = now = time.perf_counter()
+    while evaluated < total and now < deadline:
+        block = order[evaluated:evaluated + size]
+        scores[block] = ai.calculate_entropies(candidate_ids, guess_ids[block]) + frequencies[block]
+        evaluated += len(block)
+        now = time.perf_counter()
+        # Size the next block to what the time left allows
+        per_guess = max(now - start, 1e-9) / evaluated
+        size = max(1, min(size * 2, int((deadline - now) / per_guess)))
+
+    if evaluated == 0:
+        return Selection(top_k(heuristic, guesses, k, guess_ids), 0, total, total == 0)
+    scored = order[:evaluated]
+    ranking = top_k(scores[scored], [guesses[i] for i in scored], k, guess_ids[scored])
+    return Selection(ranking, evaluated, total, evaluated == total)
@@ -0,0 +1,73 @@
+# ------------------------------------------------------------------------------
+# batch_simulator.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Lockstep simulation of many games at once.
+
+Games that have seen the same guesses and patterns have the same candidate
+set, so they're kept together in one group and share a single guess choice.
+Each turn every group plays its guess, the games that got all greens finish
+and the rest are split into new groups by the pattern they received. The
+whole answer list then costs one guess choice per distinct tree node instead
+of one per game per turn.
+"""
+
+# Python imports
+import numpy as np
+if __name__ == "src.batch_simulator":
+    from src.pattern_codec import ALL_GREEN, GUESS_LIMIT
+else:
+    from pattern_codec import ALL_GREEN, GUESS_LIMIT
+
+
+class Group:
+
+    def __init__(self, history, candidate_ids, answer_ids):
+        # (guess, pattern) pairs shared by every game in the group
+        self.history = history
+        self.candidate_ids = candidate_ids
+        # Answers of the games in the group, always a subset of the candidates
+        self.answer_ids = answer_ids
+
+
+def simulate_lockstep(ai, answer_ids=None, guess_limit=GUESS_LIMIT):
+    """
+    Play every answer in answer_ids with ai.next_guess.
+
+    Returns ({answer_id: [guesses]}, number of guess choices made).
+    """
+    table = ai.pattern_table
+    if answer_ids is None:
+        answer_ids = np.arange(len(table.answers))
+    groups = [Group([], ai.initial_candidates.nonzero()[0], np.asarray(answer_ids))]
+    played = dict()
+    choices = 0
+
+    for turn in range(guess_limit):
+        next_groups = []
+        for group in groups:
+            guess = ai.next_guess(group.history, group.candidate_ids)
+            choices += 1
+            guess_id = table.guess_ids[guess]
+            row = table.table[guess_id]
+            answer_patterns = row[group.answer_ids]
+            candidate_patterns = row[group.candidate_ids]
+
+            for pattern in np.unique(answer_patterns):
+                history = group.history + [(guess, int(pattern))]
+                answers = group.answer_ids[answer_patterns == pattern]
+                if pattern == ALL_GREEN or turn == guess_limit - 1:
+                    for answer_id in answers:
+                        played[int(answer_id)] = [word for word, _ in history]
+                    continue
+                candidates = group.candidate_ids[candidate_patterns == pattern]
+                next_groups.append(Group(history, candidates, answers))
+        groups = next_groups
+        if not groups:
+            break
+
+    return played, choices
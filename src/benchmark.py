@@ -0,0 +1,226 @@
+# ------------------------------------------------------------------------------
+# benchmark.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Plays every answer with the solver's strategy across a process pool and
+reports the guess count distribution, failures and throughput.
+
+Games are played against the pattern table, which scores guesses exactly
+like WordleGame.guess.
+
+Usage:
+    python benchmark.py --workers=4 --chunksize=16 --answers=answers
+    python benchmark.py --lockstep
+    python benchmark.py --lockstep --scoring=lookahead
+    python benchmark.py --lockstep --prefilter --no-book --endgame-threshold=0
+
+The opening book is built with the selected scoring mode and prefilter.
+--no-book and --endgame-threshold=0 leave every move to rank_guesses, so a
+scoring mode or the prefilter is measured on every guess, not only where
+the book and the endgame solver don't answer.
+"""
+
+# Python imports
+import argparse
+import multiprocessing
+import os
+import time
+from collections import Counter
+import numpy as np
+if __name__ == "src.benchmark":
+    from src.wordle_ai import WordleAI, ENDGAME_THRESHOLD
+    from src.pattern_codec import ALL_GREEN, GUESS_LIMIT
+    from src.pattern_table import PatternTable
+    from src.shared_table import SharedPatternTable, attach
+    from src.batch_simulator import simulate_lockstep
+    from src.decision_tree import DecisionTree
+    from src.opening_book import OpeningBook
+    from src.memo_store import MemoStore, DEFAULT_STORE_PATH
+    from src.vocabularies import get_vocabulary, DEFAULT_GUESSES, DEFAULT_ANSWERS
+else:
+    from wordle_ai import WordleAI, ENDGAME_THRESHOLD
+    from pattern_codec import ALL_GREEN, GUESS_LIMIT
+    from pattern_table import PatternTable
+    from shared_table import SharedPatternTable, attach
+    from batch_simulator import simulate_lockstep
+    from decision_tree import DecisionTree
+    from opening_book import OpeningBook
+    from memo_store import MemoStore, DEFAULT_STORE_PATH
+    from vocabularies import get_vocabulary, DEFAULT_GUESSES, DEFAULT_ANSWERS
+
+MAX_GUESSES = 6
+
+# Solver state of each worker process, set by _init_worker
+_solver = None
+
+
+class Solver:
+
+    def __init__(self, pattern_table, memo_path=None, decision_tree=False,
+                 scoring_mode="entropy", prefilter=False, opening_book=True,
+                 endgame_threshold=ENDGAME_THRESHOLD):
+        self.pattern_table = pattern_table
+        memo_store = MemoStore(memo_path) if memo_path is not None else None
+        self.ai = WordleAI(pattern_table.answers, pattern_table, memo_store)
+        self.ai.get_frequencies()
+        self.ai.scoring_mode = scoring_mode
+        # Audited, so every ranking also checks what the prefilter dropped
+        self.ai.prefilter = self.ai.prefilter_audit = prefilter
+        self.ai.endgame_threshold = endgame_threshold
+        # Built with the settings above, so it plays the strategy under test
+        if opening_book:
+            self.ai.opening_book = OpeningBook.load_or_build(self.ai)
+        # Only count rankings made while playing
+        self.ai.prefilter_stats = {"rankings": 0, "dropped": 0}
+        if decision_tree:
+            self.ai.decision_tree = DecisionTree.load_or_compile(self.ai)
+
+    def play(self, answer_id):
+        """Return the guesses made to find answers[answer_id]."""
+        table = self.pattern_table
+        self.ai.reset_candidates()
+        history = []
+        while len(history) < GUESS_LIMIT:
+            guess = self.ai.next_guess(history)
+            guess_id = table.guess_ids[guess]
+            pattern = int(table.table[guess_id, answer_id])
+            history.append((guess, pattern))
+            if pattern == ALL_GREEN:
+                break
+            self.ai.prune_by_pattern(guess_id, pattern)
+        return [guess for guess, _ in history]
+
+
+def _init_worker(handle, options):
+    # Workers share the parent's table instead of loading their own copy
+    global _solver
+    _solver = Solver(attach(handle), **options)
+
+
+def _play(answer_id):
+    start = time.perf_counter()
+    guesses = _solver.play(answer_id)
+    return answer_id, guesses, time.perf_counter() - start
+
+
+def run_benchmark(guesses, answers, workers=None, chunksize=16, memo_path=None,
+                  decision_tree=False, scoring_mode="entropy", opening_book=True,
+                  endgame_threshold=ENDGAME_THRESHOLD):
+    """
+    Play every answer and return {answer: (guesses, seconds)} along with the
+    total wall time.
+    """
+    global _solver
+    if workers is None:
+        workers = os.cpu_count() or 1
+    options = {"memo_path": memo_path, "decision_tree": decision_tree, "scoring_mode": scoring_mode,
+               "opening_book": opening_book, "endgame_threshold": endgame_threshold}
+    # Build the table and book once up front so workers only load them
+    _solver = Solver(PatternTable.load(guesses, answers), **options)
+
+    start = time.perf_counter()
+    if workers <= 1:
+        results = [_play(answer_id) for answer_id in range(len(answers))]
+    else:
+        with SharedPatternTable(_solver.pattern_table) as shared, \
+                multiprocessing.Pool(workers, _init_worker, (shared.handle, options)) as pool:
+            results = list(pool.imap_unordered(_play, range(len(answers)), chunksize))
+    elapsed = time.perf_counter() - start
+
+    games = {answers[answer_id]: (played, seconds) for answer_id, played, seconds in results}
+    return games, elapsed
+
+
+def run_lockstep(guesses, answers, memo_path=None, scoring_mode="entropy", prefilter=False,
+                 opening_book=True, endgame_threshold=ENDGAME_THRESHOLD):
+    """
+    Like run_benchmark, but plays every game at once with the batch
+    simulator. Per game times are the total time averaged over the games.
+    """
+    solver = Solver(PatternTable.load(guesses, answers), memo_path, scoring_mode=scoring_mode,
+                    prefilter=prefilter, opening_book=opening_book,
+                    endgame_threshold=endgame_threshold)
+    start = time.perf_counter()
+    played, choices = simulate_lockstep(solver.ai)
+    elapsed = time.perf_counter() - start
+
+    print(f"Guess choices: {choices}")
+    if prefilter:
+        stats = solver.ai.prefilter_stats
+        print(f"Prefilter dropped the best guess in {stats['dropped']} of "
+              f"{stats['rankings']} rankings")
+    seconds = elapsed / max(1, len(played))
+    games = {answers[answer_id]: (guesses, seconds) for answer_id, guesses in played.items()}
+    return games, elapsed
+
+
+def summarize(games, elapsed):
+    counts = np.array([len(played) for played, _ in games.values()])
+    times = np.array([seconds for _, seconds in games.values()])
+    return {
+        "games": len(counts),
+        "mean": float(counts.mean()),
+        "distribution": dict(sorted(Counter(counts.tolist()).items())),
+        "failures": sorted(answer for answer, (played, _) in games.items()
+                           if len(played) > MAX_GUESSES),
+        "mean_game_seconds": float(times.mean()),
+        "max_game_seconds": float(times.max()),
+        "total_seconds": elapsed,
+        "games_per_second": len(counts) / elapsed,
+    }
+
+
+def print_summary(summary):
+    print(f"Games: {summary['games']}")
+    print(f"Mean guesses: {summary['mean']:.4f}")
+    print("Distribution:")
+    for guesses, count in summary["distribution"].items():
+        print(f"  {guesses}: {count}")
+    print(f"Failures (> {MAX_GUESSES} guesses): {len(summary['failures'])} {summary['failures']}")
+    print(f"Per game: mean {summary['mean_game_seconds'] * 1000:.2f} ms, "
+          f"max {summary['max_game_seconds'] * 1000:.2f} ms")
+    print(f"Total: {summary['total_seconds']:.2f} s, {summary['games_per_second']:.1f} games/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play every answer and report solver stats")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--guesses", default=DEFAULT_GUESSES)
+    parser.add_argument("--answers", default=DEFAULT_ANSWERS)
+    parser.add_argument("--lockstep", action="store_true",
+                        help="play all answers together, one guess choice per tree node")
+    parser.add_argument("--decision-tree", action="store_true",
+                        help="play from the compiled decision tree")
+    parser.add_argument("--memo-store", default=None, const=DEFAULT_STORE_PATH, nargs="?",
+                        help="share rankings through a persistent memo store")
+    parser.add_argument("--scoring", default="entropy", choices=["entropy", "lookahead", "sampled"],
+                        help="rank guesses by one-ply, two-ply or sampled entropy")
+    parser.add_argument("--prefilter", action="store_true",
+                        help="with --lockstep, prefilter guesses by letter counts and report "
+                             "how often the best guess is dropped")
+    parser.add_argument("--no-book", action="store_true",
+                        help="don't play the first two moves from the opening book")
+    parser.add_argument("--endgame-threshold", type=int, default=ENDGAME_THRESHOLD,
+                        help="candidate count at or below which the endgame solver picks the "
+                             "guess, 0 turns it off")
+    args = parser.parse_args()
+
+    guesses = get_vocabulary(args.guesses)
+    answers = get_vocabulary(args.answers)
+    if args.lockstep:
+        games, elapsed = run_lockstep(guesses, answers, args.memo_store, args.scoring,
+                                      args.prefilter, not args.no_book, args.endgame_threshold)
+    else:
+        games, elapsed = run_benchmark(guesses, answers, args.workers, args.chunksize,
+                                       args.memo_store, args.decision_tree, args.scoring,
+                                       not args.no_book, args.endgame_threshold)
+    print_summary(summarize(games, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# ------------------------------------------------------------------------------
+# catalog.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Named word lists over one shared lexicon.
+
+Every distinct word is stored once, in word_data's lexicon, and gets its
+position there as its catalog id. A named list (words, api, answers, or one
+added at runtime) is just an array of catalog ids, and can be had as a
+boolean mask over the lexicon, so unions, intersections and differences of
+lists are numpy mask operations instead of set building.
+
+The lexicon starts with the allowed guesses in source order, so catalog ids
+of the allowed guesses and answers are also their word_registry ids.
+
+Word lists come straight from word_data and don't import numpy, ids and
+masks import it on first use.
+"""
+
+# Python imports
+if __name__ == "src.catalog":
+    from src import word_data
+else:
+    import word_data
+
+# Shared catalog, built by get_catalog
+_catalog = None
+
+
+class DictionaryCatalog:
+
+    def __init__(self, lexicon, lists):
+        # lexicon: id -> word, lists: name -> array of ids into it
+        self.words = lexicon
+        self._ids = None
+        self._lists = dict(lists)
+        self._word_lists = dict()
+        self._masks = dict()
+
+    @classmethod
+    def from_word_data(cls):
+        lists = {name: None for name in word_data.list_names() if name != word_data.LEXICON}
+        return cls(word_data.word_list(word_data.LEXICON), lists)
+
+    @property
+    def names(self):
+        return list(self._lists)
+
+    @property
+    def ids(self):
+        """word -> catalog id"""
+        if self._ids is None:
+            self._ids = {word: i for i, word in enumerate(self.words)}
+        return self._ids
+
+    def _check(self, name):
+        if name not in self._lists:
+            raise ValueError(f"unknown word list '{name}', expected one of {sorted(self._lists)}")
+
+    def word_list(self, name):
+        """The list's words, in list order, shared between callers."""
+        self._check(name)
+        if self._lists[name] is None:
+            # Bundled lists are decoded by word_data
+            return word_data.word_list(name)
+        if name not in self._word_lists:
+            self._word_lists[name] = self.words_of(self._lists[name])
+        return self._word_lists[name]
+
+    def id_array(self, name):
+        """Catalog ids of the list's words, in list order."""
+        self._check(name)
+        if self._lists[name] is None:
+            self._lists[name] = word_data.word_ids(name)
+        return self._lists[name]
+
+    def mask(self, name):
+        """Read-only boolean mask over the lexicon, True for the list's words."""
+        import numpy as np
+        mask = self._masks.get(name)
+        # Masks built before the lexicon grew are rebuilt
+        if mask is None or len(mask) != len(self.words):
+            mask = np.zeros(len(self.words), dtype=bool)
+            mask[self.id_array(name)] = True
+            mask.flags.writeable = False
+            self._masks[name] = mask
+        return mask
+
+    def union(self, *names):
+        """Sorted catalog ids in any of the lists."""
+        import numpy as np
+        return np.flatnonzero(np.logical_or.reduce([self.mask(name) for name in names]))
+
+    def intersection(self, *names):
+        """Sorted catalog ids in all of the lists."""
+        import numpy as np
+        return np.flatnonzero(np.logical_and.reduce([self.mask(name) for name in names]))
+
+    def difference(self, name, *others):
+        """Sorted catalog ids in the first list but none of the others."""
+        import numpy as np
+        mask = self.mask(name)
+        if others:
+            mask = mask & ~np.logical_or.reduce([self.mask(other) for other in others])
+        return np.flatnonzero(mask)
+
+    def words_of(self, ids):
+        return [self.words[i] for i in ids]
+
+    def ids_of(self, words):
+        """Catalog ids of words, raises ValueError for words not in the lexicon."""
+        import numpy as np
+        missing = [word for word in words if word not in self.ids]
+        if missing:
+            raise ValueError(f"{len(missing)} words are not in the catalog, e.g. '{missing[0]}'")
+        return np.array([self.ids[word] for word in words], dtype=np.uint32)
+
+    def add_list(self, name, words):
+        """
+        Add a named list. Words the lexicon doesn't have yet are appended to
+        it, in memory only. Returns the list's catalog ids.
+        """
+        if name in self._lists:
+            raise ValueError(f"word list '{name}' already exists")
+        words = list(words)
+        new_words = [word for word in dict.fromkeys(words) if word not in self.ids]
+        if new_words:
+            if self.words is word_data.word_list(word_data.LEXICON):
+                # Don't grow word_data's shared copy of the lexicon
+                self.words = list(self.words)
+            for word in new_words:
+                self.ids[word] = len(self.words)
+                self.words.append(word)
+        self._lists[name] = self.ids_of(words)
+        self._word_lists[name] = words
+        return self._lists[name]
+
+
+def get_catalog() -> DictionaryCatalog:
+    global _catalog
+    if _catalog is None:
+        _catalog = DictionaryCatalog.from_word_data()
+    return _catalog
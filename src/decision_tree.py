@@ -0,0 +1,179 @@
+# ------------------------------------------------------------------------------
+# decision_tree.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Compiled decision tree of a solver strategy.
+
+For a fixed dictionary the strategy's guesses are deterministic, so the whole
+game tree can be compiled once: node 0 is the opening guess and
+children[node, pattern] is the node reached after seeing pattern, or -1.
+At play time the next guess is a walk down the tree, with no scoring.
+
+File layout: a 64-byte header (magic, version, node count, index dtype
+size, word-list hash, strategy hash) followed by the guess id of every node
+and the (nodes, 243) children array.
+
+Usage:
+    python decision_tree.py --guesses=words --answers=answers
+"""
+
+# Python imports
+import argparse
+import hashlib
+import os
+import struct
+import numpy as np
+if __name__ == "src.decision_tree":
+    from src.wordle_ai import WordleAI
+    from src.pattern_codec import ALL_GREEN, GUESS_LIMIT, NUM_PATTERNS
+    from src.pattern_table import PatternTable, TABLE_DIR
+    from src.opening_book import OpeningBook
+    from src.vocabularies import get_vocabulary, DEFAULT_GUESSES, DEFAULT_ANSWERS
+else:
+    from wordle_ai import WordleAI
+    from pattern_codec import ALL_GREEN, GUESS_LIMIT, NUM_PATTERNS
+    from pattern_table import PatternTable, TABLE_DIR
+    from opening_book import OpeningBook
+    from vocabularies import get_vocabulary, DEFAULT_GUESSES, DEFAULT_ANSWERS
+
+MAGIC = b"WTRE"
+FORMAT_VERSION = 1
+
+# magic, format version, index size, nodes, word-list sha1, strategy sha1
+_HEADER = struct.Struct("<4sHHQ20s20s")
+HEADER_SIZE = 64
+
+
+def _strategy_hash(ai):
+    return hashlib.sha1(ai.get_strategy().encode("ascii")).digest()
+
+
+def tree_path(ai, directory=TABLE_DIR):
+    digest = hashlib.sha1(ai.pattern_table.word_list_hash + _strategy_hash(ai)).hexdigest()
+    return os.path.join(directory, f"decision_tree_{digest[:12]}.bin")
+
+
+class DecisionTree:
+
+    def __init__(self, guesses, children, pattern_table):
+        # guess id played at each node
+        self.guesses = guesses
+        # children[node, pattern] -> node, -1 if the pattern can't happen
+        self.children = children
+        self.pattern_table = pattern_table
+
+    @classmethod
+    def compile(cls, ai, guess_limit=GUESS_LIMIT):
+        """Expand every reachable candidate set with ai.next_guess."""
+        table = ai.pattern_table
+        guesses = []
+        children = []
+        # Nodes are numbered breadth first as they're discovered
+        pending = [([], np.arange(len(table.answers)))]
+        node = 0
+        while node < len(pending):
+            history, candidate_ids = pending[node]
+            pending[node] = None
+            guess = ai.next_guess(history, candidate_ids)
+            guess_id = table.guess_ids[guess]
+            node_children = np.full(NUM_PATTERNS, -1, dtype=np.int64)
+
+            patterns = table.table[guess_id][candidate_ids]
+            if len(history) + 1 < guess_limit:
+                for pattern in np.unique(patterns):
+                    if pattern == ALL_GREEN:
+                        continue
+                    node_children[pattern] = len(pending)
+                    pending.append((history + [(guess, int(pattern))],
+                                    candidate_ids[patterns == pattern]))
+
+            guesses.append(guess_id)
+            children.append(node_children)
+            node += 1
+
+        index = np.int16 if len(guesses) < np.iinfo(np.int16).max else np.int32
+        return cls(np.array(guesses, dtype=np.int32), np.array(children, dtype=index), table)
+
+    def save(self, path, ai):
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, self.children.itemsize, len(self.guesses),
+                              self.pattern_table.word_list_hash, _strategy_hash(ai))
+        with open(path, "wb") as outfile:
+            outfile.write(header.ljust(HEADER_SIZE, b"\0"))
+            outfile.write(self.guesses.tobytes())
+            outfile.write(self.children.tobytes())
+
+    @classmethod
+    def load(cls, path, ai):
+        """Raises ValueError if the tree was compiled for another table or strategy."""
+        with open(path, "rb") as infile:
+            header = infile.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{path}: truncated decision tree header")
+        magic, version, itemsize, nodes, word_hash, strategy = _HEADER.unpack_from(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path}: not a version {FORMAT_VERSION} decision tree")
+        if word_hash != ai.pattern_table.word_list_hash or strategy != _strategy_hash(ai):
+            raise ValueError(f"{path}: stale decision tree")
+
+        index = np.int16 if itemsize == 2 else np.int32
+        guesses = np.memmap(path, dtype=np.int32, mode="r", offset=HEADER_SIZE, shape=(nodes,))
+        children = np.memmap(path, dtype=index, mode="r", offset=HEADER_SIZE + guesses.nbytes,
+                             shape=(nodes, NUM_PATTERNS))
+        return cls(guesses, children, ai.pattern_table)
+
+    @classmethod
+    def load_or_compile(cls, ai, path=None):
+        if path is None:
+            path = tree_path(ai)
+        try:
+            return cls.load(path, ai)
+        except (OSError, ValueError):
+            pass
+        tree = cls.compile(ai)
+        tree.save_atomic(path, ai)
+        return cls.load(path, ai)
+
+    def save_atomic(self, path, ai):
+        # Readers never see a half written tree
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        self.save(tmp_path, ai)
+        os.replace(tmp_path, path)
+
+    def lookup(self, history):
+        """
+        Walk the tree along history, a list of (guess, pattern) pairs, and
+        return the next guess, or None if history left the tree.
+        """
+        guesses = self.pattern_table.guesses
+        node = 0
+        for guess, pattern in history:
+            if guesses[self.guesses[node]] != guess:
+                return None
+            node = self.children[node, pattern]
+            if node < 0:
+                return None
+        return guesses[self.guesses[node]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the solver's decision tree")
+    parser.add_argument("--guesses", default=DEFAULT_GUESSES)
+    parser.add_argument("--answers", default=DEFAULT_ANSWERS)
+    args = parser.parse_args()
+
+    answers = get_vocabulary(args.answers)
+    ai = WordleAI(answers, PatternTable.load(get_vocabulary(args.guesses), answers))
+    ai.get_frequencies()
+    ai.opening_book = OpeningBook.load_or_build(ai)
+    path = tree_path(ai)
+    tree = DecisionTree.compile(ai)
+    tree.save_atomic(path, ai)
+    print(f"Compiled {len(tree.guesses)} nodes to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# ------------------------------------------------------------------------------
+# endgame.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Exact endgame search for small candidate sets.
+
+Finds the guess minimizing the expected number of guesses left to solve,
+assuming every candidate is equally likely. The cost of a candidate set S is
+the total guesses over its answers:
+    cost(S) = min over guesses g of |S| + sum of cost(S_p) for each pattern
+              p != ggggg that g splits S into
+Costs are memoized by candidate set. Every answer but one needs at least two
+more guesses, so 2|S| - 1 is a lower bound used to prune branches that can't
+beat the best guess found so far.
+
+Searches are bounded by a node budget, so whether one finishes doesn't
+depend on machine load. Each memoized set records the nodes its search
+expanded, memo hits included, and a memo hit is charged that many again:
+a search uses the same share of the budget whatever earlier searches left
+in the memo. A wall-clock time budget can be set as well, for interactive
+use only, since it makes the result depend on timing.
+"""
+
+# Python imports
+import time
+import numpy as np
+if __name__ == "src.endgame":
+    from src.pattern_codec import ALL_GREEN
+else:
+    from pattern_codec import ALL_GREEN
+
+DEFAULT_MAX_GUESSES = 40
+# Nodes expanded per best_guess before giving up
+DEFAULT_NODE_BUDGET = 5000
+# Memoized candidate sets kept before the memo is cleared
+MEMO_SIZE = 200000
+
+
+class SearchTimeout(Exception):
+    # Raised when the node or time budget runs out
+    pass
+
+
+def _lower_bound(size):
+    return 2 * size - 1
+
+
+class EndgameSolver:
+
+    def __init__(self, pattern_table, max_guesses=DEFAULT_MAX_GUESSES,
+                 node_budget=DEFAULT_NODE_BUDGET, time_budget=None):
+        self.pattern_table = pattern_table
+        # Non-candidate guesses tried at each node, besides the candidates
+        self.max_guesses = max_guesses
+        self.node_budget = node_budget
+        # Seconds, None for no wall-clock limit
+        self.time_budget = time_budget
+        # Candidate set -> (cost, guess id, nodes expanded)
+        self.memo = dict()
+        self._nodes = 0
+        self._deadline = None
+
+    def best_guess(self, candidate_ids):
+        """
+        Return (guess id, expected guesses) for the candidates, or None if
+        the search didn't finish within the node or time budget.
+        """
+        candidate_ids = np.sort(np.asarray(candidate_ids))
+        self._nodes = 0
+        self._deadline = None
+        if self.time_budget is not None:
+            self._deadline = time.perf_counter() + self.time_budget
+        if len(self.memo) > MEMO_SIZE:
+            self.memo.clear()
+        try:
+            cost, guess_id, _ = self._solve(candidate_ids)
+        except SearchTimeout:
+            return None
+        if guess_id is None:
+            return None
+        return guess_id, cost / len(candidate_ids)
+
+    def _useful_guesses(self, candidate_ids):
+        """Guess ids worth trying: guessable candidates, then the best splitters."""
+        table = self.pattern_table
+        own = table.answer_guess_ids[candidate_ids]
+        own = own[own >= 0]
+
+        rows = table.table[:, candidate_ids]
+        patterns = np.sort(rows, axis=1)
+        parts = 1 + np.count_nonzero(np.diff(patterns, axis=1), axis=1)
+        parts[own] = 0
+        order = np.argsort(-parts, kind="stable")[:self.max_guesses]
+        others = order[parts[order] > 1]
+        # Guesses with identical rows split the candidates identically
+        _, first = np.unique(rows[others], axis=0, return_index=True)
+        return np.concatenate([own, others[np.sort(first)]])
+
+    def _solve(self, candidate_ids):
+        size = len(candidate_ids)
+        table = self.pattern_table
+        if size == 1:
+            guess_id = table.answer_guess_ids[candidate_ids[0]]
+            if guess_id >= 0:
+                return 1, guess_id, 0
+        key = candidate_ids.tobytes()
+        if key in self.memo:
+            self._charge(self.memo[key][2])
+            return self.memo[key]
+        self._charge(1)
+        start = self._nodes
+
+        best_cost = float("inf")
+        best_guess = None
+        for guess_id in self._useful_guesses(candidate_ids):
+            row = table.table[guess_id][candidate_ids]
+            values, counts = np.unique(row, return_counts=True)
+            if len(values) == 1 and values[0] != ALL_GREEN:
+                # Learns nothing
+                continue
+            # Smallest parts first, they're cheap and tighten the bound
+            parts = [candidate_ids[row == pattern]
+                     for pattern in values[np.argsort(counts, kind="stable")]
+                     if pattern != ALL_GREEN]
+            bound = sum(_lower_bound(len(part)) for part in parts)
+            cost = size
+            if cost + bound >= best_cost:
+                continue
+            for part in parts:
+                bound -= _lower_bound(len(part))
+                cost += self._solve(part)[0]
+                if cost + bound >= best_cost:
+                    break
+            else:
+                best_cost = cost
+                best_guess = guess_id
+                if best_cost == _lower_bound(size):
+                    break
+
+        self.memo[key] = (best_cost, best_guess, self._nodes - start + 1)
+        return self.memo[key]
+
+    def _charge(self, nodes):
+        self._nodes += nodes
+        if self._nodes > self.node_budget:
+            raise SearchTimeout()
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
@@ -8,12 +8,14 @@
 # ------------------------------------------------------------------------------
 
 # Python libraries
-from wordle_ai import *
-from wordle_api import *
-from wordle_db3 import wordset as wordset3
-from wordle_db2 import wordset as wordset2
-from wordle_api import GameStatus
-from heapq import *
+from states import LetterState, GameStatus
+from vocabularies import get_vocabulary, vocabulary_from_argv, DEFAULT_GUESSES, DEFAULT_ANSWERS
+from pattern_codec import from_string
+from opening_book import OpeningBook
+import time
+
+# Seconds spent choosing recommended words each turn
+TIME_BUDGET = 1.0
 
 
 class InteractiveWordle():
@@ -24,7 +26,30 @@ class InteractiveWordle():
         self.num_guesses = 0
         self.game_state = []
         self.guess_history = []
-        self.ai = WordleAI(wordset.copy())
+        # (guess, pattern) pairs, used to follow the opening book
+        self.history = []
+        # Keep list order so the table and book are shared with other solvers
+        self.answers = wordset if isinstance(wordset, list) else sorted(wordset)
+        self.guesses = get_vocabulary(DEFAULT_GUESSES)
+        # A saved book gives the first guess without numpy or the pattern
+        # table, the ai is loaded once it's needed
+        self.book = OpeningBook.peek(self.guesses, self.answers)
+        self._ai = None
+
+    @property
+    def ai(self):
+        if self._ai is None:
+            self._load_ai()
+        return self._ai
+
+    def _load_ai(self):
+        from wordle_ai import WordleAI
+        from pattern_table import PatternTable
+        self.pattern_table = PatternTable.load(self.guesses, self.answers)
+        self._ai = WordleAI(self.answers, self.pattern_table)
+        self._ai.get_frequencies()
+        if self.book is None:
+            self.book = OpeningBook.load_or_build(self._ai)
 
     def start_game(self):
         print("Game started")
@@ -32,6 +57,7 @@ class InteractiveWordle():
         self.num_guesses = 0
         self.game_state = []
         self.guess_history = []
+        self.history = []
 
     def guess_word(self):
         # NOTE: No error-checking implemented
@@ -46,6 +72,7 @@ class InteractiveWordle():
         self.guess_history += [guess_input]
         self.game_state += self._format_state(
             self.guess_history[-1], result_input)
+        self.history += [(guess_input, from_string(result_input))]
 
         self.ai.prune_words_v2(self.game_state)
 
@@ -67,30 +94,25 @@ class InteractiveWordle():
         return game_state
 
     def _print_recommended_words(self):
-        
-        entropy_heap = []
-        print(f"Recommended words ({len(self.ai.possible_words)} remaining):")
-        if self.num_guesses > 0:
-
-            entropy_heap = self._get_entropy_heap()
-            i = 0
-            sizeof_heap = len(entropy_heap)
-            while i < 10 and i < sizeof_heap:
-                # Print 10 words with largest entropies
-                popped = heappop(entropy_heap)
-                entropy, word = popped
-                print(f"- {word}: {entropy * -1}")
-                i += 1
+        if self.book is None:
+            self._load_ai()
+        # Nothing is pruned before the ai is loaded
+        remaining = self._ai.count_possible_words() if self._ai is not None else len(self.answers)
+        print(f"Recommended words ({remaining} remaining):")
+        book_move = self.book.lookup(self.history)
+        if book_move is not None:
+            print(f"- {book_move} (opening book)")
         else:
-            print("- crane")
-        
+            # Print the 10 best words scored within the time budget
+            selection = self._get_top_words(10)
+            for word, score in selection.ranking:
+                print(f"- {word}: {score}")
+            if not selection.complete:
+                print(f"(scored {selection.evaluated} of {selection.total} words)")
 
-    def _get_entropy_heap(self):
-        entropy_heap = []
-        print("calculating entropies...")
-        for word in self.ai.possible_words:
-            heappush(entropy_heap, (-1 * self.ai.calculate_entropy(word), word))
-        return entropy_heap
+    def _get_top_words(self, k):
+        from anytime import select_guesses
+        return select_guesses(self.ai, time.perf_counter() + TIME_BUDGET, k=k)
 
     def end_game(self):
         print("Game over")
@@ -98,7 +120,8 @@ class InteractiveWordle():
 
 
 def main():
-    game = InteractiveWordle(wordset3)
+    # e.g. --answers=api to consider every word the api accepts
+    game = InteractiveWordle(vocabulary_from_argv("answers", DEFAULT_ANSWERS))
     game.start_game()
 
     while game.status is not GameStatus.MAX_GUESSES and game.status is not GameStatus.ANSWER_FOUND:
@@ -0,0 +1,109 @@
+# ------------------------------------------------------------------------------
+# memo_store.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Persistent memo of ranked guesses shared across solver runs.
+
+Backed by SQLite in WAL mode so several solver processes can read and write
+the same file at once. Rows are keyed by (candidate-set fingerprint, scoring
+mode); the mode should identify everything the ranking depends on, such as
+the scoring strategy and the pattern table's word-list hash. Once the store
+grows past max_entries the least recently used rows are evicted.
+"""
+
+# Python imports
+import json
+import os
+import sqlite3
+import time
+if __name__ == "src.memo_store":
+    from src.word_data import DATA_DIR
+else:
+    from word_data import DATA_DIR
+
+DEFAULT_STORE_PATH = os.path.join(DATA_DIR, "memo.sqlite")
+DEFAULT_MAX_ENTRIES = 1000000
+
+# Fraction of max_entries evicted at once, so eviction isn't run on every put
+_EVICT_FRACTION = 0.1
+# Puts between checks of the store's size
+_SIZE_CHECK_INTERVAL = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    fingerprint TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    k INTEGER NOT NULL,
+    ranking TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (fingerprint, mode)
+);
+CREATE INDEX IF NOT EXISTS memo_last_used ON memo (last_used);
+"""
+
+
+def _fingerprint_key(fingerprint):
+    return ":".join(str(part) for part in fingerprint)
+
+
+class MemoStore:
+
+    def __init__(self, path=DEFAULT_STORE_PATH, max_entries=DEFAULT_MAX_ENTRIES, timeout=30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._connection = None
+        self._pid = None
+        self._puts = 0
+        # Check the size often enough that the store overshoots by at most
+        # one eviction batch
+        self._check_interval = max(1, min(_SIZE_CHECK_INTERVAL, int(max_entries * _EVICT_FRACTION)))
+
+    def _connect(self):
+        # Connections can't be shared with forked worker processes
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, fingerprint, mode, k):
+        """Top k (word, score) pairs stored for the candidate set, or None."""
+        connection = self._connect()
+        key = _fingerprint_key(fingerprint)
+        row = connection.execute("SELECT k, ranking FROM memo WHERE fingerprint = ? AND mode = ?",
+                                 (key, mode)).fetchone()
+        if row is None or row[0] < k:
+            return None
+        connection.execute("UPDATE memo SET last_used = ? WHERE fingerprint = ? AND mode = ?",
+                           (time.time(), key, mode))
+        return [tuple(pair) for pair in json.loads(row[1])[:k]]
+
+    def put(self, fingerprint, mode, k, ranking):
+        connection = self._connect()
+        connection.execute("INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?, ?)",
+                           (_fingerprint_key(fingerprint), mode, k, json.dumps(ranking), time.time()))
+        self._puts += 1
+        if self._puts % self._check_interval == 0 and len(self) > self.max_entries:
+            self._evict()
+
+    def _evict(self):
+        keep = int(self.max_entries * (1 - _EVICT_FRACTION))
+        self._connect().execute(
+            "DELETE FROM memo WHERE rowid IN "
+            "(SELECT rowid FROM memo ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (keep,))
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
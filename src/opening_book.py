@@ -0,0 +1,150 @@
+# ------------------------------------------------------------------------------
+# opening_book.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Precomputed first and second guesses.
+
+The first guess scores every guess against every answer, so it's by far the
+most expensive move. The book stores the best first guess and, for each of
+the 243 patterns it can produce, the best second guess. Books are saved as
+JSON next to the pattern tables, keyed by the strategy of the ai that built
+them: its scoring settings, priors, endgame settings and the table's
+word-list hash. Moves are chosen with ai.next_guess, so the endgame solver
+picks the second guess wherever few enough candidates are left.
+
+Reading a book doesn't need numpy or the pattern table, so solvers can show
+their first guess before loading either.
+"""
+
+# Python imports
+import hashlib
+import json
+import os
+if __name__ == "src.opening_book":
+    from src.pattern_codec import NUM_PATTERNS
+    from src.word_data import DATA_DIR, word_list_hash
+else:
+    from pattern_codec import NUM_PATTERNS
+    from word_data import DATA_DIR, word_list_hash
+
+BOOK_VERSION = 3
+# get_strategy() of a WordleAI with default settings, around the word-list hash
+DEFAULT_STRATEGY = "entropy:{word_list_hash}:endgame=20/5000"
+
+
+def book_path(ai, directory=DATA_DIR):
+    return _strategy_path(ai.get_strategy(), directory)
+
+
+def _strategy_path(strategy, directory):
+    digest = hashlib.sha1(strategy.encode("ascii")).hexdigest()
+    return os.path.join(directory, f"opening_book_{digest[:12]}.json")
+
+
+def default_strategy(word_list_hash):
+    """get_strategy() of a WordleAI with default settings over the word lists."""
+    return DEFAULT_STRATEGY.format(word_list_hash=word_list_hash.hex()[:12])
+
+
+class OpeningBook:
+
+    def __init__(self, word_list_hash, strategy, first, second):
+        self.word_list_hash = word_list_hash
+        # Strategy of the ai that built the book
+        self.strategy = strategy
+        self.first = first
+        # pattern code -> second guess, only for patterns that can occur
+        self.second = second
+
+    @classmethod
+    def build(cls, ai):
+        """Play ai.next_guess from the full answer list for two moves."""
+        import numpy as np
+        table = ai.pattern_table
+        answer_ids = np.arange(len(table.answers))
+        # Search instead of answering from a book or tree
+        saved = ai.opening_book, ai.decision_tree
+        ai.opening_book = ai.decision_tree = None
+        try:
+            first = ai.next_guess([], answer_ids)
+            second = dict()
+            row = table.table[table.guess_ids[first]]
+            for pattern in range(NUM_PATTERNS):
+                candidate_ids = answer_ids[row == pattern]
+                if len(candidate_ids) > 0:
+                    second[pattern] = ai.next_guess([(first, pattern)], candidate_ids)
+        finally:
+            ai.opening_book, ai.decision_tree = saved
+        return cls(table.word_list_hash, ai.get_strategy(), first, second)
+
+    def save(self, path):
+        data = {
+            "version": BOOK_VERSION,
+            "word_list_hash": self.word_list_hash.hex(),
+            "strategy": self.strategy,
+            "first": self.first,
+            "second": {str(pattern): word for pattern, word in self.second.items()},
+        }
+        with open(path, "w") as outfile:
+            json.dump(data, outfile)
+
+    @classmethod
+    def load(cls, path, ai):
+        """
+        Raises ValueError if the book was built for other word lists or
+        with another strategy than the ai's.
+        """
+        return cls._load(path, ai.pattern_table.word_list_hash, ai.get_strategy())
+
+    @classmethod
+    def _load(cls, path, word_list_hash, strategy):
+        with open(path, "r") as infile:
+            data = json.load(infile)
+        if (data.get("version") != BOOK_VERSION or data.get("word_list_hash") != word_list_hash.hex()
+                or data.get("strategy") != strategy):
+            raise ValueError(f"{path}: stale opening book")
+        second = {int(pattern): word for pattern, word in data["second"].items()}
+        return cls(word_list_hash, strategy, data["first"], second)
+
+    @classmethod
+    def peek(cls, guesses, answers, directory=DATA_DIR):
+        """
+        The saved book a WordleAI with default settings would use for the
+        word lists, or None if there isn't a current one, without loading
+        the pattern table.
+        """
+        word_hash = word_list_hash(guesses, answers)
+        strategy = default_strategy(word_hash)
+        try:
+            return cls._load(_strategy_path(strategy, directory), word_hash, strategy)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def load_or_build(cls, ai, path=None):
+        if path is None:
+            path = book_path(ai)
+        try:
+            return cls.load(path, ai)
+        except (OSError, ValueError, KeyError):
+            pass
+        book = cls.build(ai)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        book.save(tmp_path)
+        os.replace(tmp_path, path)
+        return book
+
+    def lookup(self, history):
+        """
+        Book move for a history of (guess, pattern) pairs, or None once the
+        game has left the book.
+        """
+        if len(history) == 0:
+            return self.first
+        if len(history) == 1 and history[0][0] == self.first:
+            return self.second.get(history[0][1])
+        return None
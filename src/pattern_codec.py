@@ -0,0 +1,97 @@
+# ------------------------------------------------------------------------------
+# pattern_codec.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Compact encoding of a guess's feedback as a single byte.
+
+Each position holds a LetterState value (EMPTY = 0, YELLOW = 1, GREEN = 2)
+and the five positions are read as a base-3 number with the first letter as
+the most significant digit, so every pattern fits in 0..242:
+    eeeee -> 0, eeeey -> 1, ggggg -> 242
+"""
+
+__all__ = ["WORD_LENGTH", "NUM_PATTERNS", "ALL_GREEN", "GUESS_LIMIT", "POWERS", "DECODE_TABLE", "encode", "decode",
+           "encode_array", "from_string", "to_string", "from_game_state", "from_api_response"]
+
+WORD_LENGTH = 5
+NUM_PATTERNS = 3 ** WORD_LENGTH
+ALL_GREEN = NUM_PATTERNS - 1
+# Simulated games and compiled trees give up after this many guesses
+GUESS_LIMIT = 20
+
+_STATE_CHARS = "eyg"
+_CHAR_STATES = {c: i for i, c in enumerate(_STATE_CHARS)}
+
+
+def _tables():
+    # POWERS and DECODE_TABLE are numpy arrays, built on first use so the
+    # scalar helpers don't need numpy
+    if "POWERS" not in globals():
+        import numpy as np
+        powers = np.array([3 ** (WORD_LENGTH - 1 - i) for i in range(WORD_LENGTH)], dtype=np.uint8)
+        # DECODE_TABLE[code] is the (5,) array of states for that code
+        decode_table = ((np.arange(NUM_PATTERNS)[:, None] // powers) % 3).astype(np.uint8)
+        globals().update(POWERS=powers, DECODE_TABLE=decode_table)
+    return globals()["POWERS"], globals()["DECODE_TABLE"]
+
+
+def __getattr__(name):
+    if name in ("POWERS", "DECODE_TABLE"):
+        return _tables()[name == "DECODE_TABLE"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _digits(code):
+    states = []
+    code = int(code)
+    for _ in range(WORD_LENGTH):
+        code, state = divmod(code, 3)
+        states.append(state)
+    return states[::-1]
+
+
+def _state_value(state):
+    # Accept LetterState members as well as raw ints from the API
+    return getattr(state, "value", state)
+
+
+def encode(states) -> int:
+    code = 0
+    for state in states:
+        code = code * 3 + _state_value(state)
+    return code
+
+
+def decode(code):
+    return tuple(_digits(code))
+
+
+def encode_array(states):
+    """Encode an (..., 5) array of state values into uint8 codes."""
+    import numpy as np
+    powers, _ = _tables()
+    return (np.asarray(states, dtype=np.uint8) * powers).sum(axis=-1, dtype=np.uint8)
+
+
+def from_string(result) -> int:
+    """Encode a result string such as 'gyeee' (g=green, y=yellow, e=empty)."""
+    return encode(_CHAR_STATES[c] for c in result.lower())
+
+
+def to_string(code) -> str:
+    return "".join(_STATE_CHARS[state] for state in _digits(code))
+
+
+def from_game_state(guess) -> int:
+    """Encode one guess from a game_state: a list of letter/state/position dicts."""
+    ordered = sorted(guess, key=lambda letter: letter["position"])
+    return encode(letter["state"] for letter in ordered)
+
+
+def from_api_response(response) -> int:
+    """Encode a WordleAPI guess response, raw (int states) or formatted."""
+    return encode(letter["state"] for letter in response[-WORD_LENGTH:])
@@ -0,0 +1,246 @@
+# ------------------------------------------------------------------------------
+# pattern_table.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Vectorized builder for the guess x answer feedback table.
+
+table[g, a] holds the feedback pattern produced when guesses[g] is played
+against answers[a]. Letters are scored the same way WordleGame.guess does it:
+greens are matched first, then a non-green letter is yellow if the answer has
+that letter at any position that was not matched green. Yellows do not consume
+letters, so repeated letters in a guess can all be marked yellow.
+
+Patterns are stored as uint8 base-3 codes, see pattern_codec.
+
+On disk a table is a fixed-size header followed by the raw row-major uint8
+matrix. The header records the format and encoding versions, word length,
+dimensions and a hash of the word lists, so a table is opened read-only with
+np.memmap and rejected if it was built from a different dictionary.
+
+Guesses and answers are separate vocabularies: a table over the 12972
+allowed guesses and the 2315 possible answers is ~6x smaller than the square
+table over all words. PatternTable pairs a table with id mappings for both
+axes.
+"""
+
+# Python imports
+import os
+import struct
+import numpy as np
+if __name__ == "src.pattern_table":
+    from src.pattern_codec import NUM_PATTERNS, POWERS, WORD_LENGTH
+    from src.word_data import DATA_DIR, word_list_hash
+else:
+    from pattern_codec import NUM_PATTERNS, POWERS, WORD_LENGTH
+    from word_data import DATA_DIR, word_list_hash
+
+TABLE_DIR = DATA_DIR
+
+MAGIC = b"WPAT"
+FORMAT_VERSION = 1
+ENCODING_VERSION = 1    # base-3 codes from pattern_codec
+
+# magic, format version, encoding version, word length, rows, cols, sha1
+_HEADER = struct.Struct("<4sHHHxxQQ20s")
+HEADER_SIZE = 64
+
+# Default working memory for a single block of rows, in bytes
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Scratch bytes per (guess, answer) pair: green/yellow masks, states and
+# the temporaries created while comparing letters
+_BYTES_PER_PAIR = 24
+
+
+# Distinct uint8 letter codes. Characters outside a-z, like the "(" in the
+# api word "no(a)", get codes of 26 and up
+LETTER_CODES = 256
+
+
+def words_to_array(words) -> np.ndarray:
+    """Return an (n, 5) uint8 array of letter codes (a=0 .. z=25)."""
+    joined = "".join(words).encode("ascii")
+    letters = np.frombuffer(joined, dtype=np.uint8).reshape(-1, WORD_LENGTH)
+    return letters - ord("a")
+
+
+def _block_rows(num_answers, memory_budget):
+    return max(1, int(memory_budget // max(1, num_answers * _BYTES_PER_PAIR)))
+
+
+def _score_block(guess_block, answer_letters):
+    """Return green and yellow masks of shape (rows, num_answers, 5)."""
+    guesses = guess_block[:, None, :]
+    answers = answer_letters[None, :, :]
+    green = guesses == answers
+    yellow = np.zeros(green.shape, dtype=bool)
+    for j in range(WORD_LENGTH):
+        # Answer letter j is still available to mark yellows if it wasn't green
+        available = ~green[:, :, j]
+        answer_j = answers[:, :, j]
+        for i in range(WORD_LENGTH):
+            yellow[:, :, i] |= (guesses[:, :, i] == answer_j) & available
+    yellow &= ~green
+    return green, yellow
+
+
+def build_pattern_table(guesses, answers=None, memory_budget=DEFAULT_MEMORY_BUDGET, out=None):
+    """
+    Build the feedback table for every (guess, answer) pair.
+
+    Rows are processed in blocks so the scratch arrays stay within
+    memory_budget bytes. If answers is None the table is square over guesses.
+    out may be a preallocated (e.g. memory-mapped) uint8 array to fill.
+    """
+    if answers is None:
+        answers = guesses
+    guess_letters = words_to_array(guesses)
+    answer_letters = words_to_array(answers)
+
+    table = out
+    if table is None:
+        table = np.empty((len(guess_letters), len(answer_letters)), dtype=np.uint8)
+    rows = _block_rows(len(answer_letters), memory_budget)
+    for start in range(0, len(guess_letters), rows):
+        stop = min(start + rows, len(guess_letters))
+        green, yellow = _score_block(guess_letters[start:stop], answer_letters)
+        # LetterState values: EMPTY = 0, YELLOW = 1, GREEN = 2
+        states = green.astype(np.uint8) * 2 + yellow
+        table[start:stop] = (states * POWERS).sum(axis=-1, dtype=np.uint8)
+    return table
+
+
+def pattern_counts(table, guess_ids, answer_ids, weights=None):
+    """
+    Histogram of pattern codes for each guess over the given answers.
+
+    Returns a (len(guess_ids), NUM_PATTERNS) array. With weights, each answer
+    contributes its weight instead of 1.
+    """
+    rows = np.asarray(table[guess_ids][:, answer_ids], dtype=np.int64)
+    # Offset each row into its own range of codes so one bincount does them all
+    rows += np.arange(len(rows))[:, None] * NUM_PATTERNS
+    if weights is not None:
+        weights = np.broadcast_to(weights, rows.shape).ravel()
+    counts = np.bincount(rows.ravel(), weights=weights, minlength=len(rows) * NUM_PATTERNS)
+    return counts.reshape(len(rows), NUM_PATTERNS)
+
+
+def entropy_from_counts(counts) -> np.ndarray:
+    """Shannon entropy in bits of each row of a pattern histogram."""
+    totals = counts.sum(axis=-1, keepdims=True)
+    probs = np.divide(counts, totals, out=np.zeros(counts.shape), where=totals > 0)
+    logs = np.log2(probs, out=np.zeros(probs.shape), where=probs > 0)
+    return -(probs * logs).sum(axis=-1)
+
+
+def _pack_header(guesses, answers):
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, ENCODING_VERSION, WORD_LENGTH,
+                          len(guesses), len(answers), word_list_hash(guesses, answers))
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def save_pattern_table(path, table, guesses, answers=None):
+    if answers is None:
+        answers = guesses
+    if table.shape != (len(guesses), len(answers)):
+        raise ValueError(f"table shape {table.shape} does not match the word lists")
+    with open(path, "wb") as outfile:
+        outfile.write(_pack_header(guesses, answers))
+        outfile.write(np.ascontiguousarray(table, dtype=np.uint8).tobytes())
+
+
+def load_pattern_table(path, guesses, answers=None):
+    """
+    Memory-map a saved table read-only.
+
+    Raises ValueError if the file isn't a pattern table or was built from
+    different word lists, encoding or word length.
+    """
+    if answers is None:
+        answers = guesses
+    with open(path, "rb") as infile:
+        header = infile.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{path}: truncated pattern table header")
+
+    magic, version, encoding, length, rows, cols, digest = _HEADER.unpack_from(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path}: not a version {FORMAT_VERSION} pattern table")
+    if encoding != ENCODING_VERSION or length != WORD_LENGTH:
+        raise ValueError(f"{path}: built with encoding {encoding}, word length {length}")
+    if (rows, cols) != (len(guesses), len(answers)) or digest != word_list_hash(guesses, answers):
+        raise ValueError(f"{path}: stale pattern table, built from a different word list")
+    if os.path.getsize(path) != HEADER_SIZE + rows * cols:
+        raise ValueError(f"{path}: truncated pattern table")
+
+    return np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=(rows, cols))
+
+
+def table_path(guesses, answers=None, directory=TABLE_DIR):
+    """Default file for a pair of vocabularies, named by their hash."""
+    return os.path.join(directory, f"pat_table_{word_list_hash(guesses, answers).hex()[:12]}.bin")
+
+
+def load_or_build_pattern_table(path, guesses, answers=None, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """Load the table at path, rebuilding it if it's missing or stale."""
+    if answers is None:
+        answers = guesses
+    try:
+        return load_pattern_table(path, guesses, answers)
+    except (OSError, ValueError):
+        pass
+
+    # Build straight into a temporary file, then swap it in so concurrent
+    # readers never see a partially written table
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as outfile:
+        outfile.write(_pack_header(guesses, answers))
+        outfile.truncate(HEADER_SIZE + len(guesses) * len(answers))
+    table = np.memmap(tmp_path, dtype=np.uint8, mode="r+", offset=HEADER_SIZE,
+                      shape=(len(guesses), len(answers)))
+    build_pattern_table(guesses, answers, memory_budget, out=table)
+    table.flush()
+    del table
+    os.replace(tmp_path, path)
+
+    return load_pattern_table(path, guesses, answers)
+
+
+class PatternTable:
+
+    def __init__(self, table, guesses, answers=None, answer_guess_ids=None):
+        if answers is None:
+            answers = guesses
+        self.table = table
+        self.guesses = list(guesses)
+        self.answers = list(answers)
+        self.word_list_hash = word_list_hash(self.guesses, self.answers)
+        self.guess_ids = {word: i for i, word in enumerate(self.guesses)}
+        self.answer_ids = {word: i for i, word in enumerate(self.answers)}
+        # Guess id of each answer, -1 if the answer isn't a valid guess
+        if answer_guess_ids is None:
+            answer_guess_ids = np.array([self.guess_ids.get(word, -1) for word in self.answers],
+                                        dtype=np.int64)
+        self.answer_guess_ids = answer_guess_ids
+
+    @classmethod
+    def load(cls, guesses, answers=None, path=None, memory_budget=DEFAULT_MEMORY_BUDGET):
+        if path is None:
+            path = table_path(guesses, answers)
+        return cls(load_or_build_pattern_table(path, guesses, answers, memory_budget),
+                   guesses, answers)
+
+    @property
+    def shape(self):
+        return self.table.shape
+
+    def row(self, guess):
+        return self.table[self.guess_ids[guess]]
+
+    def pattern(self, guess, answer):
+        return int(self.table[self.guess_ids[guess], self.answer_ids[answer]])
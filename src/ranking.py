@@ -0,0 +1,46 @@
+# ------------------------------------------------------------------------------
+# ranking.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Top-k selection over score vectors. Uses partial selection instead of
+pushing every word into a heap, and breaks ties by the lower word id so
+rankings are deterministic.
+"""
+
+# Python imports
+import numpy as np
+
+
+def top_k_indices(scores, k, ids=None) -> np.ndarray:
+    """
+    Positions of the k highest scores, best first.
+
+    Ties are broken by the lower value in ids (by position if ids is None).
+    """
+    scores = np.asarray(scores)
+    ids = np.arange(len(scores)) if ids is None else np.asarray(ids)
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    if k < len(scores):
+        cutoff = len(scores) - k
+        kth = np.partition(scores, cutoff)[cutoff]
+        above = np.flatnonzero(scores > kth)
+        # Only keep as many of the words tied at the cutoff as are needed
+        tied = np.flatnonzero(scores == kth)
+        tied = tied[np.argsort(ids[tied], kind="stable")][:k - len(above)]
+        chosen = np.concatenate([above, tied])
+    else:
+        chosen = np.arange(len(scores))
+
+    return chosen[np.lexsort((ids[chosen], -scores[chosen]))]
+
+
+def top_k(scores, words, k=10, ids=None):
+    """Return the k best (word, score) pairs, words[i] being scored by scores[i]."""
+    return [(words[i], float(scores[i])) for i in top_k_indices(scores, k, ids)]
@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------------
+# sampling.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Approximate guess entropies from a sample of the candidates.
+
+Candidates are split into strata (e.g. by first letter) and each stratum is
+sampled in proportion to its size, so every part of the word list is
+represented. Each sampled answer is weighted by the number of candidates it
+stands for, and the entropy of the weighted pattern histogram estimates the
+guess's entropy.
+
+Each estimate comes with an error bound: the plug-in estimator's bias,
+(K - 1) / (2 n ln 2) bits for K observed patterns in n samples, plus
+Z_SCORE standard errors of the surprisal.
+"""
+
+# Python imports
+import math
+import numpy as np
+if __name__ == "src.sampling":
+    from src.pattern_table import pattern_counts, entropy_from_counts
+else:
+    from pattern_table import pattern_counts, entropy_from_counts
+
+Z_SCORE = 2.0
+
+
+def stratified_sample(candidate_ids, strata, size, rng):
+    """
+    Sample about size of candidate_ids, proportionally from each stratum,
+    strata[i] being the stratum of candidate_ids[i]. Returns the sampled
+    ids and their weights, which sum to len(candidate_ids).
+    """
+    candidate_ids = np.asarray(candidate_ids)
+    if size >= len(candidate_ids):
+        return candidate_ids, np.ones(len(candidate_ids))
+    labels, inverse, counts = np.unique(strata, return_inverse=True, return_counts=True)
+    # At least one sample from every stratum
+    quotas = np.maximum(1, np.round(counts * size / len(candidate_ids))).astype(np.int64)
+    sample = []
+    weights = []
+    for stratum in range(len(labels)):
+        members = candidate_ids[inverse == stratum]
+        chosen = rng.choice(members, size=min(quotas[stratum], len(members)), replace=False)
+        sample.append(np.sort(chosen))
+        weights.append(np.full(len(chosen), len(members) / len(chosen)))
+    return np.concatenate(sample), np.concatenate(weights)
+
+
+def sampled_entropies(table, candidate_ids, guess_ids, strata, size, seed=0):
+    """
+    Estimated entropy of every guess in guess_ids over the candidates, from
+    a stratified sample of size answers. Returns (estimates, error bounds).
+    """
+    rng = np.random.default_rng(seed)
+    sample_ids, weights = stratified_sample(candidate_ids, strata, size, rng)
+    counts = pattern_counts(table, guess_ids, sample_ids, weights)
+    estimates = entropy_from_counts(counts)
+
+    n = len(sample_ids)
+    probs = counts / counts.sum(axis=1, keepdims=True)
+    logs = np.log2(probs, out=np.zeros(probs.shape), where=probs > 0)
+    variance = np.maximum(0.0, (probs * logs ** 2).sum(axis=1) - estimates ** 2)
+    bias = (np.count_nonzero(counts, axis=1) - 1) / (2 * n * math.log(2))
+    return estimates, bias + Z_SCORE * np.sqrt(variance / n)
@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------
+# shared_table.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Publish a pattern table to worker processes through shared memory.
+
+The parent copies the table and the answer -> guess id array into a single
+multiprocessing.shared_memory segment once. Workers attach to it by name and
+wrap it in a PatternTable without copying. The parent owns the segment: it's
+unlinked when the SharedPatternTable is closed, garbage collected or the
+interpreter exits, and by multiprocessing's resource tracker if the parent
+crashes.
+"""
+
+# Python imports
+from collections import namedtuple
+from multiprocessing import shared_memory
+import weakref
+import numpy as np
+if __name__ == "src.shared_table":
+    from src.pattern_table import PatternTable
+else:
+    from pattern_table import PatternTable
+
+# Everything a worker needs to attach, small enough to pickle to each worker
+SharedTableHandle = namedtuple("SharedTableHandle", ["name", "shape", "guesses", "answers"])
+
+# Segments attached in this process, kept open while their arrays are in use
+_attached = dict()
+
+
+def _release(segment):
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedPatternTable:
+
+    def __init__(self, pattern_table):
+        table = pattern_table.table
+        guess_ids = pattern_table.answer_guess_ids
+        self.segment = shared_memory.SharedMemory(create=True,
+                                                  size=max(1, table.nbytes + guess_ids.nbytes))
+        self._finalizer = weakref.finalize(self, _release, self.segment)
+
+        shared_table, shared_ids = _views(self.segment, table.shape)
+        shared_table[:] = table
+        shared_ids[:] = guess_ids
+        # Drop the views so the segment can be closed
+        del shared_table, shared_ids
+        self.handle = SharedTableHandle(self.segment.name, table.shape,
+                                        pattern_table.guesses, pattern_table.answers)
+
+    def close(self):
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _views(segment, shape):
+    # The int64 ids go first so they stay aligned
+    guess_ids = np.ndarray(shape[1], dtype=np.int64, buffer=segment.buf)
+    table = np.ndarray(shape, dtype=np.uint8, buffer=segment.buf, offset=guess_ids.nbytes)
+    return table, guess_ids
+
+
+def _open_segment(name):
+    try:
+        # Python 3.13+: only the owner should track the segment
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Pool workers share the parent's resource tracker, which already
+        # tracks the segment, so registering it again is harmless
+        return shared_memory.SharedMemory(name=name)
+
+
+def attach(handle) -> PatternTable:
+    """Zero-copy, read-only PatternTable over a published segment."""
+    if handle.name not in _attached:
+        _attached[handle.name] = _open_segment(handle.name)
+    table, guess_ids = _views(_attached[handle.name], handle.shape)
+    table.flags.writeable = False
+    guess_ids.flags.writeable = False
+    return PatternTable(table, handle.guesses, handle.answers, answer_guess_ids=guess_ids)
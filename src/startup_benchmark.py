@@ -0,0 +1,109 @@
+# ------------------------------------------------------------------------------
+# startup_benchmark.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Cold start of the solver entry points.
+
+Each entry point is imported in a fresh interpreter, which then gets the
+first guess the way the solvers do, from the saved opening book. Reports
+the import time, the time to the first guess (interpreter startup
+included), peak RSS and whether numpy or requests were loaded by then.
+
+Usage:
+    python startup_benchmark.py --runs=5 --target=100
+"""
+
+# Python imports
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ENTRY_POINTS = ["terminal_solver", "interactive_solver", "wordle_solver"]
+# Milliseconds from process start to the first guess
+TARGET_MS = 100
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+from opening_book import OpeningBook
+from vocabularies import get_vocabulary, DEFAULT_GUESSES, DEFAULT_ANSWERS
+book = OpeningBook.peek(get_vocabulary(DEFAULT_GUESSES), get_vocabulary(DEFAULT_ANSWERS))
+first = book.first if book is not None else None
+done = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "first_guess": first,
+    "first_guess_ms": (done - start) * 1000,
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    "peak_rss_kb": rss // 1024 if sys.platform == "darwin" else rss,
+    "numpy": "numpy" in sys.modules,
+    "requests": "requests" in sys.modules,
+}}))
+"""
+
+
+def measure(module):
+    """One cold start of module, in a new interpreter."""
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", _PROBE.format(module=module)], cwd=SRC_DIR,
+                            check=True, capture_output=True, text=True).stdout
+    elapsed = time.perf_counter() - start
+    result = json.loads(output)
+    # Everything before the probe started timing: interpreter startup
+    result["startup_ms"] = elapsed * 1000 - result["first_guess_ms"]
+    result["total_ms"] = result["startup_ms"] + result["first_guess_ms"]
+    return result
+
+
+def run_startup_benchmark(modules=ENTRY_POINTS, runs=5):
+    """{module: median of each measurement over runs}"""
+    results = dict()
+    for module in modules:
+        samples = [measure(module) for _ in range(runs)]
+        summary = {key: statistics.median(sample[key] for sample in samples)
+                   for key in ("import_ms", "first_guess_ms", "startup_ms", "total_ms", "peak_rss_kb")}
+        for key in ("first_guess", "numpy", "requests"):
+            summary[key] = samples[0][key]
+        results[module] = summary
+    return results
+
+
+def print_results(results, target=TARGET_MS):
+    for module, result in results.items():
+        status = "ok" if result["total_ms"] <= target else f"over {target} ms"
+        loaded = [name for name in ("numpy", "requests") if result[name]]
+        print(f"{module}: import {result['import_ms']:.1f} ms, "
+              f"first guess '{result['first_guess']}' at {result['total_ms']:.1f} ms "
+              f"(interpreter {result['startup_ms']:.1f} ms), "
+              f"peak RSS {result['peak_rss_kb'] / 1024:.1f} MB, "
+              f"loaded {loaded or 'nothing heavy'} [{status}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start of the solver entry points")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target", type=float, default=TARGET_MS,
+                        help="milliseconds from process start to the first guess")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    args = parser.parse_args()
+    results = run_startup_benchmark(args.modules, args.runs)
+    print_results(results, args.target)
+    if any(result["total_ms"] > args.target for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
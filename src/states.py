@@ -0,0 +1,26 @@
+# ------------------------------------------------------------------------------
+# states.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Letter and game states shared by the games, the api client and the solvers.
+Kept free of heavy imports so local games don't load numpy or requests.
+"""
+
+# Python imports
+from enum import Enum
+
+class LetterState(Enum):
+    EMPTY    = 0
+    YELLOW  = 1
+    GREEN   = 2
+
+class GameStatus(Enum):
+    STARTED         = 1
+    ONGOING         = 2
+    MAX_GUESSES     = 3
+    ANSWER_FOUND    = 4
+    ENDED           = 5
@@ -1,30 +1,53 @@
-import numpy as np
 from wordle_game import WordleGame
-from wordle_api import GameStatus
-from wordle_ai import WordleAI
-from wordle_db import words
-from wordle_db3 import wordset
-import heapq
+from states import GameStatus
 import sys
-import json
+from opening_book import OpeningBook
+from vocabularies import get_vocabulary, vocabulary_from_argv, DEFAULT_GUESSES, DEFAULT_ANSWERS
 
-first_guess = [(-6.19, "tares"), (-6.15, "lares"), (-6.11, "rales"), (-6.10, "rates"), (-6.08, "teras"), (-6.07, "nares"), (-6.06, "soare"), (-6.05, "tales"), (-6.05, "reais"), (-6.03, "tears")]
+def load_ai(guesses, answers):
+  # numpy, the pattern table and the memo store load on first use
+  from wordle_ai import WordleAI
+  from pattern_table import PatternTable
+  from memo_store import MemoStore
+  pat_table = PatternTable.load(guesses, answers)
+  # Rankings persist across runs, --no-memo-store scores everything cold
+  memo_store = None if "--no-memo-store" in sys.argv else MemoStore()
+  ai = WordleAI(answers, pat_table, memo_store)
+  ai.get_frequencies()
+  return ai
 
 def main():
-  pat_table = np.load("pat_table.npy")
-  game = WordleGame(words)
+  # e.g. --guesses=words --answers=answers
+  guesses = vocabulary_from_argv("guesses", DEFAULT_GUESSES)
+  answers = vocabulary_from_argv("answers", DEFAULT_ANSWERS)
+  game = WordleGame(guesses)
   # game.start_game(input("Answer (press enter for random answer): "))
-  ai = WordleAI(words)
-  ai.get_frequencies()
+  # A saved book gives the first guess before the ai is loaded
+  ai = None
+  book = OpeningBook.peek(guesses, answers)
+  if book is None:
+    ai = load_ai(guesses, answers)
+    book = OpeningBook.load_or_build(ai)
+
+  def get_ai():
+    nonlocal ai
+    if ai is None:
+      ai = load_ai(guesses, answers)
+    return ai
+
   tot = 0
-  for answer in wordset[:100]:
-    game = WordleGame(words)
+  for answer in get_vocabulary("answers")[:100]:
+    game = WordleGame(guesses)
 
-    ai.possible_words = set(words)
+    if ai is not None:
+      ai.possible_words = set(answers)
     game.start_game(answer)
+    # (guess, pattern) pairs played so far
+    history = []
     if "--skip" in sys.argv:
-      game.guess("tares")
-      ai.prune_words_v2(game.get_game_state())
+      game.guess(book.first)
+      history.append((book.first, game.get_pattern()))
+      get_ai().prune_by_pattern(get_ai().pattern_table.guess_ids[book.first], game.get_pattern())
 
     while True:
       # print(game)
@@ -35,37 +58,39 @@ def main():
       #   for word in ai.possible_words:
       #     print(f"{word}: {ai.calculate_entropy_v2(word, pat_table):.2f}")
 
-      top_words = []
-      if len(game.get_state()) == 0:
-        top_words = first_guess
+      # The first two moves come from the opening book
+      book_move = book.lookup(history)
+      if book_move is not None:
+        top_words = [(book_move, None)]
       else:
-        for word in ai.possible_words:
-          # heapq.heappush(top_words, (ai.calculate_entropy(word) * -1, word))
-          heapq.heappush(top_words, (ai.calculate_entropy_v2(word, pat_table) * -1, word))
+        top_words = get_ai().rank_guesses()
       
-      # for entropy, word in heapq.nsmallest(10, top_words):
-      #   print(f"{word}: {(entropy * -1):.2f}")
+      # for word, entropy in top_words:
+      #   print(f"{word}: {entropy:.2f}")
 
       guess = ""
       if "--auto" in sys.argv:
-        guess = top_words[0][1]
+        guess = top_words[0][0]
         # print(f"\nGuess: {guess}\n")
       else:
         guess = input("\nGuess: ")
 
+      num_guesses = len(game.get_state())
       if game.guess(guess) != GameStatus.ONGOING:
         break
       
-      if len(game.get_state()) > 0:
-        ai.prune_words_v2(game.get_game_state())
+      # Invalid guesses aren't added to the game state
+      if len(game.get_state()) > num_guesses:
+        history.append((guess, game.get_pattern()))
+        get_ai().prune_by_pattern(get_ai().pattern_table.guess_ids[guess], game.get_pattern())
     
     print(game)
     print(f"Score: {len(game.game_state)}")
     tot += len(game.game_state)
   print(tot/100)
+  print(f"Memo: {get_ai().memo.stats()}")
 # from pattern_table import pattern_table
 if __name__ == "__main__":
-  ai = WordleAI(words)
   # ai.get_state_table()
   # print(np.load("pat_table.npy"))
   # ai.save_indices()
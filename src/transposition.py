@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------------
+# transposition.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Memo of ranked guesses keyed by candidate set.
+
+Many games reach the same candidate set (e.g. after the same two book moves),
+so the ranking for a set is computed once. Sets are fingerprinted with a
+Zobrist-style hash: every word id gets a random 64-bit key and a set is the
+XOR of its keys together with its size.
+"""
+
+# Python imports
+from collections import OrderedDict
+import numpy as np
+
+DEFAULT_MAX_SIZE = 100000
+
+
+def zobrist_keys(num_words, seed=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, np.iinfo(np.uint64).max, size=num_words, dtype=np.uint64,
+                        endpoint=True)
+
+
+def fingerprint(candidate_ids, keys):
+    """Order-independent fingerprint of a set of word ids."""
+    return (len(candidate_ids), int(np.bitwise_xor.reduce(keys[candidate_ids])))
+
+
+class TranspositionTable:
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, k):
+        """Top k (word, score) pairs stored for key, or None."""
+        entry = self.entries.get(key)
+        # A ranking stored with a smaller k can't answer this lookup
+        if entry is None or entry[0] < k:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[1][:k]
+
+    def put(self, key, k, ranking):
+        self.entries[key] = (k, ranking)
+        self.entries.move_to_end(key)
+        # Evict the least recently used entries
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,41 @@
+# ------------------------------------------------------------------------------
+# vocabularies.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Named word lists the solvers can pick guesses and answers from:
+    words   - 12972 allowed guesses from the wordle source
+    api     - 14094 words accepted by the wordle api
+    answers - 2315 possible answers
+All three are read from word_data.bin, through the dictionary catalog, and
+lists added to the catalog are available by name too.
+"""
+
+# Python imports
+import sys
+if __name__ == "src.vocabularies":
+    from src.catalog import get_catalog
+else:
+    from catalog import get_catalog
+
+DEFAULT_GUESSES = "words"
+DEFAULT_ANSWERS = "answers"
+
+
+def get_vocabulary(name):
+    """The named list's words, raises ValueError for unknown names."""
+    return get_catalog().word_list(name)
+
+
+def vocabulary_from_argv(option, default, argv=None):
+    """Return the vocabulary named by --option=NAME on the command line."""
+    if argv is None:
+        argv = sys.argv
+    prefix = f"--{option}="
+    for arg in argv:
+        if arg.startswith(prefix):
+            return get_vocabulary(arg[len(prefix):])
+    return get_vocabulary(default)
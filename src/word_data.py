@@ -0,0 +1,287 @@
+# ------------------------------------------------------------------------------
+# word_data.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Word lists and word frequencies, stored in word_data.bin.
+
+The file is memory mapped on first use, so importing a solver doesn't parse
+any word data. Layout: a header (magic, version, section count), a table of
+sections (name, kind, count, offset), then the sections, each 8-byte
+aligned:
+    lexicon - 14094 distinct words: the allowed guesses in source order,
+              then the rest of the api words, sorted
+    words   - ids of the 12972 allowed guesses from the wordle source
+    api     - ids of the 14094 words accepted by the wordle api, sorted
+    answers - ids of the 2315 possible answers, in source order
+    freqs   - float32 frequency of each of words, aligned to its ids
+    priors  - float64 prior of each of words, see priors, computed with
+              the sigmoid width and centre in priorkey
+The lexicon is the only word section, fixed-width 5-byte ascii records. The
+named lists are uint16 ids into it, so every word is stored once.
+
+The file is built from the text files in word_lists by build_word_data, run
+as "python word_data.py" after editing them:
+    words.txt   - one "word frequency" line per allowed guess
+    api.txt     - one api word per line
+    answers.txt - one answer per line
+
+Nothing here imports numpy until an array is asked for, so word lists and
+their hashes are cheap to get at startup.
+
+Priors squash the frequency ranking through a sigmoid: words are spread
+evenly over width units in order of frequency, and the centre-th most
+frequent word sits at the middle of the sigmoid with a prior of 0.5.
+"""
+
+# Python imports
+import hashlib
+import mmap
+import os
+import struct
+
+# Data files and the caches built from them live next to the modules
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(DATA_DIR, "word_data.bin")
+# Editable sources of the data file
+SOURCE_DIR = os.path.join(DATA_DIR, "word_lists")
+WORD_LENGTH = 5
+
+# Sigmoid width and centre of the default priors
+PRIOR_WIDTH = 10
+PRIOR_CENTRE = 3000
+
+MAGIC = b"WDAT"
+FORMAT_VERSION = 2
+# Word section the id sections index
+LEXICON = "lexicon"
+# magic, format version, number of sections
+_HEADER = struct.Struct("<4sHH")
+# name, kind (w: words, i: uint16 lexicon ids, f: float32, d: float64), count, offset
+_SECTION = struct.Struct("<8s1sxxxIQ")
+
+# Mapped file and its sections, set on first access
+_data = None
+_sections = None
+_word_lists = dict()
+_frequency_map = None
+# (width, centre) -> priors
+_priors = dict()
+
+
+def save_word_data(path, sections):
+    """
+    Write sections, a dict of name -> list of 5 letter words, integer array
+    of ids into the lexicon section, or float array, to path. float64
+    arrays are stored as float64, other floats as float32.
+    """
+    import numpy as np
+    offset = _HEADER.size + len(sections) * _SECTION.size
+    table = []
+    payloads = []
+    for name, values in sections.items():
+        if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+            if len(values) and not 0 <= values.min() <= values.max() <= 0xffff:
+                raise ValueError(f"section '{name}' has ids that don't fit in uint16")
+            kind, payload = b"i", values.astype("<u2").tobytes()
+        elif isinstance(values, np.ndarray) and values.dtype == np.float64:
+            kind, payload = b"d", values.astype("<f8").tobytes()
+        elif isinstance(values, np.ndarray):
+            kind, payload = b"f", values.astype("<f4").tobytes()
+        else:
+            if any(len(word) != WORD_LENGTH or not word.isascii() for word in values):
+                raise ValueError(f"section '{name}' has words that aren't {WORD_LENGTH} ascii characters")
+            kind, payload = b"w", "".join(values).encode("ascii")
+        offset += -offset % 8
+        table.append(_SECTION.pack(name.encode("ascii"), kind, len(values), offset))
+        payloads.append((offset, payload))
+        offset += len(payload)
+
+    with open(path, "wb") as outfile:
+        outfile.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        outfile.write(b"".join(table))
+        for offset, payload in payloads:
+            outfile.write(b"\0" * (offset - outfile.tell()))
+            outfile.write(payload)
+
+
+def word_list_hash(guesses, answers=None) -> bytes:
+    """sha1 identifying a pair of word lists, order included."""
+    if answers is None:
+        answers = guesses
+    digest = hashlib.sha1()
+    digest.update("\n".join(guesses).encode("ascii"))
+    digest.update(b"\0")
+    digest.update("\n".join(answers).encode("ascii"))
+    return digest.digest()
+
+
+def _load():
+    global _data, _sections
+    if _data is None:
+        with open(DATA_PATH, "rb") as infile:
+            data = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{DATA_PATH}: not a version {FORMAT_VERSION} word data file")
+        sections = dict()
+        for i in range(count):
+            name, kind, size, offset = _SECTION.unpack_from(data, _HEADER.size + i * _SECTION.size)
+            sections[name.rstrip(b"\0").decode("ascii")] = (kind, size, offset)
+        _data, _sections = data, sections
+    return _data, _sections
+
+
+def _section(name, kinds):
+    data, sections = _load()
+    if name not in sections or sections[name][0] not in kinds:
+        names = sorted(section for section, (kind, *_) in sections.items() if kind in kinds)
+        raise ValueError(f"unknown word data section '{name}', expected one of {names}")
+    return sections[name]
+
+
+def list_names():
+    """Names of the word lists in the file, the lexicon included."""
+    _, sections = _load()
+    return [name for name, (kind, *_) in sections.items() if kind in b"wi"]
+
+
+def word_ids(name):
+    """Read-only uint16 lexicon ids of an id section's words."""
+    import numpy as np
+    _, size, offset = _section(name, [b"i"])
+    return np.frombuffer(_data, dtype="<u2", count=size, offset=offset)
+
+
+def word_array(name):
+    """(n, 5) array of the list's ascii letters, read-only for word sections."""
+    import numpy as np
+    kind, size, offset = _section(name, [b"w", b"i"])
+    if kind == b"i":
+        return word_array(LEXICON)[word_ids(name)]
+    return np.frombuffer(_data, dtype=np.uint8, count=size * WORD_LENGTH,
+                         offset=offset).reshape(size, WORD_LENGTH)
+
+
+def word_list(name):
+    """The list's words, decoded once and shared between callers."""
+    if name not in _word_lists:
+        kind, size, offset = _section(name, [b"w", b"i"])
+        if kind == b"i":
+            lexicon = word_list(LEXICON)
+            ids = struct.unpack_from(f"<{size}H", _data, offset)
+            _word_lists[name] = [lexicon[i] for i in ids]
+        else:
+            joined = _data[offset:offset + size * WORD_LENGTH].decode("ascii")
+            _word_lists[name] = [joined[i:i + WORD_LENGTH] for i in range(0, len(joined), WORD_LENGTH)]
+    return _word_lists[name]
+
+
+def frequencies():
+    """Read-only float32 frequency of each word in word_list("words")."""
+    import numpy as np
+    _, size, offset = _section("freqs", [b"f"])
+    return np.frombuffer(_data, dtype="<f4", count=size, offset=offset)
+
+
+def frequency_map():
+    """{word: frequency} for word_list("words"), keys in alphabetical order."""
+    global _frequency_map
+    if _frequency_map is None:
+        _frequency_map = dict(sorted(zip(word_list("words"), frequencies().tolist())))
+    return _frequency_map
+
+
+def compute_priors(width=PRIOR_WIDTH, centre=PRIOR_CENTRE, words=None, freqs=None):
+    """
+    float64 prior of each word in words, from its rank in freqs. Defaults
+    to word_list("words") and frequencies().
+    """
+    import numpy as np
+    if words is None:
+        words, freqs = word_list("words"), frequencies()
+    # Least frequent first, ties in alphabetical order
+    by_name = np.argsort(np.array(words))
+    order = by_name[np.argsort(np.asarray(freqs)[by_name], kind="stable")]
+    c = width * (-0.5 + centre / len(words))
+    space = np.linspace(c - width / 2, c + width / 2, len(words))
+    priors = np.empty(len(words))
+    priors[order] = 1 / (1 + np.exp(-space))
+    return priors
+
+
+def priors(width=PRIOR_WIDTH, centre=PRIOR_CENTRE):
+    """
+    Read-only float64 prior of each word in word_list("words"), aligned to
+    its ids.
+    Read from the file if it was saved with the same width and centre,
+    otherwise computed once per (width, centre).
+    """
+    key = (width, centre)
+    if key not in _priors:
+        import numpy as np
+        _, sections = _load()
+        values = None
+        if "priors" in sections and "priorkey" in sections:
+            _, size, offset = _section("priorkey", [b"d"])
+            if np.frombuffer(_data, dtype="<f8", count=size, offset=offset).tolist() == list(key):
+                _, size, offset = _section("priors", [b"d"])
+                values = np.frombuffer(_data, dtype="<f8", count=size, offset=offset)
+        if values is None:
+            values = compute_priors(width, centre)
+            values.flags.writeable = False
+        _priors[key] = values
+    return _priors[key]
+
+
+def _read_lines(path):
+    with open(path, "r", encoding="ascii", newline="\n") as infile:
+        return [line.rstrip("\n") for line in infile]
+
+
+def build_word_data(source_dir=SOURCE_DIR, path=DATA_PATH):
+    """Build the data file at path from the word lists in source_dir."""
+    import numpy as np
+    words = []
+    freqs = []
+    for line in _read_lines(os.path.join(source_dir, "words.txt")):
+        word, frequency = line.split(" ")
+        words.append(word)
+        freqs.append(float(frequency))
+    freqs = np.array(freqs, dtype=np.float32)
+    api = sorted(_read_lines(os.path.join(source_dir, "api.txt")))
+    answers = _read_lines(os.path.join(source_dir, "answers.txt"))
+    for name, values in (("words", words), ("api", api), ("answers", answers)):
+        if len(set(values)) != len(values):
+            raise ValueError(f"{name} has repeated words")
+
+    lexicon = words + sorted((set(api) | set(answers)) - set(words))
+    ids = {word: i for i, word in enumerate(lexicon)}
+    sections = {
+        LEXICON: lexicon,
+        "words": np.array([ids[word] for word in words]),
+        "api": np.array([ids[word] for word in api]),
+        "answers": np.array([ids[word] for word in answers]),
+        "freqs": freqs,
+        "priors": compute_priors(words=words, freqs=freqs),
+        "priorkey": np.array([PRIOR_WIDTH, PRIOR_CENTRE], dtype=np.float64),
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    save_word_data(tmp_path, sections)
+    os.replace(tmp_path, path)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Build word_data.bin from the word lists")
+    parser.add_argument("--source", default=SOURCE_DIR, help="directory of the word list text files")
+    parser.add_argument("--out", default=DATA_PATH)
+    args = parser.parse_args()
+    build_word_data(args.source, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# ------------------------------------------------------------------------------
+# word_registry.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+"""
+Words interned to integer ids.
+
+get_registry() is built once per process from the allowed guesses and the
+answers, so ids follow the wordle source order, and is shared by every
+WordleAI that isn't bound to a pattern table. Other words, including the
+api vocabulary, are interned on first use and keep their ids for the life
+of the process. The catalog's lexicon starts with the same words, so
+registry ids of the allowed guesses and answers are their catalog ids.
+
+WordleAIs bound to a pattern table use the table's answer ids instead.
+get_table_registry() keeps one frozen registry per table word-list hash, so
+those are shared too.
+"""
+
+# Python imports
+if __name__ == "src.word_registry":
+    from src.pattern_table import words_to_array
+    from src.vocabularies import get_vocabulary
+    from src.word_data import word_list_hash
+else:
+    from pattern_table import words_to_array
+    from vocabularies import get_vocabulary
+    from word_data import word_list_hash
+
+# Interned up front. The api vocabulary also has entries that aren't five
+# letters a-z, like "no(a)", so it isn't.
+REGISTRY_VOCABULARIES = ["words", "answers"]
+
+# Shared registry, built by get_registry
+_registry = None
+# Pattern table word-list hash -> frozen registry over the table's answers
+_table_registries = dict()
+
+
+class WordRegistry:
+
+    def __init__(self, words=(), frozen=False):
+        # id -> word and word -> id
+        self.words = []
+        self.ids = dict()
+        self._letters = None
+        self._hash = None
+        self.frozen = False
+        self.add(words)
+        # Frozen registries raise ValueError instead of interning new words
+        self.frozen = frozen
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.ids
+
+    def add(self, words):
+        """Intern words, returns their ids."""
+        ids = []
+        for word in words:
+            if word not in self.ids:
+                if self.frozen:
+                    raise ValueError(f"'{word}' is not in the registry")
+                self.ids[word] = len(self.words)
+                self.words.append(word)
+                self._letters = None
+                self._hash = None
+            ids.append(self.ids[word])
+        return ids
+
+    @property
+    def letters(self):
+        """(n, 5) uint8 letter codes of every word, a = 0."""
+        if self._letters is None:
+            self._letters = words_to_array(self.words)
+        return self._letters
+
+    @property
+    def content_hash(self) -> bytes:
+        if self._hash is None:
+            self._hash = word_list_hash(self.words)
+        return self._hash
+
+
+def get_registry() -> WordRegistry:
+    global _registry
+    if _registry is None:
+        registry = WordRegistry()
+        for name in REGISTRY_VOCABULARIES:
+            registry.add(get_vocabulary(name))
+        _registry = registry
+    return _registry
+
+
+def get_table_registry(pattern_table) -> WordRegistry:
+    """Frozen registry of the table's answers, shared by tables with the same word lists."""
+    key = pattern_table.word_list_hash
+    if key not in _table_registries:
+        _table_registries[key] = WordRegistry(pattern_table.answers, frozen=True)
+    return _table_registries[key]
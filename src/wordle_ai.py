@@ -15,43 +15,202 @@ Possible optimizations:
 """
 
 # Python imports
-from enum import Enum
-from typing import List
 import math
-from wordle_db import words
 # from wordle_db3 import wordset as words
 from string import ascii_lowercase
-from pprint import pprint
-from frequency_map import frequency_map
 import numpy as np
-import itertools
-import json
+if __name__ == "src.wordle_ai":
+    from src import word_data
+    from src.states import LetterState
+    from src.pattern_table import PatternTable, LETTER_CODES, words_to_array, pattern_counts, entropy_from_counts
+    from src.pattern_codec import encode, ALL_GREEN
+    from src.ranking import top_k, top_k_indices
+    from src.anytime import letter_scores
+    from src.sampling import sampled_entropies
+    from src.word_registry import get_registry, get_table_registry
+    from src.catalog import get_catalog
+    from src.transposition import TranspositionTable, fingerprint, zobrist_keys
+    from src.endgame import EndgameSolver, DEFAULT_NODE_BUDGET
+else:
+    import word_data
+    from states import LetterState
+    from pattern_table import PatternTable, LETTER_CODES, words_to_array, pattern_counts, entropy_from_counts
+    from pattern_codec import encode, ALL_GREEN
+    from ranking import top_k, top_k_indices
+    from anytime import letter_scores
+    from sampling import sampled_entropies
+    from word_registry import get_registry, get_table_registry
+    from catalog import get_catalog
+    from transposition import TranspositionTable, fingerprint, zobrist_keys
+    from endgame import EndgameSolver, DEFAULT_NODE_BUDGET
 
-class LetterState(Enum):
-    EMPTY    = 0
-    YELLOW  = 1
-    GREEN   = 2
+# Candidate count at or below which next_guess uses the exact endgame solver
+ENDGAME_THRESHOLD = 20
+
+# One-ply guesses rescored by two-ply entropy in the "lookahead" scoring mode
+LOOKAHEAD_WIDTH = 10
+
+# With the prefilter on, rank_guesses scores about this many table entries
+# exactly, and never fewer than PREFILTER_MIN guesses
+PREFILTER_ENTRIES = 1 << 18
+PREFILTER_MIN = 64
+
+# Candidates sampled per ranking in the "sampled" scoring mode
+SAMPLE_SIZE = 512
+# Sampled rankings are scored exactly if more than this fraction of the
+# guesses could still make the top k within their error bounds
+SAMPLE_FALLBACK = 0.5
+
+# Number of table entries gathered at a time when scoring guesses
+ENTROPY_BLOCK_SIZE = 1 << 22
 
 class WordleAI:
 
-    def __init__(self, wordset: set):
-        with open("word_indices.json", "r") as outfile:
-          self.word_indices = json.load(outfile)
+    def __init__(self, wordset: set, pattern_table: PatternTable = None, memo_store=None):
+        self.pattern_table = pattern_table
+        # Optional persistent MemoStore consulted after the in-process memo
+        self.memo_store = memo_store
+        # "entropy", "lookahead" to rescore the best lookahead_width
+        # guesses by two-ply entropy, or "sampled" to estimate entropies
+        # from sample_size candidates
+        self.scoring_mode = "entropy"
+        self.lookahead_width = LOOKAHEAD_WIDTH
+        self.sample_size = SAMPLE_SIZE
+        self.sample_seed = 0
+        # Only score the guesses letter_scores ranks best exactly. With
+        # prefilter_audit the rest are scored too, to count in
+        # prefilter_stats how often the prefilter drops the best guess
+        self.prefilter = False
+        self.prefilter_audit = False
+        self.prefilter_stats = {"rankings": 0, "dropped": 0}
+        # Optional OpeningBook used by next_guess for the first two moves
+        self.opening_book = None
+        # Optional compiled DecisionTree, answers next_guess without scoring
+        self.decision_tree = None
+        # next_guess searches exactly once this few candidates remain,
+        # None turns the endgame solver off
+        self.endgame_threshold = ENDGAME_THRESHOLD
+        # Nodes the endgame search may expand, and an optional wall-clock
+        # limit in seconds for interactive use. Leave the time budget unset
+        # wherever results are compared or saved, it makes them depend on
+        # machine load
+        self.endgame_nodes = DEFAULT_NODE_BUDGET
+        self.endgame_time_budget = None
+        self.endgame = None
+        # Sigmoid width and centre of the word priors, see get_frequencies
+        self.prior_width = word_data.PRIOR_WIDTH
+        self.prior_centre = word_data.PRIOR_CENTRE
+        self.word_priors = None
+        self.guess_priors = None
+        self._frequencies = None
+        if pattern_table is None:
+            # Words and ids shared with every other WordleAI in the process
+            self.registry = get_registry()
+        else:
+            # Word ids are the table's answer ids, shared with every other
+            # WordleAI on a table with the same word lists
+            self.registry = get_table_registry(pattern_table)
+        self.words = self.registry.words
+        self.word_indices = self.registry.ids
         if wordset is None:
-            wordset = words 
-        self.possible_words = set(wordset)        
+            wordset = word_data.word_list("words")
+        # Word ids index self.words, candidates is a boolean mask over them
+        self.letters = None
+        self.memo = TranspositionTable()
+        self.possible_words = wordset
+        self.initial_candidates = self.candidates.copy()
+
+    @property
+    def possible_words(self):
+        # Materialized lazily from the candidate mask, mutating the returned
+        # set does not change the candidates
+        if self._possible_words is None:
+            self._possible_words = {self.words[i] for i in self.get_candidate_ids()}
+        return self._possible_words
+
+    @possible_words.setter
+    def possible_words(self, wordset):
+        self._add_words(wordset)
+        self.candidates = np.zeros(len(self.words), dtype=bool)
+        self.candidates[[self.word_indices[word] for word in wordset]] = True
+        self._possible_words = None
+
+    def _add_words(self, wordset):
+        # Intern any words the registry hasn't seen
+        new_words = sorted(set(wordset) - self.word_indices.keys())
+        if new_words and self.registry.frozen:
+            raise ValueError(f"{len(new_words)} words are not answers in the pattern table")
+        self.registry.add(new_words)
+        self._sync_registry()
+
+    def _sync_registry(self):
+        # The shared registry may also have grown through another WordleAI,
+        # new words are never candidates
+        if self.letters is not None and len(self.letters) == len(self.words):
+            return
+        self.letters = self.registry.letters
+        self.zobrist_keys = zobrist_keys(len(self.words))
+        if self.word_priors is not None:
+            self.word_priors = self._priors_of(self.words)
+        for name in ("candidates", "initial_candidates"):
+            mask = getattr(self, name, None)
+            if mask is not None and len(mask) < len(self.words):
+                setattr(self, name, np.concatenate([mask, np.zeros(len(self.words) - len(mask), dtype=bool)]))
+        self.memo.clear()
+
+    def reset_candidates(self):
+        # Start a new game from the initial wordset
+        self._sync_registry()
+        self.candidates = self.initial_candidates.copy()
+        self._possible_words = None
+
+    def get_candidate_ids(self):
+        return np.flatnonzero(self.candidates)
+
+    def get_fingerprint(self, candidate_ids=None):
+        if candidate_ids is None:
+            candidate_ids = self.get_candidate_ids()
+        return fingerprint(candidate_ids, self.zobrist_keys)
+
+    def get_memo_mode(self):
+        # Everything a ranking depends on besides the candidate set
+        mode = self.scoring_mode
+        if mode == "lookahead":
+            mode = f"{mode}{self.lookahead_width}"
+        elif mode == "sampled":
+            mode = f"{mode}{self.sample_size}/{self.sample_seed}"
+        if self.prefilter:
+            mode = f"{mode}+prefilter"
+        if (self.prior_width, self.prior_centre) != (word_data.PRIOR_WIDTH, word_data.PRIOR_CENTRE):
+            mode = f"{mode}+prior{self.prior_width}/{self.prior_centre}"
+        return f"{mode}:{self.pattern_table.word_list_hash.hex()[:12]}"
+
+    def get_strategy(self):
+        # Everything next_guess depends on besides the history
+        return f"{self.get_memo_mode()}:endgame={self.endgame_threshold}/{self.endgame_nodes}"
+
+    def count_possible_words(self):
+        return int(np.count_nonzero(self.candidates))
 
     def prune_words_v2(self, game_state):
+        self._sync_registry()
         filter = self._get_position_letter_map(game_state)
         #pprint(f"filter map:\n{filter}")
-        removed_words = set()
-        for word in self.possible_words:
-            for i, letter in enumerate(word):
-                if letter not in filter[i]:
-                    removed_words.add(word)
-                    break
-            
-        self.possible_words = self.possible_words - removed_words
+        # Codes outside a-z are never allowed
+        allowed = np.zeros((5, LETTER_CODES), dtype=bool)
+        for position, letters in filter.items():
+            allowed[position, [ord(letter) - ord("a") for letter in letters]] = True
+
+        # allowed[i, letters[w, i]] for every word w and position i
+        keep = allowed[np.arange(5), self.letters].all(axis=1)
+        self.candidates &= keep
+        self._possible_words = None
+
+    def prune_by_pattern(self, guess_id, pattern):
+        # Survivors are exactly the answers that would have produced the
+        # observed pattern for this guess
+        self.candidates &= self.pattern_table.table[guess_id] == pattern
+        self._possible_words = None
 
     def _get_position_letter_map(self, game_state):
 
@@ -92,69 +251,236 @@ class WordleAI:
 
         return pos_letter_map
     
-    def save_indices(self): 
-        indices = dict()
-        for i, word in enumerate(words):
-            indices[word] = i
-        with open("word_indices.json", "w") as outfile:
-            json.dump(indices, outfile)
-        
-        return indices
+    def get_state_table(self, guesses=None, answers=None):
+        # Rows are guesses, columns are answers (square over words by default)
+        if guesses is None:
+            guesses = word_data.word_list("words")
+        return PatternTable.load(guesses, answers)
 
-    def get_state_table(self):
-        table = np.zeros((len(words), len(words)))
-        
-        for i1, i2 in itertools.permutations(range(len(words)), 2):   
-            w1 = words[i1]
-            w2 = words[i2]
-            letter_indices = dict()
-            for i, letter in enumerate(w1):
-                if letter in letter_indices:
-                    letter_indices[letter].add(i)
-                else:
-                    letter_indices[letter] = set([i])
-
-            guess = 0
-            for i, c in enumerate(w2):
-                guess *= 10
-                if c in letter_indices and i in letter_indices[c]:
-                    letter_indices[c].remove(i)
-                    guess += LetterState.GREEN.value
-                else:
-                    guess += LetterState.EMPTY.value
+    def get_frequencies(self):
+        """
+        Look up the prior of every word id (word_priors) and pattern table
+        guess id (guess_priors) in word_data.priors, for prior_width and
+        prior_centre. Words without a frequency get a prior of 0.
+        """
+        self.word_priors = self._priors_of(self.words)
+        if self.pattern_table is not None:
+            self.guess_priors = self._priors_of(self.pattern_table.guesses)
+        self._frequencies = None
+        # Rankings depend on the priors
+        self.memo.clear()
+        return self.word_priors
 
-            for i, c in enumerate(w2):
-                if (guess // (10**(4-i))) % 10 == 0:
-                    if c in letter_indices and len(letter_indices[c]) > 0:
-                        guess += LetterState.YELLOW.value * (10**(4-i))  
-            
-            table[i1, i2] = guess
-        
-        np.fill_diagonal(table, 22222)
-        np.save("pat_table.npy", table)
+    def _priors_of(self, words):
+        priors = word_data.priors(self.prior_width, self.prior_centre)
+        if words is word_data.word_list("words"):
+            return priors
+        # Catalog ids of the allowed guesses are their ids in priors
+        catalog_ids = get_catalog().ids
+        ids = np.array([catalog_ids.get(word, -1) for word in words], dtype=np.int64)
+        known = (ids >= 0) & (ids < len(priors))
+        values = np.zeros(len(words))
+        values[known] = priors[ids[known]]
+        return values
 
-        return table
+    @property
+    def frequencies(self):
+        # {word: prior}, built on first use for lookups by word
+        if self._frequencies is None:
+            priors = word_data.priors(self.prior_width, self.prior_centre)
+            self._frequencies = dict(zip(word_data.word_list("words"), priors.tolist()))
+        return self._frequencies
 
-    def get_frequencies(self):
-        def sigmoid(x):
-            return 1 / (1 + math.exp(-x))
-        width = 10
-        c = width * (-0.5 + 3000 / len(frequency_map.keys()))
-        space = np.linspace(c - width / 2, c + width / 2, len(words))
-        sorted_words = sorted(frequency_map.items(), key=lambda x: x[1])
-        normalized = dict()
-        for word, score in zip(sorted_words, space):
-            normalized[word[0]] = sigmoid(score)
-        self.frequencies = normalized
-        return normalized
-
-    def get_word_probabilities(self):
-        probs = np.array([self.frequencies[word] for word in self.possible_words])
+    def get_word_probabilities(self, candidate_ids=None):
+        if candidate_ids is None:
+            candidate_ids = self.get_candidate_ids()
+        probs = self.word_priors[candidate_ids]
         tot = probs.sum()
         if tot == 0:
             return np.zeros(probs.shape)
         return probs / tot
 
+    def calculate_entropies(self, candidate_ids=None, guess_ids=None, weighted=False,
+                            block_size=ENTROPY_BLOCK_SIZE):
+        """
+        Entropy of every guess in guess_ids over the candidate answers, read
+        from the pattern table. Defaults to all candidates and all guesses.
+        If weighted, answers are weighted by get_word_probabilities.
+        """
+        if candidate_ids is None:
+            candidate_ids = self.get_candidate_ids()
+        if guess_ids is None:
+            guess_ids = np.arange(len(self.pattern_table.guesses))
+        guess_ids = np.asarray(guess_ids)
+        weights = self.get_word_probabilities(candidate_ids) if weighted else None
+
+        entropies = np.empty(len(guess_ids))
+        # Keep each gathered slice to roughly block_size entries
+        rows = max(1, block_size // max(1, len(candidate_ids)))
+        for start in range(0, len(guess_ids), rows):
+            counts = pattern_counts(self.pattern_table.table, guess_ids[start:start + rows],
+                                    candidate_ids, weights)
+            entropies[start:start + rows] = entropy_from_counts(counts)
+        return entropies
+
+    def calculate_sampled_scores(self, candidate_ids, guess_ids, frequencies, k=10):
+        """
+        Entropy plus frequency of every guess, estimated from a sample of
+        the candidates stratified by first letter. Guesses that could still
+        make the top k within their error bound are scored exactly, or every
+        guess if there are too many of them.
+        """
+        if len(candidate_ids) <= self.sample_size:
+            return self.calculate_entropies(candidate_ids, guess_ids) + frequencies
+        strata = self.letters[candidate_ids, 0]
+        estimates, bounds = sampled_entropies(self.pattern_table.table, candidate_ids, guess_ids,
+                                              strata, self.sample_size, self.sample_seed)
+        scores = estimates + frequencies
+        lower = np.sort(scores - bounds)[-min(k, len(scores))]
+        contenders = np.flatnonzero(scores + bounds >= lower)
+        if len(contenders) > SAMPLE_FALLBACK * len(guess_ids):
+            return self.calculate_entropies(candidate_ids, guess_ids) + frequencies
+        scores[contenders] = (self.calculate_entropies(candidate_ids, guess_ids[contenders])
+                              + frequencies[contenders])
+        return scores
+
+    def rank_lookahead(self, candidate_ids, guess_ids, scores, k=10):
+        """
+        Rescore the best one-ply guesses by two-ply entropy: the guess's own
+        entropy plus the expected entropy of the best candidate to guess
+        next in each partition it splits the candidates into.
+
+        A partition of n answers adds at most log2(n) bits, so a guess's
+        score is bounded before its partitions are searched, and guesses
+        that can no longer reach the top k are skipped. Returns the top k
+        (word, score) pairs.
+        """
+        table = self.pattern_table
+        size = len(candidate_ids)
+        width = max(self.lookahead_width, k)
+        order = np.lexsort((guess_ids, -scores))[:width]
+        ranking = []
+        for i in order:
+            # Bounds only hold while the kth best score is known
+            floor = ranking[k - 1][1] if len(ranking) >= k else -np.inf
+            row = table.table[guess_ids[i]][candidate_ids]
+            patterns, counts = np.unique(row, return_counts=True)
+            # Largest partitions first, they move the bound the most
+            by_size = np.argsort(-counts, kind="stable")
+            bound = scores[i] + (counts * np.log2(counts)).sum() / size
+            for pattern, count in zip(patterns[by_size], counts[by_size]):
+                if bound <= floor:
+                    break
+                if pattern == ALL_GREEN or count == 1:
+                    continue
+                part = candidate_ids[row == pattern]
+                next_ids = table.answer_guess_ids[part]
+                next_ids = next_ids[next_ids >= 0]
+                best = 0.0
+                if len(next_ids):
+                    best = entropy_from_counts(pattern_counts(table.table, next_ids, part)).max()
+                bound -= count / size * (np.log2(count) - best)
+            else:
+                ranking.append((table.guesses[guess_ids[i]], float(bound)))
+                ranking.sort(key=lambda entry: -entry[1])
+        return ranking[:k]
+
+    def prefilter_guesses(self, candidate_ids, guess_ids, k=10):
+        """
+        Positions in guess_ids of the guesses worth scoring exactly, the
+        best by letter_scores. The fewer the candidates, the cheaper exact
+        scoring is and the more guesses are kept.
+        """
+        size = max(k, PREFILTER_MIN, PREFILTER_ENTRIES // max(1, len(candidate_ids)))
+        if size >= len(guess_ids):
+            return np.arange(len(guess_ids))
+        guess_letters = words_to_array([self.pattern_table.guesses[i] for i in guess_ids])
+        scores = letter_scores(guess_letters, self.letters[candidate_ids])
+        return np.sort(top_k_indices(scores, size, guess_ids))
+
+    def next_guess(self, history, candidate_ids=None):
+        """
+        Guess to play after history, a list of (guess, pattern) pairs, from
+        the decision tree or opening book if they cover the history, else
+        the best ranked.
+        """
+        if self.decision_tree is not None:
+            guess = self.decision_tree.lookup(history)
+            if guess is not None:
+                return guess
+        if self.opening_book is not None:
+            guess = self.opening_book.lookup(history)
+            if guess is not None:
+                return guess
+        if candidate_ids is None:
+            candidate_ids = self.get_candidate_ids()
+        if self.endgame_threshold is not None and len(candidate_ids) <= self.endgame_threshold:
+            if self.endgame is None:
+                self.endgame = EndgameSolver(self.pattern_table)
+            self.endgame.node_budget = self.endgame_nodes
+            self.endgame.time_budget = self.endgame_time_budget
+            # Falls back to the ranking if the search runs out of budget
+            result = self.endgame.best_guess(candidate_ids)
+            if result is not None:
+                return self.pattern_table.guesses[result[0]]
+        return self.rank_guesses(candidate_ids, k=1)[0][0]
+
+    def rank_guesses(self, candidate_ids=None, k=10):
+        """
+        Top k (word, score) guesses for the candidates. Only words that can
+        still be the answer are guessed, unless none of them can be, scored
+        by entropy plus their prior from get_frequencies.
+
+        Rankings are memoized by candidate set fingerprint in self.memo,
+        and in self.memo_store if one is set.
+        """
+        if candidate_ids is None:
+            candidate_ids = self.get_candidate_ids()
+        mode = self.get_memo_mode()
+        fingerprint = self.get_fingerprint(candidate_ids)
+        key = (mode, fingerprint)
+        cached = self.memo.get(key, k)
+        if cached is None and self.memo_store is not None:
+            cached = self.memo_store.get(fingerprint, mode, k)
+            if cached is not None:
+                self.memo.put(key, k, cached)
+        if cached is not None:
+            return cached
+
+        guess_ids = self.pattern_table.answer_guess_ids[candidate_ids]
+        guess_ids = guess_ids[guess_ids >= 0]
+        if len(guess_ids) == 0:
+            # None of the candidates can be guessed, like answers only in
+            # the api vocabulary, so every guess is scored
+            guess_ids = np.arange(len(self.pattern_table.guesses))
+        if self.prefilter:
+            kept = self.prefilter_guesses(candidate_ids, guess_ids, k)
+            if self.prefilter_audit:
+                self._audit_prefilter(candidate_ids, guess_ids, kept)
+            guess_ids = guess_ids[kept]
+        guesses = [self.pattern_table.guesses[guess_id] for guess_id in guess_ids]
+        frequencies = self.guess_priors[guess_ids]
+        if self.scoring_mode == "sampled":
+            scores = self.calculate_sampled_scores(candidate_ids, guess_ids, frequencies, k)
+        else:
+            scores = self.calculate_entropies(candidate_ids, guess_ids) + frequencies
+        if self.scoring_mode == "lookahead":
+            ranking = self.rank_lookahead(candidate_ids, guess_ids, scores, k)
+        else:
+            ranking = top_k(scores, guesses, k, guess_ids)
+        self.memo.put(key, k, ranking)
+        if self.memo_store is not None:
+            self.memo_store.put(fingerprint, mode, k, ranking)
+        return ranking
+
+    def _audit_prefilter(self, candidate_ids, guess_ids, kept):
+        scores = self.calculate_entropies(candidate_ids, guess_ids)
+        scores += self.guess_priors[guess_ids]
+        best = top_k_indices(scores, 1, guess_ids)
+        self.prefilter_stats["rankings"] += 1
+        if len(best) and best[0] not in kept:
+            self.prefilter_stats["dropped"] += 1
+
     def calculate_entropy_v2(self, word, pattern_table):
         entropy = 0.0
         probability = 0.0
@@ -175,20 +501,19 @@ class WordleAI:
                     letter_indices[letter].add(i)
                 else:
                     letter_indices[letter] = set([i])
-            guess = 0
+            states = []
             for i, c in enumerate(w2):
-                guess *= 10
                 if c in letter_indices and i in letter_indices[c]:
                     letter_indices[c].remove(i)
-                    guess += LetterState.GREEN.value
+                    states.append(LetterState.GREEN)
                 else:
-                    guess += LetterState.EMPTY.value
+                    states.append(LetterState.EMPTY)
 
             for i, c in enumerate(w2):
-                if (guess // (10**(4-i))) % 10 == 0:
+                if states[i] is LetterState.EMPTY:
                     if c in letter_indices and len(letter_indices[c]) > 0:
-                        guess += LetterState.YELLOW.value * (10**(4-i))  
-            pattern = guess
+                        states[i] = LetterState.YELLOW
+            pattern = encode(states)
             
             if pattern not in counter:
                 counter[pattern] = 0
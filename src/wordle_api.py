@@ -8,20 +8,19 @@
 # ------------------------------------------------------------------------------
 
 # Python libraries
-import requests
 import json
-from enum import Enum
 if __name__ == "src.wordle_api":
-    from src.wordle_ai import LetterState
+    from src.states import LetterState, GameStatus
+    from src.pattern_codec import from_api_response
 else:
-    from wordle_ai import LetterState
+    from states import LetterState, GameStatus
+    from pattern_codec import from_api_response
 
-class GameStatus(Enum):
-    STARTED         = 1
-    ONGOING         = 2
-    MAX_GUESSES     = 3
-    ANSWER_FOUND    = 4
-    ENDED           = 5
+
+def _post(url, data):
+    # requests is only needed once a game is played against the api
+    import requests
+    return requests.post(url, json=data)
 
 class WordleAPI():
 
@@ -50,7 +49,7 @@ class WordleAPI():
             data['wordID'] = word_id
 
         # Send request
-        response = requests.post(request_url, json=data)
+        response = _post(request_url, data)
         self._print_response(response)
 
         # Set response values
@@ -77,7 +76,7 @@ class WordleAPI():
         self.guess_history += [guessed_word]
 
         # Send request
-        response = requests.post(request_url, json=data)
+        response = _post(request_url, data)
 
         # Set response values
         response_data = json.loads(response.text)   # get list of data
@@ -107,7 +106,7 @@ class WordleAPI():
         request_url = self.url + 'api/v1/finish_game/'
 
         # Send request
-        response = requests.post(request_url, json=data)
+        response = _post(request_url, data)
 
         # Set response value
         response_data = json.loads(response.text)
@@ -134,6 +133,10 @@ class WordleAPI():
 
     def get_game_state(self):
         return self.game_state
+
+    def get_pattern(self):
+        # Encoded feedback for the most recent guess
+        return from_api_response(self.game_state)
     
 
 if __name__ == "__main__":
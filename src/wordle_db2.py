@@ -1,14098 +1,14 @@
 # All 14094 words from wordle api
+# Stored in word_data.bin, wordset is loaded on first access
+if __name__ == "src.wordle_db2":
+    from src import word_data
+else:
+    import word_data
 
-wordset = {
-"abaca",
-"aback",
-"abaft",
-"abase",
-"abash",
-"abate",
-"abbey",
-"abbot",
-"abdal",
-"abeam",
-"abest",
-"abhor",
-"abide",
-"abies",
-"abiit",
-"abito",
-"abode",
-"abohm",
-"abois",
-"abord",
-"abort",
-"about",
-"above",
-"abuna",
-"abuse",
-"abuzz",
-"abysm",
-"abyss",
-"accoy",
-"accra",
-"acerb",
-"achar",
-"ackee",
-"acned",
-"acold",
-"acorn",
-"acres",
-"acrid",
-"acris",
-"acted",
-"actin",
-"actor",
-"actum",
-"actus",
-"acute",
-"adaga",
-"adage",
-"adams",
-"adapa",
-"adapt",
-"addax",
-"added",
-"adder",
-"addle",
-"adeem",
-"adept",
-"adieu",
-"adige",
-"aditi",
-"adjuc",
-"admit",
-"adobe",
-"adobo",
-"adopt",
-"adore",
-"adorn",
-"adown",
-"adult",
-"adust",
-"aedes",
-"aegis",
-"aegri",
-"aequa",
-"aequo",
-"aerie",
-"aesir",
-"aesop",
-"aetas",
-"affix",
-"afire",
-"aflak",
-"afoot",
-"afore",
-"afoul",
-"afric",
-"after",
-"again",
-"agama",
-"agape",
-"agate",
-"agave",
-"agaze",
-"agent",
-"aggro",
-"aghan",
-"agile",
-"aging",
-"agjus",
-"aglet",
-"aglow",
-"agnus",
-"agony",
-"agora",
-"agree",
-"ahead",
-"ahura",
-"aimer",
-"aioli",
-"aired",
-"aisle",
-"aitch",
-"aiunt",
-"ajaia",
-"ajuga",
-"akron",
-"alack",
-"alamo",
-"alarm",
-"alate",
-"album",
-"alcea",
-"alces",
-"alder",
-"aldol",
-"aleph",
-"alert",
-"aleut",
-"algal",
-"alget",
-"algid",
-"algin",
-"algol",
-"alias",
-"alibi",
-"alien",
-"align",
-"aliis",
-"alike",
-"alive",
-"alkyd",
-"alkyl",
-"allah",
-"allay",
-"aller",
-"alley",
-"allot",
-"allow",
-"alloy",
-"allyl",
-"alnus",
-"aloes",
-"aloft",
-"alogy",
-"aloha",
-"alone",
-"along",
-"aloof",
-"alosa",
-"aloud",
-"alpha",
-"altar",
-"alter",
-"alula",
-"amain",
-"amari",
-"amass",
-"amaze",
-"amber",
-"ambit",
-"amble",
-"ameba",
-"ameer",
-"amend",
-"amice",
-"amici",
-"amide",
-"amigo",
-"amine",
-"amino",
-"amish",
-"amiss",
-"amity",
-"amman",
-"amnis",
-"amole",
-"among",
-"amore",
-"amort",
-"amoto",
-"amour",
-"ample",
-"amply",
-"amuck",
-"amuse",
-"anasa",
-"andes",
-"anele",
-"anent",
-"angas",
-"angel",
-"anger",
-"angle",
-"angry",
-"angst",
-"anile",
-"anima",
-"anime",
-"animi",
-"animo",
-"anion",
-"anise",
-"anjou",
-"ankel",
-"ankle",
-"ankus",
-"annex",
-"annis",
-"annoy",
-"annul",
-"annum",
-"annus",
-"anode",
-"anser",
-"antic",
-"antum",
-"anvil",
-"aorta",
-"aotus",
-"apace",
-"apart",
-"apery",
-"aphid",
-"aphis",
-"apian",
-"aping",
-"apios",
-"apish",
-"apium",
-"apnea",
-"appal",
-"apple",
-"apply",
-"appro",
-"apres",
-"april",
-"apron",
-"aprum",
-"aqaba",
-"araba",
-"arado",
-"arare",
-"arawn",
-"arbor",
-"arced",
-"arceo",
-"arcus",
-"ardea",
-"ardeb",
-"ardet",
-"ardor",
-"areal",
-"areas",
-"areca",
-"arena",
-"arete",
-"argil",
-"argol",
-"argon",
-"argos",
-"argot",
-"argue",
-"argus",
-"arhat",
-"ariel",
-"aries",
-"arins",
-"arise",
-"arius",
-"armed",
-"armet",
-"armis",
-"armor",
-"aroid",
-"aroma",
-"arose",
-"arras",
-"array",
-"arrow",
-"arson",
-"artem",
-"artes",
-"aruba",
-"arulo",
-"aruru",
-"aryan",
-"asana",
-"asarh",
-"ascii",
-"ascot",
-"ascus",
-"ashen",
-"ashes",
-"ashur",
-"asian",
-"aside",
-"asked",
-"askew",
-"aspen",
-"asper",
-"aspic",
-"assai",
-"assam",
-"assay",
-"asses",
-"asset",
-"assur",
-"aster",
-"astir",
-"astra",
-"asura",
-"aswan",
-"atajo",
-"atilt",
-"atlas",
-"atole",
-"atoll",
-"atoms",
-"atomy",
-"atone",
-"atony",
-"atque",
-"atqui",
-"attar",
-"attic",
-"auden",
-"audio",
-"audit",
-"auger",
-"aught",
-"augur",
-"aurae",
-"aural",
-"aurar",
-"aurea",
-"aures",
-"autre",
-"auxin",
-"avahi",
-"avail",
-"avant",
-"avast",
-"avena",
-"avens",
-"avert",
-"avian",
-"avile",
-"aviso",
-"avoid",
-"avoir",
-"avons",
-"avunt",
-"await",
-"awake",
-"award",
-"aware",
-"awful",
-"awned",
-"axial",
-"axile",
-"axiom",
-"azide",
-"azido",
-"azoic",
-"azote",
-"aztec",
-"azure",
-"babar",
-"babel",
-"bacon",
-"badge",
-"badli",
-"badly",
-"bagel",
-"baggy",
-"bairn",
-"baiza",
-"baize",
-"baked",
-"baker",
-"balas",
-"balky",
-"balle",
-"balls",
-"balmy",
-"balsa",
-"banal",
-"banch",
-"banco",
-"bands",
-"bandy",
-"banff",
-"banjo",
-"banns",
-"bantu",
-"barba",
-"barbe",
-"barbu",
-"barde",
-"barge",
-"baric",
-"barky",
-"baron",
-"barry",
-"barye",
-"basal",
-"based",
-"basel",
-"basic",
-"basil",
-"basin",
-"basis",
-"basso",
-"basta",
-"baste",
-"batch",
-"bated",
-"bathe",
-"batik",
-"batis",
-"baton",
-"batta",
-"bavin",
-"bawdy",
-"bayou",
-"beach",
-"beads",
-"beady",
-"beams",
-"beamy",
-"beard",
-"beast",
-"beati",
-"beats",
-"beaut",
-"bebas",
-"bebop",
-"beche",
-"becks",
-"bedel",
-"bedew",
-"bedim",
-"beech",
-"beefy",
-"beery",
-"befit",
-"befog",
-"beget",
-"begin",
-"begum",
-"begun",
-"beige",
-"being",
-"belay",
-"belch",
-"belie",
-"bella",
-"belle",
-"belli",
-"bello",
-"bells",
-"belly",
-"below",
-"belus",
-"bench",
-"benin",
-"bercy",
-"beret",
-"beroe",
-"berry",
-"berth",
-"beryl",
-"beset",
-"besom",
-"besot",
-"beste",
-"betel",
-"betty",
-"bevel",
-"bever",
-"bevue",
-"bezel",
-"bhaga",
-"bhang",
-"bialy",
-"bible",
-"bibos",
-"biddy",
-"bidet",
-"bifid",
-"bight",
-"bigot",
-"bihar",
-"bijou",
-"bilbo",
-"bilge",
-"bilgy",
-"bills",
-"billy",
-"bimbo",
-"binge",
-"bingo",
-"bioko",
-"biont",
-"biota",
-"biped",
-"birch",
-"birds",
-"birth",
-"bison",
-"bitch",
-"biter",
-"bites",
-"bitis",
-"bitty",
-"black",
-"blade",
-"blahs",
-"blain",
-"blame",
-"blanc",
-"bland",
-"blank",
-"blare",
-"blase",
-"blast",
-"blaze",
-"bleak",
-"blear",
-"bleat",
-"bleed",
-"bleep",
-"blend",
-"bless",
-"blest",
-"bligh",
-"blimp",
-"blind",
-"blini",
-"blink",
-"bliss",
-"blitz",
-"bloat",
-"block",
-"blodd",
-"bloke",
-"blond",
-"blood",
-"bloom",
-"blown",
-"blows",
-"blowy",
-"blues",
-"bluff",
-"blunt",
-"blurb",
-"blurt",
-"blush",
-"boann",
-"board",
-"boast",
-"boats",
-"bobby",
-"bocca",
-"bocce",
-"bogey",
-"boggy",
-"bogie",
-"bogle",
-"bogus",
-"boire",
-"boise",
-"bolti",
-"bolus",
-"bonds",
-"boned",
-"boner",
-"bones",
-"bongo",
-"bonis",
-"bonne",
-"bonny",
-"bonos",
-"bonum",
-"bonus",
-"bonze",
-"booby",
-"books",
-"boole",
-"booly",
-"boone",
-"boost",
-"booth",
-"boots",
-"booty",
-"booze",
-"boozy",
-"borax",
-"bored",
-"borer",
-"boric",
-"borne",
-"borns",
-"boron",
-"bosky",
-"bosom",
-"boson",
-"bossy",
-"botch",
-"bothy",
-"botte",
-"bouge",
-"bough",
-"bound",
-"bourn",
-"bouse",
-"bovid",
-"bowed",
-"bowel",
-"bower",
-"bowie",
-"bowls",
-"boxed",
-"boxer",
-"boxes",
-"boyar",
-"boyne",
-"brace",
-"bract",
-"bragg",
-"bragi",
-"brahm",
-"braid",
-"brain",
-"brake",
-"braky",
-"brama",
-"brand",
-"brank",
-"brant",
-"brash",
-"brass",
-"brave",
-"bravo",
-"brawl",
-"brawn",
-"braze",
-"bread",
-"break",
-"bream",
-"breed",
-"brett",
-"breve",
-"brian",
-"briar",
-"bribe",
-"brick",
-"bride",
-"brief",
-"brier",
-"brill",
-"brine",
-"bring",
-"brink",
-"briny",
-"brisk",
-"broad",
-"broil",
-"broke",
-"brome",
-"bronx",
-"brood",
-"brook",
-"broom",
-"broth",
-"brown",
-"brows",
-"brrok",
-"bruce",
-"bruin",
-"bruit",
-"brunt",
-"brush",
-"brute",
-"bryon",
-"bryum",
-"buddy",
-"budge",
-"bueno",
-"buffo",
-"buggy",
-"bugle",
-"build",
-"built",
-"bulge",
-"bulky",
-"bulla",
-"bulls",
-"bully",
-"bumps",
-"bumpy",
-"bunas",
-"bunch",
-"bunco",
-"bunko",
-"bunny",
-"burgh",
-"burin",
-"burke",
-"burly",
-"burnt",
-"burro",
-"bursa",
-"burst",
-"busby",
-"busch",
-"bushy",
-"butch",
-"butea",
-"buteo",
-"butte",
-"butut",
-"butyl",
-"buxom",
-"buxus",
-"buyer",
-"bvd's",
-"bylaw",
-"byron",
-"byssa",
-"byway",
-"cabal",
-"caber",
-"cabin",
-"cable",
-"cacao",
-"cache",
-"cachi",
-"cacus",
-"caddo",
-"caddy",
-"cader",
-"cadet",
-"cadge",
-"cadit",
-"cadiz",
-"cadra",
-"cadre",
-"caeca",
-"caelo",
-"caeur",
-"cagey",
-"cahot",
-"cairn",
-"cairo",
-"cajun",
-"cakes",
-"calbe",
-"calla",
-"calls",
-"calms",
-"calva",
-"calve",
-"calyx",
-"camas",
-"camel",
-"cameo",
-"canal",
-"canas",
-"candy",
-"canis",
-"canna",
-"canny",
-"canoe",
-"canon",
-"canst",
-"canto",
-"canty",
-"caper",
-"capit",
-"capon",
-"capra",
-"capri",
-"caput",
-"carat",
-"cards",
-"cares",
-"caret",
-"carex",
-"cargo",
-"carib",
-"carle",
-"carob",
-"carol",
-"carom",
-"carpe",
-"carre",
-"carry",
-"carta",
-"carte",
-"carum",
-"carve",
-"carya",
-"carys",
-"cased",
-"caste",
-"casus",
-"catch",
-"cater",
-"cates",
-"catty",
-"cauda",
-"caulk",
-"causa",
-"cause",
-"cavia",
-"cavil",
-"cease",
-"cebus",
-"cecal",
-"cecum",
-"cedar",
-"ceiba",
-"ceibo",
-"cello",
-"celom",
-"celui",
-"cento",
-"ceras",
-"ceres",
-"ceric",
-"cerni",
-"certa",
-"chafe",
-"chaff",
-"chain",
-"chair",
-"chait",
-"chaja",
-"chalk",
-"champ",
-"chant",
-"chaos",
-"chaps",
-"chara",
-"chard",
-"charm",
-"chart",
-"chary",
-"chase",
-"chasm",
-"cheap",
-"cheat",
-"check",
-"cheek",
-"cheep",
-"cheer",
-"chela",
-"chere",
-"chert",
-"chess",
-"chest",
-"chewa",
-"chewy",
-"chian",
-"chick",
-"chide",
-"chief",
-"chien",
-"child",
-"chile",
-"chili",
-"chill",
-"chime",
-"china",
-"chine",
-"chink",
-"chino",
-"chios",
-"chips",
-"chirp",
-"chirr",
-"chloe",
-"chock",
-"choir",
-"choix",
-"choke",
-"choky",
-"chomp",
-"chops",
-"chord",
-"chore",
-"chose",
-"choux",
-"chuck",
-"chufa",
-"chuff",
-"chump",
-"chunk",
-"churl",
-"churn",
-"churr",
-"chute",
-"chyle",
-"chyme",
-"cicer",
-"cider",
-"cigar",
-"cigit",
-"cilia",
-"cimex",
-"cinch",
-"circa",
-"circe",
-"cisco",
-"civet",
-"civic",
-"civil",
-"civis",
-"clack",
-"clade",
-"claim",
-"clamp",
-"clang",
-"clank",
-"claro",
-"clary",
-"clash",
-"clasp",
-"class",
-"claws",
-"clean",
-"clear",
-"cleat",
-"cleft",
-"clepe",
-"clerk",
-"clich",
-"click",
-"cliff",
-"climb",
-"clime",
-"cline",
-"cling",
-"clink",
-"cloak",
-"clock",
-"clone",
-"close",
-"cloth",
-"cloud",
-"clout",
-"clove",
-"clown",
-"cluck",
-"clump",
-"coach",
-"coaid",
-"coals",
-"coast",
-"coati",
-"coats",
-"cobia",
-"coble",
-"cobol",
-"cobra",
-"cocka",
-"cocky",
-"cocoa",
-"cocos",
-"cocus",
-"codem",
-"codex",
-"codon",
-"coelo",
-"coeur",
-"cohue",
-"coign",
-"coins",
-"coles",
-"colic",
-"colon",
-"color",
-"colza",
-"comae",
-"combe",
-"combo",
-"comer",
-"comes",
-"comet",
-"comic",
-"comma",
-"comme",
-"comon",
-"compo",
-"compt",
-"conch",
-"coney",
-"conga",
-"conge",
-"congo",
-"conic",
-"connu",
-"conoy",
-"conte",
-"conto",
-"cooks",
-"cooky",
-"coold",
-"cooly",
-"coons",
-"copal",
-"coper",
-"copia",
-"copra",
-"copse",
-"coral",
-"coram",
-"corda",
-"cords",
-"corgi",
-"corno",
-"cornu",
-"corps",
-"corse",
-"corso",
-"corto",
-"cosey",
-"costa",
-"costs",
-"cotta",
-"couch",
-"cough",
-"could",
-"count",
-"coupe",
-"court",
-"coute",
-"couth",
-"coven",
-"cover",
-"covet",
-"covey",
-"covin",
-"cower",
-"coyly",
-"coyol",
-"coypu",
-"cozen",
-"crme",
-"crabs",
-"crack",
-"craft",
-"craig",
-"crake",
-"cramp",
-"crane",
-"crank",
-"crape",
-"craps",
-"crash",
-"crass",
-"crate",
-"crave",
-"crawl",
-"craze",
-"crazy",
-"creak",
-"cream",
-"creat",
-"crecy",
-"crede",
-"credo",
-"creed",
-"creek",
-"creel",
-"creep",
-"creme",
-"crepe",
-"cress",
-"crest",
-"crete",
-"crick",
-"crier",
-"crime",
-"crimp",
-"crisp",
-"crith",
-"crius",
-"croak",
-"croat",
-"crock",
-"croft",
-"crone",
-"crony",
-"crook",
-"croon",
-"crore",
-"cross",
-"croup",
-"crowd",
-"crown",
-"crows",
-"crude",
-"cruel",
-"cruet",
-"crumb",
-"crump",
-"cruse",
-"crush",
-"crust",
-"crypt",
-"csako",
-"ctene",
-"cuban",
-"cubby",
-"cubeb",
-"cubic",
-"cubit",
-"cuddy",
-"culex",
-"cully",
-"culpa",
-"cumin",
-"cupid",
-"cuppa",
-"cured",
-"curer",
-"curia",
-"curie",
-"curio",
-"curly",
-"curry",
-"cursd",
-"curse",
-"curve",
-"curvy",
-"cushy",
-"cutch",
-"cycad",
-"cycas",
-"cycle",
-"cygne",
-"cynic",
-"czech",
-"dabri",
-"dacca",
-"dacha",
-"daddy",
-"daeva",
-"daffy",
-"dagan",
-"dagda",
-"dagga",
-"dagon",
-"daily",
-"dairy",
-"daisy",
-"dakar",
-"dalal",
-"dalea",
-"dalle",
-"dally",
-"dames",
-"damon",
-"danae",
-"dance",
-"dandi",
-"dandy",
-"dante",
-"daraf",
-"darby",
-"darky",
-"darts",
-"dated",
-"datum",
-"daube",
-"daunt",
-"david",
-"davit",
-"davus",
-"dawns",
-"dazed",
-"deads",
-"death",
-"debar",
-"debit",
-"debts",
-"debut",
-"decal",
-"decay",
-"decet",
-"decit",
-"decks",
-"decoy",
-"decry",
-"dedit",
-"deeds",
-"defer",
-"defie",
-"deify",
-"deign",
-"deism",
-"deist",
-"deity",
-"deker",
-"dekko",
-"delay",
-"delft",
-"delhi",
-"delta",
-"delve",
-"demel",
-"demon",
-"demos",
-"demur",
-"denim",
-"dense",
-"dents",
-"depee",
-"depot",
-"depth",
-"derby",
-"derri",
-"derry",
-"desto",
-"detat",
-"deter",
-"detox",
-"detre",
-"deuce",
-"devel",
-"devex",
-"devil",
-"devon",
-"dewan",
-"dewey",
-"dhawa",
-"dheur",
-"dhobi",
-"dhole",
-"dhote",
-"dhoti",
-"diana",
-"diary",
-"diazo",
-"dicen",
-"dicer",
-"dicis",
-"dicky",
-"dicot",
-"dicta",
-"dicto",
-"dictu",
-"dight",
-"digit",
-"dildo",
-"dilly",
-"dimer",
-"dimes",
-"dimly",
-"diner",
-"dingo",
-"dingy",
-"dinka",
-"dinky",
-"diode",
-"dioon",
-"dipus",
-"dirca",
-"dirge",
-"dirty",
-"disce",
-"disco",
-"dishy",
-"ditch",
-"ditto",
-"ditty",
-"divan",
-"diver",
-"dives",
-"divot",
-"divvy",
-"dixie",
-"dixit",
-"dizen",
-"dizzy",
-"dobra",
-"doces",
-"docet",
-"dodge",
-"doeil",
-"doesn",
-"doggo",
-"dogie",
-"dogma",
-"doily",
-"doing",
-"dolce",
-"dolly",
-"dolor",
-"domed",
-"domum",
-"donar",
-"donec",
-"donee",
-"donna",
-"donne",
-"donor",
-"dooly",
-"doors",
-"doped",
-"doric",
-"doris",
-"dosed",
-"dotty",
-"doubt",
-"dough",
-"douse",
-"dover",
-"doves",
-"dowdy",
-"dowel",
-"dower",
-"downs",
-"downy",
-"dowry",
-"dowse",
-"doyen",
-"dozen",
-"dphil",
-"draba",
-"draco",
-"draff",
-"draft",
-"drain",
-"drake",
-"drama",
-"drame",
-"drape",
-"drawl",
-"drawn",
-"dread",
-"dream",
-"dreck",
-"dregs",
-"dress",
-"dried",
-"drier",
-"drift",
-"drill",
-"drily",
-"drink",
-"drive",
-"droil",
-"droit",
-"drole",
-"droll",
-"drone",
-"drony",
-"drool",
-"droop",
-"dropp",
-"drops",
-"dross",
-"drove",
-"drown",
-"drugs",
-"druid",
-"drums",
-"drunk",
-"drupe",
-"dryad",
-"dryas",
-"dryer",
-"ducal",
-"ducat",
-"duchy",
-"ducks",
-"dukes",
-"dulce",
-"dulia",
-"dully",
-"dulse",
-"dummy",
-"dumps",
-"dumpy",
-"dunce",
-"duped",
-"duple",
-"dural",
-"durga",
-"durio",
-"durra",
-"durum",
-"dusky",
-"dusty",
-"dutch",
-"duval",
-"dwarf",
-"dwell",
-"dyaus",
-"dying",
-"dylan",
-"eager",
-"eagle",
-"eagre",
-"eared",
-"early",
-"earth",
-"easel",
-"eaten",
-"eater",
-"eaves",
-"eblis",
-"ebony",
-"eclat",
-"edema",
-"edged",
-"edger",
-"edict",
-"edify",
-"edile",
-"educe",
-"educt",
-"eerie",
-"eggar",
-"egret",
-"egypt",
-"eider",
-"eight",
-"eisen",
-"eject",
-"eland",
-"elate",
-"elbow",
-"elder",
-"elead",
-"elect",
-"elegy",
-"elemi",
-"eleve",
-"elfin",
-"elief",
-"eliot",
-"elite",
-"elmos",
-"eloge",
-"elope",
-"elops",
-"elude",
-"elver",
-"elves",
-"embay",
-"embed",
-"ember",
-"emery",
-"emile",
-"emmer",
-"emmet",
-"emply",
-"empta",
-"empty",
-"enact",
-"ename",
-"enate",
-"enbas",
-"ended",
-"endow",
-"endue",
-"enema",
-"enemy",
-"enets",
-"enjoy",
-"enlil",
-"ennui",
-"ensis",
-"ensue",
-"enter",
-"entre",
-"entry",
-"envoy",
-"eolus",
-"eosin",
-"epact",
-"ephah",
-"ephor",
-"epoch",
-"epode",
-"epona",
-"epoxy",
-"eppur",
-"epsom",
-"equal",
-"equip",
-"equus",
-"erase",
-"erato",
-"erect",
-"ergot",
-"erica",
-"erode",
-"erose",
-"erous",
-"error",
-"erste",
-"eruca",
-"erunt",
-"espri",
-"essay",
-"essen",
-"ester",
-"estop",
-"etage",
-"ether",
-"ethic",
-"ethos",
-"ethyl",
-"etude",
-"eundo",
-"evade",
-"event",
-"evert",
-"every",
-"evict",
-"evoke",
-"evove",
-"ex(a)",
-"exact",
-"exalt",
-"excel",
-"exegi",
-"exert",
-"exile",
-"exist",
-"exode",
-"expel",
-"extol",
-"extra",
-"exude",
-"exult",
-"fted",
-"faon",
-"faber",
-"fable",
-"faced",
-"facer",
-"faces",
-"facet",
-"facia",
-"facie",
-"facit",
-"facon",
-"facta",
-"facti",
-"facto",
-"facts",
-"faded",
-"fadge",
-"fagin",
-"fagot",
-"fagus",
-"fails",
-"faint",
-"faire",
-"fairy",
-"faith",
-"faker",
-"fakir",
-"falak",
-"falco",
-"falln",
-"falls",
-"false",
-"falsi",
-"famed",
-"fames",
-"fancy",
-"fandi",
-"fando",
-"fangs",
-"fanny",
-"fanon",
-"farad",
-"farce",
-"fargo",
-"farsi",
-"fatal",
-"fated",
-"fates",
-"fatso",
-"fatta",
-"fatty",
-"faugh",
-"fauld",
-"faule",
-"fault",
-"fauna",
-"faust",
-"faute",
-"favet",
-"favor",
-"fears",
-"feast",
-"feats",
-"feaze",
-"fecal",
-"feces",
-"fecit",
-"feels",
-"feeze",
-"feign",
-"feint",
-"felis",
-"felix",
-"felon",
-"femme",
-"femur",
-"fence",
-"fenny",
-"feoff",
-"feral",
-"ferat",
-"feria",
-"feroe",
-"ferre",
-"ferry",
-"fesse",
-"fetal",
-"fetch",
-"feted",
-"fetid",
-"fetor",
-"fetus",
-"fever",
-"fewer",
-"fianc",
-"fiber",
-"fichu",
-"ficus",
-"fidei",
-"fides",
-"fidus",
-"fieff",
-"field",
-"fiend",
-"fieri",
-"fiery",
-"fifer",
-"fifth",
-"fifty",
-"fight",
-"filar",
-"filch",
-"filer",
-"files",
-"fille",
-"filly",
-"filmy",
-"filth",
-"final",
-"finch",
-"finds",
-"fined",
-"finem",
-"finer",
-"finis",
-"fiord",
-"fires",
-"firma",
-"first",
-"firth",
-"fishs",
-"fishy",
-"fitly",
-"fiver",
-"fives",
-"fixed",
-"fixer",
-"fjord",
-"flags",
-"flail",
-"flair",
-"flake",
-"flaky",
-"flamb",
-"flame",
-"flank",
-"flant",
-"flare",
-"flash",
-"flask",
-"flats",
-"fleck",
-"fleer",
-"fleet",
-"flesh",
-"fleur",
-"flick",
-"flier",
-"flies",
-"fling",
-"flint",
-"flirt",
-"float",
-"flock",
-"flood",
-"floor",
-"flora",
-"floss",
-"flour",
-"flout",
-"flown",
-"fluff",
-"fluid",
-"fluke",
-"flume",
-"flunk",
-"flush",
-"flute",
-"flyer",
-"foamy",
-"focal",
-"focis",
-"focus",
-"foehn",
-"fogey",
-"foggy",
-"foils",
-"foist",
-"folio",
-"folks",
-"folly",
-"fomes",
-"fomor",
-"fools",
-"foots",
-"foram",
-"foray",
-"force",
-"forge",
-"forma",
-"forms",
-"forte",
-"forth",
-"forti",
-"forty",
-"forum",
-"fossa",
-"fosse",
-"fouet",
-"foule",
-"found",
-"fount",
-"fours",
-"fovea",
-"fowls",
-"foyer",
-"fraca",
-"frail",
-"frais",
-"frame",
-"franc",
-"frank",
-"frapp",
-"fraud",
-"fraus",
-"freak",
-"freed",
-"fresh",
-"freud",
-"freya",
-"friar",
-"fried",
-"frigg",
-"frill",
-"frise",
-"frisk",
-"frith",
-"frizz",
-"frock",
-"froid",
-"frond",
-"frons",
-"front",
-"frore",
-"frost",
-"froth",
-"frown",
-"fruit",
-"frump",
-"fryer",
-"fucus",
-"fudge",
-"fuego",
-"fuels",
-"fugal",
-"fuggy",
-"fugit",
-"fugue",
-"fullc",
-"fully",
-"fumed",
-"fumes",
-"fumid",
-"funds",
-"fungi",
-"funky",
-"funny",
-"furan",
-"furor",
-"furst",
-"furto",
-"furze",
-"fusee",
-"fusel",
-"fusil",
-"fussy",
-"fusty",
-"futon",
-"fuzzy",
-"gabel",
-"gable",
-"gabon",
-"gaddi",
-"gadus",
-"gaffe",
-"gager",
-"gaily",
-"galan",
-"galax",
-"galen",
-"galop",
-"gamba",
-"games",
-"gamey",
-"gamic",
-"gamin",
-"gamma",
-"gammy",
-"gamut",
-"ganja",
-"gansu",
-"garde",
-"garth",
-"gassy",
-"gates",
-"gaudy",
-"gauge",
-"gaunt",
-"gauri",
-"gauss",
-"gauze",
-"gavel",
-"gavia",
-"gavot",
-"gawky",
-"gayal",
-"gazer",
-"geant",
-"gecko",
-"geese",
-"geist",
-"gelid",
-"gemma",
-"genet",
-"genic",
-"genie",
-"genip",
-"genoa",
-"genou",
-"genre",
-"genug",
-"genus",
-"gerea",
-"germy",
-"geste",
-"ghana",
-"ghaut",
-"ghost",
-"ghoul",
-"ghyll",
-"giant",
-"gidar",
-"giddy",
-"gifts",
-"gigue",
-"giles",
-"gills",
-"gimel",
-"giova",
-"girru",
-"girth",
-"gismo",
-"given",
-"giver",
-"glade",
-"glair",
-"gland",
-"glans",
-"glare",
-"glass",
-"glaux",
-"glave",
-"glaze",
-"gleam",
-"glean",
-"gleba",
-"glebe",
-"gleek",
-"gleet",
-"glenn",
-"glide",
-"glint",
-"glitz",
-"gloam",
-"gloar",
-"gloat",
-"globe",
-"glogg",
-"gloom",
-"glory",
-"gloss",
-"glout",
-"glove",
-"gloze",
-"gluck",
-"glued",
-"gluey",
-"glume",
-"gluon",
-"glyph",
-"gnarl",
-"gnash",
-"gnome",
-"gobio",
-"godly",
-"going",
-"golem",
-"golly",
-"gondi",
-"goner",
-"goods",
-"goody",
-"gooey",
-"goose",
-"goosh",
-"goral",
-"goran",
-"gorge",
-"gorki",
-"gorse",
-"gotha",
-"gouda",
-"gouge",
-"gourd",
-"gouty",
-"grce",
-"gr/to",
-"grace",
-"grade",
-"grado",
-"graft",
-"grail",
-"grain",
-"grama",
-"grand",
-"grano",
-"grant",
-"grape",
-"graph",
-"grasp",
-"grass",
-"grata",
-"grate",
-"grave",
-"gravy",
-"graze",
-"great",
-"grebe",
-"greed",
-"greek",
-"green",
-"greet",
-"grias",
-"grids",
-"grief",
-"grift",
-"grill",
-"grime",
-"grimm",
-"grimy",
-"grind",
-"griot",
-"gripe",
-"grips",
-"grist",
-"grits",
-"groan",
-"groat",
-"grody",
-"groin",
-"groom",
-"grope",
-"gross",
-"grosz",
-"group",
-"grout",
-"grove",
-"growl",
-"grown",
-"gruel",
-"gruff",
-"grume",
-"grump",
-"grunt",
-"guama",
-"guano",
-"guard",
-"guava",
-"guess",
-"guest",
-"guide",
-"guild",
-"guile",
-"guilt",
-"guise",
-"gulag",
-"gulch",
-"gules",
-"gully",
-"gulph",
-"gumbo",
-"gumma",
-"guppy",
-"gurge",
-"gurry",
-"gusto",
-"gusty",
-"gutsy",
-"guyot",
-"gypsy",
-"gyral",
-"gyrus",
-"haber",
-"habet",
-"habit",
-"hacek",
-"hadal",
-"hades",
-"hadji",
-"haida",
-"haifa",
-"haiku",
-"hairs",
-"hairy",
-"haiti",
-"hajji",
-"hakea",
-"hakka",
-"haler",
-"halma",
-"halve",
-"hamal",
-"haman",
-"hammy",
-"hands",
-"handy",
-"hangs",
-"hanoi",
-"haply",
-"happy",
-"hardy",
-"harem",
-"harms",
-"harpy",
-"harry",
-"harsh",
-"hasta",
-"haste",
-"hasty",
-"hatch",
-"hated",
-"hater",
-"haugh",
-"haulm",
-"haunt",
-"hausa",
-"haute",
-"haven",
-"havoc",
-"hawse",
-"haydn",
-"hayes",
-"hazel",
-"heads",
-"heady",
-"heald",
-"heaps",
-"heard",
-"heart",
-"heath",
-"heave",
-"heavy",
-"hecha",
-"hedge",
-"heels",
-"hefty",
-"hegel",
-"heirs",
-"heiss",
-"heist",
-"helen",
-"helix",
-"hello",
-"hells",
-"helot",
-"helps",
-"helve",
-"hemal",
-"hemic",
-"hence",
-"henna",
-"henry",
-"herba",
-"herbe",
-"herbs",
-"herds",
-"herod",
-"heron",
-"hertz",
-"heure",
-"hevea",
-"hewer",
-"hexed",
-"hider",
-"hight",
-"hiker",
-"hilar",
-"hills",
-"hilly",
-"hilum",
-"hinan",
-"hindi",
-"hindu",
-"hinge",
-"hinny",
-"hired",
-"hitch",
-"hoard",
-"hoary",
-"hobby",
-"hocus",
-"hogan",
-"hoist",
-"hoity",
-"hokan",
-"holds",
-"holes",
-"holey",
-"holly",
-"holus",
-"homer",
-"homes",
-"homme",
-"honey",
-"honor",
-"honos",
-"honte",
-"hooch",
-"hooks",
-"hopes",
-"horde",
-"horns",
-"horny",
-"horse",
-"horst",
-"horsy",
-"horus",
-"hosea",
-"hosta",
-"hosts",
-"hotei",
-"hotel",
-"hough",
-"hound",
-"houri",
-"hours",
-"house",
-"hovea",
-"hovel",
-"hover",
-"hoyle",
-"hubby",
-"huffy",
-"hulks",
-"hulky",
-"human",
-"humid",
-"humor",
-"humph",
-"humus",
-"hunch",
-"hundi",
-"hunks",
-"hurry",
-"hurst",
-"husky",
-"hussy",
-"hutch",
-"huzza",
-"hydra",
-"hyena",
-"hygre",
-"hymen",
-"hyoid",
-"hypha",
-"hyrax",
-"ibid.",
-"ibsen",
-"ichor",
-"icily",
-"icing",
-"ictus",
-"idaho",
-"ideal",
-"ideas",
-"idiom",
-"idiot",
-"idler",
-"idocy",
-"idols",
-"idyll",
-"igigi",
-"igloo",
-"ignis",
-"ilama",
-"ileum",
-"iliac",
-"iliad",
-"ilium",
-"illae",
-"illis",
-"image",
-"imago",
-"imaum",
-"imbed",
-"imbeu",
-"imbue",
-"imide",
-"immix",
-"impel",
-"imply",
-"in(a)",
-"in(p)",
-"inane",
-"inani",
-"inapt",
-"incur",
-"incus",
-"index",
-"india",
-"indic",
-"indra",
-"indri",
-"indue",
-"indus",
-"inept",
-"inert",
-"inest",
-"infer",
-"infix",
-"infra",
-"ingle",
-"ingot",
-"inkle",
-"inlay",
-"inlet",
-"inner",
-"inset",
-"inter",
-"intra",
-"intro",
-"inula",
-"inure",
-"inurn",
-"invar",
-"ionia",
-"ionic",
-"iowan",
-"ipsus",
-"irani",
-"iraqi",
-"irate",
-"irena",
-"irish",
-"iroin",
-"irons",
-"irony",
-"irota",
-"irula",
-"isaac",
-"isere",
-"islam",
-"islet",
-"issue",
-"issus",
-"istic",
-"istos",
-"italy",
-"items",
-"ivied",
-"ivory",
-"ixion",
-"jabot",
-"jacal",
-"jacet",
-"jacks",
-"jacob",
-"jacta",
-"jaded",
-"jaffa",
-"jagah",
-"jager",
-"jahre",
-"jakes",
-"jaldi",
-"james",
-"janty",
-"janua",
-"janus",
-"japan",
-"jason",
-"jaunt",
-"jazzy",
-"jecur",
-"jelly",
-"jemmy",
-"jenny",
-"jerez",
-"jerid",
-"jerks",
-"jerky",
-"jerry",
-"jests",
-"jesus",
-"jeter",
-"jetty",
-"jeune",
-"jewel",
-"jewis",
-"jhuth",
-"jiffy",
-"jihad",
-"jimmy",
-"jingo",
-"jinks",
-"jiqui",
-"jnuis",
-"joint",
-"joist",
-"joker",
-"jokes",
-"jolly",
-"jonah",
-"jones",
-"jorum",
-"jotun",
-"jouir",
-"joule",
-"joust",
-"jubeo",
-"judas",
-"judge",
-"juice",
-"juicy",
-"julep",
-"jumbo",
-"jumps",
-"junco",
-"junta",
-"junto",
-"jural",
-"jurat",
-"juris",
-"juror",
-"juste",
-"jutty",
-"kabob",
-"kabul",
-"kadai",
-"kafir",
-"kafka",
-"kahin",
-"kalki",
-"kalon",
-"kamba",
-"kamet",
-"kamia",
-"kansa",
-"kanzu",
-"kapok",
-"kappa",
-"kaput",
-"karat",
-"karen",
-"karma",
-"karok",
-"kasha",
-"kauai",
-"kauri",
-"kayak",
-"kazak",
-"kazan",
-"kazoo",
-"keats",
-"keble",
-"kedge",
-"keeps",
-"kempt",
-"kenaf",
-"kenya",
-"ketch",
-"keyed",
-"khaki",
-"khana",
-"khaya",
-"khmer",
-"khoja",
-"khoum",
-"khudd",
-"khuen",
-"kiack",
-"kiang",
-"kiddy",
-"kills",
-"kimbo",
-"kinds",
-"kings",
-"kinky",
-"kiosk",
-"kiowa",
-"kites",
-"kitty",
-"klutz",
-"knack",
-"knarl",
-"knave",
-"knead",
-"kneed",
-"kneel",
-"knees",
-"knell",
-"knife",
-"knish",
-"knock",
-"knoll",
-"knout",
-"known",
-"knows",
-"knurl",
-"knurr",
-"koala",
-"kobus",
-"kogia",
-"koine",
-"kokka",
-"kolam",
-"kongo",
-"kopek",
-"kopje",
-"koran",
-"korea",
-"kotow",
-"kraal",
-"kraft",
-"krait",
-"kraut",
-"krill",
-"krubi",
-"krupp",
-"kudzu",
-"kursi",
-"kurux",
-"kusan",
-"kvass",
-"kwack",
-"kwela",
-"kyles",
-"kylie",
-"kyoto",
-"label",
-"labor",
-"laced",
-"laden",
-"ladle",
-"ladys",
-"lagan",
-"lager",
-"lagos",
-"lahar",
-"laird",
-"laity",
-"lally",
-"lamba",
-"lamia",
-"lamna",
-"lampe",
-"lanai",
-"lance",
-"lands",
-"lanky",
-"lapel",
-"lapin",
-"lapis",
-"lapse",
-"larch",
-"lares",
-"large",
-"largo",
-"larid",
-"larix",
-"larum",
-"larus",
-"larva",
-"laser",
-"lashd",
-"lasso",
-"latch",
-"later",
-"latet",
-"latex",
-"lathe",
-"lathi",
-"latin",
-"laudo",
-"laugh",
-"laver",
-"laxly",
-"layby",
-"layer",
-"layia",
-"leach",
-"leads",
-"leafy",
-"leaky",
-"leaps",
-"learl",
-"learn",
-"lease",
-"leash",
-"least",
-"leave",
-"leben",
-"ledge",
-"ledum",
-"leech",
-"leeds",
-"leery",
-"legal",
-"legem",
-"leges",
-"leggy",
-"legis",
-"legon",
-"leman",
-"lemma",
-"lemna",
-"lemon",
-"lemur",
-"lends",
-"lenin",
-"lente",
-"lento",
-"leone",
-"lepas",
-"leper",
-"lepus",
-"lerot",
-"lethe",
-"letup",
-"leuco",
-"levee",
-"level",
-"lever",
-"levin",
-"lexis",
-"leyte",
-"lhasa",
-"liana",
-"libel",
-"libet",
-"libra",
-"libya",
-"licet",
-"licit",
-"liege",
-"lifer",
-"liger",
-"light",
-"ligne",
-"ligno",
-"liked",
-"likes",
-"likin",
-"lilac",
-"lilly",
-"limae",
-"limax",
-"limbo",
-"limbs",
-"limey",
-"limit",
-"limoe",
-"limpa",
-"lindy",
-"linea",
-"lined",
-"linen",
-"liner",
-"lines",
-"lingo",
-"lions",
-"lipid",
-"lisle",
-"lisom",
-"lists",
-"litem",
-"liter",
-"lites",
-"lithe",
-"lived",
-"liver",
-"lives",
-"livid",
-"livor",
-"llaga",
-"llama",
-"llano",
-"loach",
-"loamy",
-"loasa",
-"loath",
-"lobar",
-"lobby",
-"lobed",
-"local",
-"locke",
-"locks",
-"locos",
-"locum",
-"locus",
-"lodge",
-"loeil",
-"loess",
-"lofty",
-"logan",
-"logic",
-"logos",
-"loins",
-"loire",
-"lolly",
-"lonas",
-"loner",
-"longo",
-"looby",
-"loofa",
-"lookd",
-"looks",
-"loose",
-"lords",
-"lorry",
-"losel",
-"loser",
-"lotto",
-"lotus",
-"lough",
-"loupe",
-"loups",
-"louse",
-"lousy",
-"loved",
-"lover",
-"loves",
-"lovoa",
-"lower",
-"lowly",
-"loxia",
-"loyal",
-"lucan",
-"lucid",
-"lucky",
-"lucre",
-"lucri",
-"lucus",
-"luffa",
-"luger",
-"luggy",
-"lukes",
-"lulld",
-"lumen",
-"lumpy",
-"lunar",
-"lunch",
-"lunda",
-"lunge",
-"lungi",
-"lungs",
-"lupus",
-"lurch",
-"lurid",
-"lushy",
-"lusty",
-"lusus",
-"lutra",
-"luxor",
-"luyia",
-"luzon",
-"lygus",
-"lying",
-"lymph",
-"lynch",
-"lyram",
-"lyric",
-"lysis",
-"lysol",
-"maana",
-"mabap",
-"macao",
-"macaw",
-"macht",
-"macon",
-"macro",
-"macte",
-"madam",
-"madia",
-"madid",
-"madly",
-"mafia",
-"magic",
-"magma",
-"magna",
-"magni",
-"magno",
-"magog",
-"magus",
-"mahoe",
-"maidu",
-"maine",
-"major",
-"maker",
-"makes",
-"malay",
-"maldu",
-"maleo",
-"malis",
-"malmo",
-"malta",
-"malto",
-"malum",
-"malus",
-"malva",
-"mamba",
-"mamey",
-"mamma",
-"mammy",
-"manda",
-"mande",
-"manes",
-"manet",
-"mange",
-"mango",
-"mangy",
-"mania",
-"manie",
-"manis",
-"manly",
-"manna",
-"manor",
-"manse",
-"mansi",
-"manta",
-"manul",
-"manus",
-"maori",
-"maple",
-"marah",
-"march",
-"mardi",
-"marek",
-"mares",
-"maria",
-"marks",
-"marry",
-"marsh",
-"marte",
-"marut",
-"masai",
-"maser",
-"mashi",
-"mason",
-"masse",
-"massy",
-"matai",
-"match",
-"mated",
-"mater",
-"matin",
-"matzo",
-"maund",
-"maure",
-"mauve",
-"mavis",
-"maxim",
-"mayan",
-"maybe",
-"mayor",
-"mazed",
-"mazer",
-"mccoy",
-"mealy",
-"means",
-"meant",
-"meaty",
-"mecca",
-"mecum",
-"medal",
-"medea",
-"medes",
-"media",
-"medic",
-"medio",
-"medoc",
-"meets",
-"melee",
-"meles",
-"melia",
-"melic",
-"melon",
-"memor",
-"mens",
-"mente",
-"merci",
-"mercy",
-"merge",
-"merit",
-"merry",
-"mesic",
-"mesne",
-"meson",
-"messy",
-"mesua",
-"metal",
-"meter",
-"metic",
-"metis",
-"metro",
-"meurt",
-"meuse",
-"mewed",
-"mezzo",
-"miami",
-"miasm",
-"micro",
-"midas",
-"middy",
-"midge",
-"midst",
-"mieux",
-"might",
-"milan",
-"milch",
-"miler",
-"milky",
-"mimer",
-"mimic",
-"mimir",
-"mimus",
-"mince",
-"minds",
-"mined",
-"miner",
-"minim",
-"minis",
-"minor",
-"minos",
-"minsk",
-"minus",
-"mirth",
-"misce",
-"misdo",
-"miser",
-"missa",
-"mists",
-"misty",
-"mitad",
-"miter",
-"mitra",
-"miwok",
-"mixed",
-"mixen",
-"mixer",
-"mnium",
-"mocha",
-"modal",
-"model",
-"modem",
-"modes",
-"modue",
-"modus",
-"mogul",
-"moire",
-"moist",
-"mokes",
-"molar",
-"moldy",
-"moles",
-"molly",
-"molto",
-"molva",
-"momus",
-"monad",
-"monal",
-"monde",
-"money",
-"mongo",
-"monte",
-"month",
-"mooch",
-"moods",
-"moody",
-"moore",
-"moory",
-"moose",
-"moped",
-"mopsy",
-"mopus",
-"moral",
-"moray",
-"morbo",
-"morel",
-"mores",
-"mormo",
-"morra",
-"morse",
-"morta",
-"morus",
-"mosan",
-"moses",
-"mossa",
-"mossy",
-"motel",
-"motet",
-"motif",
-"motor",
-"motte",
-"motto",
-"mould",
-"mound",
-"mount",
-"mourn",
-"mouse",
-"mousy",
-"mouth",
-"moved",
-"mover",
-"moves",
-"movie",
-"msasa",
-"mucid",
-"mucin",
-"mucky",
-"mucor",
-"mucus",
-"muddy",
-"mudra",
-"mufti",
-"muggy",
-"mugil",
-"mujer",
-"mulch",
-"mulct",
-"mulet",
-"multa",
-"multi",
-"mumbo",
-"mummy",
-"mumps",
-"munch",
-"munda",
-"mundi",
-"muori",
-"muove",
-"mural",
-"murem",
-"murky",
-"muros",
-"murre",
-"murus",
-"musca",
-"muses",
-"musgu",
-"mushy",
-"music",
-"musky",
-"mussy",
-"musty",
-"mutal",
-"mutum",
-"muzzy",
-"mwera",
-"mylar",
-"myoid",
-"myoma",
-"myope",
-"myrrh",
-"mysis",
-"nabob",
-"nacho",
-"nacre",
-"nadir",
-"nager",
-"naiad",
-"naias",
-"naiki",
-"nails",
-"naira",
-"naive",
-"naked",
-"named",
-"names",
-"nammu",
-"nanna",
-"nanny",
-"naomi",
-"napha",
-"nappy",
-"naris",
-"nasal",
-"nasci",
-"nasty",
-"nasua",
-"natal",
-"natch",
-"natty",
-"natus",
-"nauru",
-"naval",
-"navel",
-"navvy",
-"nawab",
-"neats",
-"necio",
-"necks",
-"needs",
-"needy",
-"nefas",
-"negev",
-"negro",
-"negus",
-"nehru",
-"neigh",
-"nella",
-"nenia",
-"nepal",
-"nepos",
-"neque",
-"nerve",
-"nervy",
-"never",
-"nevis",
-"newel",
-"newly",
-"newsy",
-"nexus",
-"nguni",
-"ngwee",
-"niais",
-"nicad",
-"niche",
-"nicht",
-"nidor",
-"nidus",
-"niece",
-"niffy",
-"niger",
-"night",
-"nihau",
-"nihil",
-"nilly",
-"nimis",
-"ninny",
-"ninos",
-"ninth",
-"nintu",
-"niobe",
-"nisan",
-"nisus",
-"niter",
-"nitid",
-"nitor",
-"nixie",
-"nixon",
-"nizam",
-"njord",
-"no(a)",
-"noahs",
-"nobis",
-"noble",
-"nobly",
-"nocet",
-"noddy",
-"nodus",
-"noire",
-"noise",
-"noisy",
-"nolle",
-"nomad",
-"nomia",
-"nonce",
-"nones",
-"nonny",
-"nonum",
-"noobe",
-"noose",
-"nopal",
-"noria",
-"norma",
-"north",
-"nosce",
-"nosed",
-"notch",
-"noted",
-"notes",
-"notre",
-"novel",
-"novus",
-"nubes",
-"nudge",
-"nugae",
-"nugas",
-"nulla",
-"nulli",
-"numen",
-"nummi",
-"numps",
-"nuova",
-"nurse",
-"nusku",
-"nutty",
-"nwill",
-"nyala",
-"nylon",
-"nymph",
-"nyssa",
-"oaken",
-"oakum",
-"oasis",
-"oaten",
-"oaths",
-"obeah",
-"obese",
-"occur",
-"ocean",
-"ocher",
-"ochna",
-"octal",
-"octet",
-"oculi",
-"odium",
-"oevum",
-"offal",
-"offer",
-"often",
-"ogham",
-"ogler",
-"ohmic",
-"oiled",
-"okapi",
-"olden",
-"older",
-"oleum",
-"olive",
-"ology",
-"omaha",
-"omani",
-"omega",
-"omnem",
-"omnes",
-"omnia",
-"omnib",
-"omnis",
-"on(p)",
-"onine",
-"onion",
-"onset",
-"opepe",
-"opera",
-"opima",
-"opium",
-"opsin",
-"optez",
-"optic",
-"orach",
-"orbed",
-"orbem",
-"orbit",
-"order",
-"oread",
-"organ",
-"oriel",
-"origo",
-"orion",
-"oriya",
-"orlon",
-"ormer",
-"oryza",
-"osage",
-"osaka",
-"oscan",
-"oscar",
-"osier",
-"other",
-"otium",
-"ottar",
-"otter",
-"oudre",
-"ought",
-"ouija",
-"ounce",
-"ouphe",
-"outas",
-"outdo",
-"outer",
-"outgo",
-"outre",
-"ovary",
-"ovate",
-"overt",
-"ovoid",
-"ovule",
-"owing",
-"owlet",
-"owned",
-"owner",
-"oxbow",
-"oxeye",
-"oxide",
-"oxime",
-"oxlip",
-"ozone",
-"paced",
-"pacem",
-"pacer",
-"paces",
-"padda",
-"paddy",
-"padre",
-"padua",
-"paean",
-"paena",
-"pagan",
-"pagri",
-"pains",
-"paint",
-"pairs",
-"paisa",
-"palce",
-"palki",
-"palms",
-"palmy",
-"palsy",
-"panax",
-"paned",
-"panel",
-"pangs",
-"panic",
-"pansy",
-"panto",
-"pants",
-"papal",
-"papaw",
-"paper",
-"papio",
-"parch",
-"parer",
-"pares",
-"paris",
-"parit",
-"parji",
-"parka",
-"parol",
-"parry",
-"parse",
-"parte",
-"parti",
-"parts",
-"party",
-"parus",
-"parva",
-"parvo",
-"pasch",
-"pasha",
-"passe",
-"passu",
-"pasta",
-"paste",
-"pasty",
-"patas",
-"patch",
-"pater",
-"paths",
-"patio",
-"patty",
-"paulo",
-"pause",
-"paved",
-"pavis",
-"pawky",
-"payee",
-"payer",
-"pcoat",
-"peace",
-"peach",
-"peaks",
-"peaky",
-"pearl",
-"peaty",
-"pecan",
-"pecos",
-"pedal",
-"pedir",
-"peers",
-"peeve",
-"peice",
-"peine",
-"penal",
-"pence",
-"pengo",
-"penis",
-"penni",
-"penny",
-"pense",
-"peony",
-"peppy",
-"pepsi",
-"peras",
-"perca",
-"perch",
-"perde",
-"perdu",
-"perdy",
-"peril",
-"perit",
-"perry",
-"perte",
-"perth",
-"pesky",
-"petal",
-"peter",
-"petit",
-"petto",
-"petty",
-"pewee",
-"phage",
-"phase",
-"phial",
-"phlox",
-"phoca",
-"phone",
-"phony",
-"photo",
-"phyle",
-"physa",
-"piano",
-"picea",
-"pichi",
-"picot",
-"picul",
-"picus",
-"piece",
-"pieta",
-"piete",
-"piety",
-"pigmy",
-"pilaf",
-"pilea",
-"piles",
-"pilon",
-"pilot",
-"pilus",
-"pinch",
-"pinna",
-"pinon",
-"pinot",
-"pinto",
-"pinus",
-"pious",
-"pipal",
-"piped",
-"piper",
-"pipes",
-"pipit",
-"pipra",
-"pique",
-"piste",
-"pisum",
-"pitch",
-"pithy",
-"piton",
-"pitta",
-"pitys",
-"pivot",
-"pixel",
-"pizza",
-"place",
-"plage",
-"plaid",
-"plain",
-"plait",
-"plane",
-"plank",
-"plant",
-"plash",
-"plasm",
-"plate",
-"plato",
-"platy",
-"playa",
-"plays",
-"plaza",
-"plead",
-"pleas",
-"pleat",
-"plebe",
-"plena",
-"pliny",
-"ploce",
-"plomb",
-"plonk",
-"pluck",
-"plumb",
-"plume",
-"plump",
-"plunk",
-"plush",
-"pluto",
-"pness",
-"poach",
-"pocos",
-"poema",
-"poesy",
-"poets",
-"pogge",
-"point",
-"poise",
-"poker",
-"pokey",
-"polak",
-"polar",
-"poles",
-"polio",
-"polka",
-"polls",
-"polyp",
-"pommy",
-"ponca",
-"pongo",
-"pooch",
-"poori",
-"popin",
-"poppy",
-"porch",
-"porgy",
-"porte",
-"poser",
-"posse",
-"potos",
-"potto",
-"potty",
-"pouch",
-"pound",
-"pours",
-"power",
-"ppour",
-"praam",
-"prahu",
-"praia",
-"prame",
-"prank",
-"prate",
-"prawn",
-"praya",
-"prece",
-"preen",
-"press",
-"preux",
-"prfer",
-"priam",
-"price",
-"prick",
-"pride",
-"prim",
-"prima",
-"prime",
-"primo",
-"primp",
-"prink",
-"print",
-"prior",
-"prism",
-"prius",
-"privy",
-"prize",
-"probe",
-"proem",
-"prole",
-"prone",
-"prong",
-"proof",
-"prore",
-"prose",
-"prosy",
-"proud",
-"prove",
-"prowl",
-"proxy",
-"prude",
-"prune",
-"psalm",
-"pshaw",
-"psora",
-"psych",
-"ptyas",
-"pubes",
-"pubic",
-"pubis",
-"pudgy",
-"pudor",
-"pueri",
-"puffy",
-"pukka",
-"pulex",
-"pulpy",
-"pulse",
-"punce",
-"punch",
-"punic",
-"pupal",
-"pupil",
-"puppy",
-"puree",
-"purge",
-"purim",
-"puris",
-"purse",
-"pursy",
-"purus",
-"pusan",
-"pussy",
-"putid",
-"putty",
-"pydna",
-"pygmy",
-"pylon",
-"pyrex",
-"pyrus",
-"pyxie",
-"pyxis",
-"qatar",
-"qiana",
-"qiang",
-"quack",
-"quaff",
-"quail",
-"quake",
-"qualm",
-"quand",
-"quark",
-"quart",
-"quash",
-"quasi",
-"quean",
-"queen",
-"queer",
-"quell",
-"quern",
-"query",
-"quest",
-"queue",
-"quick",
-"quiet",
-"quiff",
-"quill",
-"quilt",
-"quine",
-"quint",
-"quips",
-"quipu",
-"quira",
-"quire",
-"quirk",
-"quirt",
-"quite",
-"quito",
-"quits",
-"quoad",
-"quoin",
-"quoit",
-"quota",
-"quote",
-"quoth",
-"rabat",
-"rabbi",
-"rabid",
-"racer",
-"radar",
-"radio",
-"radix",
-"radon",
-"rages",
-"rains",
-"rainy",
-"raise",
-"rajab",
-"rajah",
-"rally",
-"ramie",
-"ranch",
-"randy",
-"range",
-"rangy",
-"ranks",
-"raper",
-"rapid",
-"rapit",
-"raree",
-"ratan",
-"ratel",
-"ratio",
-"ravel",
-"raven",
-"raver",
-"rayon",
-"razor",
-"reach",
-"react",
-"ready",
-"realm",
-"reams",
-"reave",
-"rebel",
-"rebus",
-"rebut",
-"recce",
-"recte",
-"recti",
-"recto",
-"recur",
-"redan",
-"redet",
-"redly",
-"reedy",
-"reefs",
-"reefy",
-"reeky",
-"reeve",
-"refer",
-"refit",
-"regal",
-"regem",
-"reges",
-"regia",
-"regis",
-"regle",
-"regna",
-"regni",
-"regum",
-"regur",
-"reich",
-"reigh",
-"reign",
-"reins",
-"reise",
-"relax",
-"relay",
-"relic",
-"remis",
-"remit",
-"remus",
-"rendu",
-"renew",
-"rents",
-"repay",
-"repel",
-"reply",
-"rerum",
-"rerun",
-"reset",
-"resin",
-"reste",
-"resty",
-"retch",
-"retem",
-"revel",
-"revue",
-"rheum",
-"rhine",
-"rhino",
-"rhomb",
-"rhone",
-"rhumb",
-"rhyme",
-"riant",
-"ribes",
-"ricin",
-"rider",
-"ridge",
-"rifle",
-"rigel",
-"right",
-"rigid",
-"rigor",
-"rimer",
-"rings",
-"rinse",
-"rioja",
-"ripen",
-"risen",
-"riser",
-"risks",
-"risqu",
-"rissa",
-"risum",
-"rited",
-"rites",
-"ritzy",
-"rival",
-"rivel",
-"river",
-"rivet",
-"roach",
-"roads",
-"roast",
-"robes",
-"robin",
-"roble",
-"rocks",
-"rocky",
-"rodeo",
-"roger",
-"rogue",
-"rolls",
-"roman",
-"romeo",
-"romps",
-"rondo",
-"roods",
-"rooms",
-"roomy",
-"roost",
-"roots",
-"ropes",
-"ropey",
-"roppe",
-"roral",
-"roric",
-"rorid",
-"rosas",
-"roses",
-"rosin",
-"rotor",
-"rouge",
-"rough",
-"round",
-"rouse",
-"route",
-"rover",
-"rowan",
-"rowdy",
-"rowel",
-"rowen",
-"rower",
-"royal",
-"ruade",
-"rubia",
-"ruble",
-"rubus",
-"ruddy",
-"rudge",
-"rudis",
-"rudra",
-"rugby",
-"ruins",
-"ruled",
-"ruler",
-"rules",
-"rumal",
-"rumba",
-"rumen",
-"rumex",
-"rummy",
-"rumor",
-"runer",
-"runes",
-"runic",
-"rural",
-"rushy",
-"russe",
-"rusty",
-"sabah",
-"sabal",
-"saber",
-"sabin",
-"sable",
-"sabra",
-"sacra",
-"sacre",
-"sadhe",
-"sadhu",
-"sadly",
-"saepe",
-"safar",
-"sages",
-"sahib",
-"saick",
-"saiga",
-"sails",
-"saint",
-"salad",
-"salai",
-"salal",
-"salem",
-"salis",
-"salix",
-"sally",
-"salmi",
-"salmo",
-"salol",
-"salon",
-"salsa",
-"salto",
-"salts",
-"saltu",
-"salty",
-"salva",
-"salve",
-"salvo",
-"samba",
-"sambo",
-"samia",
-"samoa",
-"sanaa",
-"sands",
-"sandy",
-"sango",
-"sante",
-"santo",
-"saone",
-"sapid",
-"sapir",
-"sapis",
-"sapit",
-"sapor",
-"sappy",
-"saran",
-"sarda",
-"sarum",
-"satan",
-"satin",
-"satis",
-"satyr",
-"sauce",
-"saucy",
-"saudi",
-"sauna",
-"saury",
-"saute",
-"sauve",
-"saved",
-"saver",
-"savor",
-"savvy",
-"sawan",
-"saxon",
-"scads",
-"scald",
-"scale",
-"scalp",
-"scaly",
-"scamp",
-"scant",
-"scape",
-"scare",
-"scarf",
-"scarp",
-"scars",
-"scath",
-"scaup",
-"scend",
-"scene",
-"scent",
-"schwa",
-"scion",
-"scire",
-"scobs",
-"scoff",
-"scold",
-"scone",
-"scoop",
-"scoot",
-"scopa",
-"scope",
-"score",
-"scorn",
-"scots",
-"scott",
-"scour",
-"scout",
-"scowl",
-"scrag",
-"scram",
-"scrap",
-"scree",
-"screw",
-"scrim",
-"scrip",
-"scrod",
-"scrub",
-"scrum",
-"scuff",
-"scull",
-"scurf",
-"scute",
-"seale",
-"seals",
-"seamy",
-"seats",
-"sebum",
-"sects",
-"sedan",
-"seder",
-"sedge",
-"sedgy",
-"sedum",
-"seeds",
-"seedy",
-"seems",
-"seent",
-"segar",
-"segno",
-"seine",
-"seize",
-"selar",
-"selma",
-"selon",
-"semel",
-"semen",
-"senes",
-"senna",
-"senor",
-"sense",
-"sente",
-"seoul",
-"sepal",
-"sepia",
-"sepoy",
-"serac",
-"serer",
-"serge",
-"seria",
-"serif",
-"serin",
-"seris",
-"seron",
-"serow",
-"serum",
-"serve",
-"servo",
-"setto",
-"setup",
-"seven",
-"sever",
-"sewed",
-"sewer",
-"sexed",
-"shack",
-"shade",
-"shady",
-"shaft",
-"shake",
-"shako",
-"shaky",
-"shale",
-"shall",
-"shame",
-"shank",
-"shape",
-"shard",
-"share",
-"shark",
-"sharp",
-"shave",
-"shawl",
-"shawm",
-"sheaf",
-"shear",
-"sheen",
-"sheep",
-"sheer",
-"sheet",
-"sheik",
-"shelf",
-"shell",
-"shend",
-"sheol",
-"shiah",
-"shift",
-"shina",
-"shine",
-"shiny",
-"shire",
-"shirk",
-"shirt",
-"shiva",
-"shive",
-"shoal",
-"shock",
-"shoes",
-"shogi",
-"shoji",
-"shook",
-"shoot",
-"shore",
-"shorn",
-"short",
-"shots",
-"shout",
-"shove",
-"shown",
-"showy",
-"shred",
-"shrew",
-"shrub",
-"shrug",
-"shuck",
-"shuha",
-"shunt",
-"shush",
-"shyly",
-"sibyl",
-"sided",
-"sides",
-"sidle",
-"siege",
-"sieve",
-"sieze",
-"sighd",
-"sight",
-"sigil",
-"sigma",
-"signo",
-"signs",
-"sigyn",
-"sikes",
-"silex",
-"silks",
-"silky",
-"silly",
-"silty",
-"silva",
-"simon",
-"sinai",
-"since",
-"sinew",
-"singe",
-"sinus",
-"sioux",
-"siren",
-"siris",
-"sirup",
-"sisal",
-"sison",
-"sissy",
-"sitar",
-"sitta",
-"sitzt",
-"sivan",
-"sixes",
-"sixth",
-"sixty",
-"sizar",
-"sized",
-"skald",
-"skate",
-"skean",
-"skeel",
-"skeet",
-"skein",
-"skier",
-"skies",
-"skiff",
-"skill",
-"skimp",
-"skink",
-"skips",
-"skirl",
-"skirt",
-"skoal",
-"skuld",
-"skulk",
-"skull",
-"skunk",
-"slack",
-"slade",
-"slain",
-"slake",
-"slang",
-"slant",
-"slash",
-"slate",
-"slaty",
-"slave",
-"sleek",
-"sleep",
-"sleet",
-"sleve",
-"slice",
-"slick",
-"slide",
-"sliky",
-"slily",
-"slime",
-"slimy",
-"sling",
-"slink",
-"sloop",
-"slope",
-"slops",
-"slosh",
-"sloth",
-"sloyd",
-"slump",
-"slung",
-"slurp",
-"slush",
-"smack",
-"small",
-"smalt",
-"smart",
-"smash",
-"smear",
-"smell",
-"smelt",
-"smile",
-"smilo",
-"smirk",
-"smite",
-"smith",
-"smock",
-"smoke",
-"smoky",
-"smush",
-"snack",
-"snafu",
-"snags",
-"snail",
-"snake",
-"snaky",
-"snare",
-"snarl",
-"sneak",
-"sneer",
-"snick",
-"snide",
-"sniff",
-"snipe",
-"snips",
-"snood",
-"snook",
-"snoop",
-"snore",
-"snort",
-"snout",
-"snowy",
-"snuff",
-"so(p)",
-"soapy",
-"soave",
-"sober",
-"socle",
-"sodom",
-"soepe",
-"sofia",
-"softy",
-"soggy",
-"solan",
-"solar",
-"solea",
-"soled",
-"solfa",
-"solid",
-"solon",
-"solum",
-"solus",
-"solve",
-"somme",
-"sonar",
-"songe",
-"sonic",
-"sooth",
-"sooty",
-"sophi",
-"sorex",
-"sorgo",
-"soror",
-"sorry",
-"sorts",
-"sorus",
-"sotho",
-"sotto",
-"souci",
-"sough",
-"souls",
-"sound",
-"soupe",
-"sousa",
-"souse",
-"south",
-"sower",
-"space",
-"spade",
-"spahi",
-"spain",
-"spake",
-"spank",
-"spare",
-"spark",
-"spasm",
-"spawn",
-"speak",
-"spear",
-"speck",
-"speed",
-"spell",
-"spelt",
-"spend",
-"spent",
-"sperm",
-"spero",
-"spial",
-"spica",
-"spice",
-"spick",
-"spicy",
-"spiel",
-"spike",
-"spiky",
-"spill",
-"spina",
-"spine",
-"spiny",
-"spire",
-"spiro",
-"spirt",
-"spite",
-"spitz",
-"splat",
-"splay",
-"split",
-"spode",
-"spoil",
-"spoke",
-"spoof",
-"spook",
-"spool",
-"spoon",
-"spoor",
-"spore",
-"sport",
-"sposa",
-"sposh",
-"sposo",
-"spots",
-"spout",
-"sprag",
-"sprat",
-"spray",
-"spree",
-"sprig",
-"sprit",
-"sprue",
-"spume",
-"spunk",
-"spurn",
-"spurs",
-"spurt",
-"sputa",
-"squab",
-"squad",
-"squat",
-"squaw",
-"squib",
-"squid",
-"stabs",
-"stack",
-"stael",
-"staff",
-"stage",
-"stagy",
-"staid",
-"stain",
-"stair",
-"stake",
-"stale",
-"stalk",
-"stall",
-"stamp",
-"stand",
-"stare",
-"stark",
-"stars",
-"start",
-"stash",
-"state",
-"statu",
-"stave",
-"stays",
-"stead",
-"steak",
-"steal",
-"steam",
-"steed",
-"steel",
-"steep",
-"steer",
-"stein",
-"stele",
-"steps",
-"stern",
-"stick",
-"stiff",
-"stile",
-"still",
-"stilt",
-"sting",
-"stink",
-"stint",
-"stipe",
-"stirk",
-"stive",
-"stoat",
-"stock",
-"stogy",
-"stoic",
-"stoke",
-"stole",
-"stoma",
-"stomp",
-"stone",
-"stony",
-"stood",
-"stook",
-"stool",
-"stoop",
-"stope",
-"store",
-"stork",
-"storm",
-"story",
-"stoup",
-"stour",
-"stout",
-"stove",
-"strap",
-"straw",
-"stray",
-"strew",
-"stria",
-"strip",
-"strix",
-"strom",
-"strop",
-"strow",
-"strum",
-"strut",
-"stuck",
-"study",
-"stuff",
-"stump",
-"stung",
-"stunt",
-"stupa",
-"stupe",
-"style",
-"suant",
-"suave",
-"sucre",
-"sudan",
-"suede",
-"suety",
-"sugar",
-"suite",
-"sujet",
-"sukur",
-"sulks",
-"sulky",
-"sulla",
-"sully",
-"sumac",
-"sumer",
-"summa",
-"sunni",
-"sunny",
-"sunup",
-"super",
-"supra",
-"surge",
-"surly",
-"surya",
-"sushi",
-"swain",
-"swale",
-"swami",
-"swamp",
-"swank",
-"swans",
-"sward",
-"swarm",
-"swart",
-"swash",
-"swath",
-"swazi",
-"sweal",
-"swear",
-"sweat",
-"swede",
-"sweek",
-"sweep",
-"sweet",
-"swell",
-"swept",
-"swift",
-"swill",
-"swine",
-"swing",
-"swink",
-"swipe",
-"swirl",
-"swish",
-"swiss",
-"swoon",
-"swoop",
-"sword",
-"sworn",
-"sylph",
-"synod",
-"syria",
-"syrup",
-"syrus",
-"tabby",
-"tabes",
-"tabid",
-"table",
-"taboe",
-"taboo",
-"tabor",
-"tacca",
-"tacit",
-"tacky",
-"taegu",
-"taffy",
-"tagus",
-"taiga",
-"tails",
-"taint",
-"taken",
-"taker",
-"takes",
-"takin",
-"tales",
-"talia",
-"talls",
-"tally",
-"talma",
-"talon",
-"talus",
-"tamed",
-"tamen",
-"tamer",
-"tamil",
-"tammy",
-"tampa",
-"tamus",
-"tango",
-"tanka",
-"tansy",
-"tanti",
-"tanto",
-"taped",
-"taper",
-"tapir",
-"tapis",
-"tardi",
-"tardy",
-"tares",
-"tarot",
-"tarry",
-"taste",
-"tasty",
-"tatar",
-"taunt",
-"tauon",
-"tawny",
-"tawse",
-"taxes",
-"taxis",
-"taxus",
-"tayra",
-"tazza",
-"teach",
-"tears",
-"teary",
-"tease",
-"tebet",
-"techy",
-"tecta",
-"tecum",
-"teddy",
-"tedge",
-"teens",
-"teeny",
-"teeth",
-"tehee",
-"tekel",
-"telum",
-"tempi",
-"tempo",
-"temps",
-"tempt",
-"tenax",
-"tench",
-"tenet",
-"tenez",
-"tenon",
-"tenor",
-"tense",
-"tente",
-"tenth",
-"tents",
-"tenue",
-"tenus",
-"tepee",
-"tepid",
-"terce",
-"teres",
-"tergo",
-"terms",
-"terra",
-"terre",
-"terry",
-"terse",
-"tesla",
-"testa",
-"teste",
-"testy",
-"tetra",
-"tetto",
-"texan",
-"texas",
-"thais",
-"thana",
-"thane",
-"thank",
-"thats",
-"thebe",
-"theca",
-"theft",
-"their",
-"theme",
-"there",
-"therm",
-"these",
-"theta",
-"thews",
-"thick",
-"thief",
-"thigh",
-"thill",
-"thine",
-"thing",
-"think",
-"third",
-"thole",
-"thong",
-"thorn",
-"thoro",
-"thorp",
-"those",
-"thoth",
-"three",
-"thrid",
-"throb",
-"throe",
-"throw",
-"thrum",
-"thuja",
-"thule",
-"thumb",
-"thump",
-"thunk",
-"thyme",
-"tiara",
-"tiber",
-"tibet",
-"tibia",
-"tidal",
-"tides",
-"tiene",
-"tiger",
-"tight",
-"tilde",
-"tiled",
-"tilia",
-"tilth",
-"timed",
-"timeo",
-"timer",
-"times",
-"timid",
-"timon",
-"timor",
-"tinca",
-"tinct",
-"tinea",
-"tinge",
-"tinny",
-"tipsy",
-"tired",
-"tirer",
-"titan",
-"titer",
-"tithe",
-"title",
-"titus",
-"tizzy",
-"toady",
-"toast",
-"today",
-"toddy",
-"todea",
-"todus",
-"toils",
-"toity",
-"tokay",
-"token",
-"tokyo",
-"tombe",
-"tommy",
-"tonal",
-"toned",
-"toner",
-"tonga",
-"tongs",
-"tongu",
-"tonic",
-"tonue",
-"tools",
-"toona",
-"tooth",
-"toots",
-"topaz",
-"topek",
-"toper",
-"topic",
-"topsy",
-"torah",
-"torch",
-"torso",
-"torte",
-"torus",
-"total",
-"totem",
-"totis",
-"totus",
-"toucb",
-"touch",
-"tough",
-"touse",
-"toute",
-"towel",
-"tower",
-"toxic",
-"toxin",
-"toyon",
-"trace",
-"track",
-"tract",
-"trade",
-"trail",
-"train",
-"trait",
-"tramp",
-"trans",
-"trapa",
-"traps",
-"trash",
-"trave",
-"trawl",
-"tread",
-"treat",
-"trees",
-"trend",
-"tress",
-"trews",
-"triad",
-"trial",
-"tribe",
-"trice",
-"trick",
-"tried",
-"trier",
-"triga",
-"trill",
-"trine",
-"tripe",
-"trite",
-"troat",
-"troes",
-"troll",
-"tromp",
-"troop",
-"trope",
-"troth",
-"trout",
-"trove",
-"truce",
-"truck",
-"trull",
-"truly",
-"trump",
-"trunk",
-"truss",
-"trust",
-"truth",
-"tryst",
-"tsuga",
-"tubal",
-"tubam",
-"tubed",
-"tuber",
-"tudor",
-"tulip",
-"tulit",
-"tulle",
-"tulsa",
-"tumid",
-"tumor",
-"tuned",
-"tuner",
-"tunga",
-"tunic",
-"tunis",
-"tupik",
-"turfy",
-"turin",
-"turki",
-"turns",
-"turpi",
-"turvy",
-"tutee",
-"tutor",
-"tutti",
-"tutto",
-"tutus",
-"twain",
-"twang",
-"tweak",
-"tweed",
-"tweet",
-"twerp",
-"twice",
-"twill",
-"twine",
-"twins",
-"twire",
-"twirl",
-"twist",
-"twixt",
-"tyche",
-"tying",
-"tyler",
-"typed",
-"types",
-"typha",
-"tyrol",
-"ubykh",
-"udder",
-"ugric",
-"uigur",
-"ukase",
-"ulcer",
-"ulcus",
-"ulema",
-"ulmus",
-"ulnar",
-"ultio",
-"ultra",
-"umbel",
-"umber",
-"umbra",
-"unapt",
-"unary",
-"unbar",
-"uncle",
-"uncut",
-"under",
-"undue",
-"unfed",
-"unfit",
-"ungue",
-"uniat",
-"union",
-"unite",
-"units",
-"unity",
-"unled",
-"unman",
-"unrig",
-"unrip",
-"unsay",
-"unsex",
-"untie",
-"until",
-"unwed",
-"up(a)",
-"up(p)",
-"upper",
-"upset",
-"upupa",
-"urals",
-"urban",
-"urbis",
-"urial",
-"urine",
-"urnam",
-"ursus",
-"usage",
-"ushas",
-"usher",
-"usine",
-"using",
-"usnea",
-"usque",
-"usual",
-"usurp",
-"usury",
-"utica",
-"utter",
-"uveal",
-"uvula",
-"uzbek",
-"vache",
-"vaduz",
-"vagal",
-"vagas",
-"vague",
-"vagus",
-"vajra",
-"vakas",
-"vakil",
-"valde",
-"valet",
-"valid",
-"valmy",
-"valor",
-"value",
-"valve",
-"vanda",
-"vanir",
-"vapid",
-"vapor",
-"vasty",
-"vaten",
-"vatum",
-"vault",
-"vaunt",
-"vedas",
-"vedic",
-"veery",
-"vegan",
-"vehis",
-"veins",
-"velar",
-"veldt",
-"velis",
-"velit",
-"velow",
-"venal",
-"venir",
-"venit",
-"venom",
-"venue",
-"venus",
-"verba",
-"verbs",
-"verge",
-"verpa",
-"verre",
-"versa",
-"verse",
-"verso",
-"verst",
-"verte",
-"vertu",
-"verum",
-"verve",
-"vespa",
-"vesta",
-"vetch",
-"veuve",
-"vexed",
-"vials",
-"viand",
-"vibes",
-"vicar",
-"vicia",
-"video",
-"vidua",
-"vient",
-"vieux",
-"views",
-"vigil",
-"vigna",
-"vigor",
-"villa",
-"villi",
-"vinca",
-"vinyl",
-"viola",
-"viper",
-"viral",
-"vireo",
-"vires",
-"virga",
-"virgo",
-"virtu",
-"virum",
-"virus",
-"visit",
-"visor",
-"vista",
-"visum",
-"visus",
-"vitae",
-"vital",
-"vitam",
-"vitia",
-"vitis",
-"vivid",
-"vivit",
-"vivre",
-"vixen",
-"vixit",
-"vizla",
-"vizor",
-"vobis",
-"vocal",
-"voces",
-"vocis",
-"vodka",
-"vogue",
-"vogul",
-"voice",
-"voile",
-"volat",
-"voles",
-"volga",
-"volie",
-"volto",
-"volva",
-"vomit",
-"vosky",
-"voter",
-"votis",
-"vouch",
-"vouge",
-"voulu",
-"vowel",
-"vrouw",
-"vultu",
-"vulva",
-"vwith",
-"vying",
-"waddy",
-"wafer",
-"wager",
-"wages",
-"wagon",
-"wahoo",
-"waifs",
-"waist",
-"waits",
-"waive",
-"waler",
-"wales",
-"walks",
-"walls",
-"waltz",
-"wanly",
-"wants",
-"warji",
-"washy",
-"wasps",
-"waste",
-"watch",
-"water",
-"waver",
-"waves",
-"waxed",
-"waxen",
-"weald",
-"wears",
-"weary",
-"weave",
-"weber",
-"wedge",
-"weeds",
-"weedy",
-"weepy",
-"weigh",
-"weile",
-"weird",
-"weiss",
-"welsh",
-"wench",
-"werth",
-"whack",
-"whale",
-"wharf",
-"whats",
-"whean",
-"wheat",
-"wheel",
-"whelk",
-"whelm",
-"whelp",
-"where",
-"which",
-"whiff",
-"whigs",
-"while",
-"whims",
-"whine",
-"whipe",
-"whirl",
-"whirr",
-"whish",
-"whisk",
-"whist",
-"white",
-"whole",
-"whomp",
-"whoop",
-"whore",
-"whorl",
-"whose",
-"widen",
-"widow",
-"width",
-"wield",
-"wight",
-"wiles",
-"wilig",
-"willy",
-"wimpy",
-"wince",
-"winch",
-"winds",
-"windy",
-"wings",
-"winks",
-"wiper",
-"wired",
-"wires",
-"wiser",
-"witan",
-"witch",
-"withe",
-"withy",
-"witty",
-"wives",
-"wizen",
-"woden",
-"wolof",
-"woman",
-"woods",
-"woody",
-"wooer",
-"wooly",
-"words",
-"wordy",
-"works",
-"world",
-"worms",
-"worry",
-"worse",
-"worst",
-"worth",
-"wotan",
-"would",
-"wound",
-"woven",
-"wrack",
-"wrapt",
-"wrath",
-"wreak",
-"wreck",
-"wrest",
-"wring",
-"wrist",
-"write",
-"wrong",
-"wrote",
-"wryly",
-"xebec",
-"xenon",
-"xeres",
-"xeric",
-"xerox",
-"xhosa",
-"xviii",
-"xylem",
-"xyris",
-"yacca",
-"yacht",
-"yager",
-"yahoo",
-"yakut",
-"yalta",
-"yamen",
-"yanan",
-"yearn",
-"years",
-"yeast",
-"yeats",
-"yeild",
-"yemen",
-"yenta",
-"yield",
-"yodel",
-"yokel",
-"young",
-"youre",
-"yours",
-"youth",
-"ypres",
-"yucca",
-"yukon",
-"yuman",
-"zaire",
-"zambo",
-"zamia",
-"zapus",
-"zayin",
-"zebra",
-"zieht",
-"zilch",
-"zippo",
-"zloty",
-"zocle",
-"zomba",
-"zombi",
-"zonal",
-"zonam",
-"zooid",
-"zoril",
-"anlas",
-"gayly",
-"cundy",
-"ninja",
-"juves",
-"heled",
-"amens",
-"rases",
-"gambe",
-"jasps",
-"pujah",
-"balks",
-"hints",
-"predy",
-"crams",
-"slubs",
-"aghas",
-"skyed",
-"sakis",
-"wists",
-"hoing",
-"buiks",
-"apays",
-"didst",
-"akene",
-"aweel",
-"onned",
-"diota",
-"gusla",
-"tarts",
-"ephod",
-"caner",
-"scena",
-"vaute",
-"paoli",
-"humas",
-"clint",
-"umrah",
-"gesse",
-"fards",
-"panne",
-"dopes",
-"toise",
-"rotls",
-"pumps",
-"farro",
-"tonka",
-"bahus",
-"cirri",
-"pitas",
-"iodid",
-"benga",
-"tolas",
-"tangs",
-"lurgy",
-"ebbed",
-"sties",
-"shiso",
-"clads",
-"rebuy",
-"gauje",
-"elsin",
-"reffo",
-"liens",
-"gnawn",
-"peats",
-"embar",
-"agues",
-"agila",
-"swads",
-"lirot",
-"jowar",
-"naric",
-"huger",
-"nanos",
-"mozos",
-"feyed",
-"brays",
-"ungot",
-"babes",
-"casas",
-"puddy",
-"fouer",
-"liras",
-"quale",
-"fluty",
-"awarn",
-"begot",
-"olein",
-"corbe",
-"baddy",
-"hicks",
-"daynt",
-"adaws",
-"rerig",
-"sysop",
-"shets",
-"pawks",
-"jowly",
-"feres",
-"fakie",
-"maars",
-"bords",
-"umiak",
-"darzi",
-"sulph",
-"leeps",
-"dants",
-"commo",
-"amnio",
-"malar",
-"mandi",
-"plims",
-"vauts",
-"gilas",
-"bises",
-"ailed",
-"litho",
-"yamun",
-"idles",
-"undam",
-"axman",
-"deray",
-"weize",
-"annal",
-"minar",
-"terts",
-"qursh",
-"crocs",
-"momma",
-"eigne",
-"rowts",
-"lipos",
-"flied",
-"vasal",
-"weeps",
-"awato",
-"sidas",
-"vitex",
-"puker",
-"masus",
-"rared",
-"hapus",
-"folds",
-"stulm",
-"rosit",
-"pized",
-"appel",
-"claes",
-"salic",
-"hexad",
-"warre",
-"nashi",
-"smoko",
-"rasta",
-"momes",
-"cyton",
-"frate",
-"mensa",
-"prest",
-"perea",
-"jurel",
-"hares",
-"bouks",
-"spans",
-"tratt",
-"lotas",
-"arris",
-"pandy",
-"figos",
-"polks",
-"soupy",
-"tegus",
-"krays",
-"yrneh",
-"genom",
-"punas",
-"liker",
-"haint",
-"abrin",
-"snark",
-"peens",
-"geres",
-"ferer",
-"raupo",
-"algae",
-"dorps",
-"kurta",
-"bhuts",
-"jaker",
-"scats",
-"tyres",
-"apter",
-"choko",
-"yechy",
-"redip",
-"mungo",
-"papas",
-"sulfa",
-"gynny",
-"yates",
-"cored",
-"boxen",
-"naunt",
-"kicks",
-"imido",
-"bulse",
-"assez",
-"hythe",
-"cryer",
-"sojas",
-"dills",
-"gulas",
-"raxed",
-"zouks",
-"punty",
-"sluff",
-"radge",
-"slabs",
-"odahs",
-"loses",
-"narks",
-"twerk",
-"damns",
-"ytost",
-"makos",
-"rawns",
-"totty",
-"colls",
-"eiked",
-"haver",
-"proyn",
-"yogee",
-"meths",
-"tachs",
-"cadis",
-"admix",
-"glugs",
-"stull",
-"swang",
-"slank",
-"micra",
-"obeli",
-"urari",
-"reked",
-"patte",
-"ingan",
-"lacks",
-"dabba",
-"nisei",
-"dunch",
-"kibei",
-"bodle",
-"octyl",
-"softs",
-"wiels",
-"izard",
-"clipe",
-"houts",
-"eensy",
-"muxed",
-"eikon",
-"impro",
-"pzazz",
-"pilum",
-"lipin",
-"chelp",
-"stubs",
-"emyds",
-"saxes",
-"morne",
-"anigh",
-"pitot",
-"ficin",
-"frack",
-"gusts",
-"inker",
-"tozie",
-"losed",
-"bubbe",
-"heast",
-"easer",
-"pilow",
-"shoat",
-"peeps",
-"gonif",
-"stoep",
-"perst",
-"talar",
-"sucky",
-"sabir",
-"durzi",
-"somas",
-"cohen",
-"flobs",
-"menus",
-"batty",
-"mages",
-"shirr",
-"gulfy",
-"silts",
-"lahal",
-"trass",
-"users",
-"larks",
-"ronne",
-"kyrie",
-"prims",
-"ayins",
-"soldi",
-"dupes",
-"seare",
-"bendy",
-"siree",
-"jelab",
-"chiao",
-"woads",
-"pried",
-"purda",
-"swoun",
-"hakam",
-"droob",
-"sears",
-"sakai",
-"macas",
-"wyted",
-"lowse",
-"cyder",
-"miltz",
-"tufts",
-"bitou",
-"girls",
-"redux",
-"kacha",
-"snobs",
-"tahas",
-"snirt",
-"virls",
-"wried",
-"spall",
-"diked",
-"jiaos",
-"sired",
-"otary",
-"zacks",
-"bunjy",
-"ducts",
-"obiit",
-"leafs",
-"antae",
-"alway",
-"bezil",
-"ollie",
-"fasci",
-"booms",
-"ragus",
-"rente",
-"argan",
-"nomic",
-"uplay",
-"ziram",
-"skank",
-"kheda",
-"slues",
-"areic",
-"amnia",
-"scurs",
-"coaly",
-"sclim",
-"bombs",
-"woose",
-"akees",
-"speos",
-"gitch",
-"twirp",
-"fluyt",
-"clits",
-"balti",
-"mitts",
-"latus",
-"ecads",
-"glims",
-"hasks",
-"sates",
-"syped",
-"knops",
-"noils",
-"whams",
-"vuggy",
-"barmy",
-"piccy",
-"jiver",
-"sowps",
-"simar",
-"hoast",
-"pyros",
-"nieve",
-"joram",
-"fleme",
-"wingy",
-"lycea",
-"veges",
-"hayed",
-"moner",
-"kutas",
-"varan",
-"dubbo",
-"opted",
-"pecky",
-"reata",
-"varas",
-"sowce",
-"spams",
-"greys",
-"omens",
-"chefs",
-"ferms",
-"benne",
-"atocs",
-"kohls",
-"towie",
-"sculp",
-"droke",
-"eaved",
-"ditsy",
-"alecs",
-"jucos",
-"scuzz",
-"perns",
-"kudus",
-"ousel",
-"heles",
-"loots",
-"dados",
-"sowls",
-"bemud",
-"targa",
-"speug",
-"slurb",
-"mingy",
-"beany",
-"hosey",
-"sales",
-"neeps",
-"honer",
-"flogs",
-"sorra",
-"rejig",
-"bodhi",
-"xylyl",
-"abacs",
-"teugh",
-"renay",
-"nukes",
-"skive",
-"kusso",
-"cutey",
-"lawny",
-"obias",
-"nighs",
-"voips",
-"dumky",
-"mauds",
-"mynah",
-"erbia",
-"slots",
-"kavas",
-"girsh",
-"sicht",
-"gisms",
-"doses",
-"dools",
-"yoops",
-"sulfo",
-"luach",
-"asway",
-"sukhs",
-"hoise",
-"tangi",
-"sasin",
-"douma",
-"grype",
-"maerl",
-"winey",
-"roper",
-"thars",
-"cusum",
-"yeard",
-"vines",
-"hilus",
-"elans",
-"skins",
-"bigha",
-"whets",
-"comms",
-"azole",
-"pully",
-"flimp",
-"arsey",
-"icier",
-"pilar",
-"limos",
-"ursae",
-"teggs",
-"keefs",
-"phese",
-"cholo",
-"wilis",
-"gurdy",
-"toman",
-"dacks",
-"clegs",
-"ostia",
-"germs",
-"lymes",
-"mosed",
-"trema",
-"spail",
-"swaly",
-"crops",
-"trues",
-"breme",
-"agone",
-"unjam",
-"mamas",
-"stied",
-"secco",
-"colas",
-"marly",
-"wolve",
-"earns",
-"loran",
-"tenge",
-"porge",
-"dumas",
-"berms",
-"ficos",
-"murry",
-"wifey",
-"eskar",
-"terai",
-"figgy",
-"pavan",
-"pardy",
-"besti",
-"tuple",
-"volts",
-"sants",
-"anils",
-"issei",
-"wirra",
-"cites",
-"obeys",
-"lehrs",
-"debag",
-"diebs",
-"nites",
-"vaded",
-"topos",
-"maise",
-"cuppy",
-"altos",
-"tocos",
-"laids",
-"razee",
-"wafts",
-"feuar",
-"oxims",
-"dwile",
-"denar",
-"palet",
-"cunit",
-"doits",
-"butts",
-"rotch",
-"dogan",
-"stoit",
-"cymas",
-"homed",
-"loams",
-"alapa",
-"unket",
-"munge",
-"leish",
-"cabre",
-"calif",
-"taata",
-"brads",
-"haika",
-"cirls",
-"emmas",
-"tapes",
-"alfas",
-"cacti",
-"danio",
-"kukus",
-"burry",
-"netty",
-"yacka",
-"ketes",
-"mbira",
-"gests",
-"idled",
-"cloop",
-"scugs",
-"adyta",
-"tapus",
-"alaap",
-"rappe",
-"oozes",
-"dargs",
-"ancon",
-"cided",
-"byssi",
-"lownd",
-"chiro",
-"deens",
-"tikes",
-"scuds",
-"briss",
-"apsis",
-"kaons",
-"mache",
-"swabs",
-"teind",
-"pries",
-"slart",
-"slums",
-"elvan",
-"chizz",
-"izars",
-"pumie",
-"disci",
-"sweys",
-"yoghs",
-"rooks",
-"kylix",
-"blogs",
-"gusle",
-"mincy",
-"soles",
-"modii",
-"tikka",
-"oxids",
-"ikats",
-"mells",
-"lader",
-"walty",
-"oater",
-"jeons",
-"rubel",
-"deair",
-"farle",
-"corer",
-"amlas",
-"algas",
-"raita",
-"frabs",
-"wadis",
-"krans",
-"pelau",
-"brews",
-"memos",
-"honed",
-"wikis",
-"misos",
-"jolts",
-"clour",
-"carps",
-"wised",
-"fetts",
-"zowie",
-"biers",
-"dippy",
-"slaid",
-"aroba",
-"gytes",
-"metho",
-"airns",
-"psyop",
-"raves",
-"snift",
-"fermi",
-"gibus",
-"gulfs",
-"barks",
-"berks",
-"grews",
-"toles",
-"rybat",
-"isled",
-"pronk",
-"yanks",
-"ymolt",
-"tupek",
-"slept",
-"lotte",
-"maqui",
-"howks",
-"atuas",
-"dooce",
-"fends",
-"cowks",
-"meres",
-"roosa",
-"syphs",
-"cupel",
-"mools",
-"aleye",
-"axoid",
-"hocks",
-"aread",
-"dampy",
-"caple",
-"drank",
-"velds",
-"snoep",
-"miked",
-"knawe",
-"koaps",
-"teals",
-"sherd",
-"corny",
-"decan",
-"coits",
-"brach",
-"whaup",
-"rawer",
-"dench",
-"wakas",
-"aigas",
-"ledes",
-"loofs",
-"coots",
-"lotic",
-"dorba",
-"clonk",
-"ziffs",
-"woozy",
-"repla",
-"banty",
-"resee",
-"piney",
-"rabic",
-"cawks",
-"miens",
-"nabks",
-"hasps",
-"skags",
-"escot",
-"shans",
-"sexts",
-"wyles",
-"hwyls",
-"tizes",
-"wefts",
-"cerci",
-"geare",
-"unpay",
-"graff",
-"bants",
-"takas",
-"shakt",
-"carbs",
-"venin",
-"vison",
-"tahrs",
-"goura",
-"sagos",
-"slued",
-"skart",
-"gizmo",
-"nomos",
-"pulus",
-"colin",
-"dribs",
-"solei",
-"dures",
-"tints",
-"daven",
-"kohas",
-"ewest",
-"bides",
-"pecke",
-"labra",
-"bardy",
-"hoofs",
-"darga",
-"bider",
-"meses",
-"umami",
-"grrrl",
-"tolts",
-"avows",
-"urena",
-"yakow",
-"wimps",
-"watap",
-"pened",
-"lured",
-"gazar",
-"volet",
-"weids",
-"malms",
-"moues",
-"betid",
-"venae",
-"mzees",
-"ripes",
-"tways",
-"garda",
-"sumps",
-"gonad",
-"grigs",
-"tonks",
-"dices",
-"yodhs",
-"etyma",
-"coapt",
-"sonde",
-"terga",
-"rusas",
-"apage",
-"snigs",
-"torii",
-"kilos",
-"bards",
-"shalt",
-"faxed",
-"decko",
-"lacer",
-"heigh",
-"yakka",
-"adbot",
-"sleds",
-"xylic",
-"smote",
-"laksa",
-"ollas",
-"tragi",
-"exome",
-"plast",
-"daker",
-"bield",
-"geeks",
-"dobie",
-"clogs",
-"sneds",
-"hilch",
-"chout",
-"gawsy",
-"mille",
-"mucro",
-"sused",
-"looey",
-"gnarr",
-"alowe",
-"thali",
-"kadis",
-"dined",
-"hanch",
-"urged",
-"plods",
-"gazed",
-"jauks",
-"bafts",
-"hamba",
-"spado",
-"axels",
-"cymol",
-"renal",
-"bokeh",
-"liths",
-"zooms",
-"buffe",
-"bufos",
-"lavvy",
-"oaves",
-"dwale",
-"nache",
-"estoc",
-"welkt",
-"glede",
-"syces",
-"claps",
-"tween",
-"gerle",
-"choom",
-"meith",
-"sooms",
-"lidar",
-"melba",
-"omber",
-"jugal",
-"faffy",
-"loipe",
-"awner",
-"chogs",
-"oaked",
-"myxos",
-"preps",
-"meris",
-"spags",
-"fasts",
-"vulns",
-"peeoy",
-"nanua",
-"jomon",
-"humpy",
-"bhels",
-"rhies",
-"jongs",
-"preed",
-"vaxes",
-"apayd",
-"tolyl",
-"bahut",
-"ganef",
-"frist",
-"ahigh",
-"typic",
-"liken",
-"inust",
-"grays",
-"slits",
-"riles",
-"eards",
-"snubs",
-"avize",
-"rammy",
-"bucko",
-"pacey",
-"dirks",
-"sords",
-"indow",
-"chola",
-"yetis",
-"voxel",
-"dovie",
-"telex",
-"admin",
-"cames",
-"kyars",
-"leves",
-"feese",
-"reoil",
-"linin",
-"jocks",
-"bitts",
-"kilns",
-"livre",
-"niefs",
-"stroy",
-"riggs",
-"coned",
-"ympes",
-"cools",
-"fanum",
-"piked",
-"nonyl",
-"blech",
-"silds",
-"courb",
-"sizer",
-"ricey",
-"fixit",
-"duddy",
-"kelps",
-"rased",
-"nudie",
-"breem",
-"zizel",
-"speil",
-"nonet",
-"coyau",
-"upjet",
-"dwang",
-"perai",
-"blook",
-"gynos",
-"sains",
-"tunas",
-"thrip",
-"blate",
-"porno",
-"chews",
-"jarul",
-"toyed",
-"bydes",
-"siles",
-"thagi",
-"logie",
-"strag",
-"runts",
-"reast",
-"talak",
-"cebid",
-"zuppa",
-"douts",
-"isnae",
-"girts",
-"huggy",
-"reran",
-"tabla",
-"pyres",
-"atimy",
-"bubby",
-"bumfs",
-"pilau",
-"hafts",
-"goris",
-"vades",
-"ranee",
-"magot",
-"teras",
-"gusli",
-"talky",
-"aidas",
-"sents",
-"fundy",
-"gores",
-"varna",
-"mauls",
-"noxal",
-"binit",
-"viffs",
-"gawds",
-"spule",
-"artsy",
-"nelly",
-"swore",
-"stown",
-"spoot",
-"hooey",
-"fiscs",
-"cloze",
-"runny",
-"narcs",
-"boobs",
-"piony",
-"bevvy",
-"tweer",
-"feist",
-"knelt",
-"bibes",
-"ratch",
-"autos",
-"erred",
-"warps",
-"blebs",
-"cutup",
-"grypt",
-"maize",
-"gorsy",
-"ursid",
-"zoeae",
-"nakfa",
-"rexes",
-"hyens",
-"clags",
-"goety",
-"etnas",
-"pests",
-"bonks",
-"unban",
-"stums",
-"kited",
-"thaws",
-"dashy",
-"uhlan",
-"wuddy",
-"toter",
-"scrog",
-"kerne",
-"mayos",
-"frier",
-"kondo",
-"chuts",
-"viced",
-"setae",
-"fuzee",
-"tills",
-"ordos",
-"easts",
-"poaka",
-"cusec",
-"vitro",
-"erven",
-"molls",
-"squiz",
-"welds",
-"flawn",
-"buffi",
-"cruck",
-"boyau",
-"drear",
-"redry",
-"prees",
-"antre",
-"tynes",
-"karoo",
-"druxy",
-"ulmin",
-"wases",
-"foids",
-"ruths",
-"hoped",
-"greve",
-"gript",
-"sexes",
-"footy",
-"pheon",
-"glent",
-"sengi",
-"surfs",
-"hests",
-"grize",
-"ahull",
-"flack",
-"skers",
-"hinds",
-"quins",
-"scuba",
-"fawny",
-"banda",
-"adoze",
-"mowed",
-"grego",
-"tased",
-"shewn",
-"satay",
-"pupus",
-"ditts",
-"fayer",
-"kines",
-"hexyl",
-"sybil",
-"curet",
-"thymi",
-"gutta",
-"eyras",
-"poxes",
-"odyls",
-"morns",
-"iodin",
-"pudsy",
-"fritt",
-"denis",
-"thoft",
-"ngoma",
-"benis",
-"grens",
-"teams",
-"gynie",
-"sojus",
-"moans",
-"arnut",
-"courd",
-"eloin",
-"cuzes",
-"moled",
-"burls",
-"whows",
-"barns",
-"hollo",
-"harps",
-"sighs",
-"yapok",
-"kylin",
-"sycee",
-"gimps",
-"mosks",
-"lowan",
-"mambo",
-"cutie",
-"riped",
-"azoth",
-"sotol",
-"steys",
-"trayf",
-"vezir",
-"deedy",
-"gaffs",
-"risky",
-"erupt",
-"camps",
-"tines",
-"ethne",
-"buran",
-"campi",
-"dayan",
-"louma",
-"tuart",
-"cruve",
-"seles",
-"quina",
-"kuzus",
-"furls",
-"woxen",
-"lyard",
-"aloos",
-"splog",
-"yeuks",
-"sault",
-"pimps",
-"nomas",
-"kyats",
-"pryer",
-"recta",
-"raias",
-"cibol",
-"gored",
-"hoxes",
-"duets",
-"hahas",
-"lamps",
-"eched",
-"slaws",
-"egers",
-"iched",
-"trapt",
-"forgo",
-"bales",
-"bices",
-"hippo",
-"zooks",
-"kemps",
-"ortho",
-"newed",
-"clied",
-"wexed",
-"layed",
-"mneme",
-"sophy",
-"yeads",
-"cangs",
-"rears",
-"matte",
-"lovat",
-"wagga",
-"gajos",
-"limes",
-"pyxes",
-"wifed",
-"slane",
-"pipet",
-"stott",
-"cumec",
-"ledgy",
-"dobby",
-"giron",
-"pilae",
-"rejon",
-"aloin",
-"pownd",
-"hoaed",
-"sauts",
-"ridic",
-"biccy",
-"mured",
-"tavas",
-"luter",
-"capas",
-"toons",
-"potsy",
-"dozer",
-"irked",
-"jewie",
-"resay",
-"lohan",
-"vampy",
-"hosel",
-"lifes",
-"ering",
-"dotal",
-"globy",
-"bewig",
-"bogue",
-"wicks",
-"brusk",
-"sizes",
-"shlep",
-"cinct",
-"onely",
-"losen",
-"recut",
-"domic",
-"gaumy",
-"prexy",
-"gaged",
-"zaida",
-"taels",
-"linch",
-"pusle",
-"surer",
-"milfs",
-"gothy",
-"poilu",
-"yarta",
-"kolas",
-"aglus",
-"unarm",
-"pinky",
-"desis",
-"howdy",
-"chals",
-"subby",
-"navar",
-"doved",
-"doula",
-"sleer",
-"zoppa",
-"afald",
-"viewy",
-"auris",
-"fleas",
-"jeely",
-"torot",
-"intel",
-"expos",
-"mujik",
-"beaus",
-"poulp",
-"forks",
-"fubar",
-"remet",
-"cuing",
-"sinhs",
-"skran",
-"skyey",
-"heare",
-"janny",
-"atoke",
-"kinda",
-"twoer",
-"veiny",
-"cowal",
-"nomen",
-"revie",
-"wares",
-"watts",
-"holms",
-"laika",
-"shist",
-"honan",
-"pongs",
-"ragde",
-"stops",
-"ahent",
-"plums",
-"lauds",
-"zerda",
-"arene",
-"kales",
-"tyred",
-"zanza",
-"jeeps",
-"gooby",
-"gaper",
-"yuans",
-"kirri",
-"noyau",
-"tombs",
-"cried",
-"swive",
-"luser",
-"tarsi",
-"briki",
-"forex",
-"euked",
-"tasse",
-"emoji",
-"tyran",
-"gelly",
-"grana",
-"honda",
-"punny",
-"firms",
-"riced",
-"shlub",
-"yupon",
-"forts",
-"dosas",
-"rorty",
-"pesty",
-"cloff",
-"cella",
-"limby",
-"cosie",
-"salut",
-"rayle",
-"soyle",
-"reird",
-"eusol",
-"tuile",
-"dealt",
-"reney",
-"ramps",
-"laith",
-"teers",
-"dooks",
-"sades",
-"tofus",
-"dadas",
-"patsy",
-"drags",
-"horis",
-"delts",
-"cezve",
-"tacts",
-"logoi",
-"baser",
-"syboe",
-"theow",
-"basan",
-"ampul",
-"marle",
-"droog",
-"capes",
-"vodun",
-"zante",
-"marid",
-"tases",
-"krunk",
-"seeld",
-"nebel",
-"prods",
-"fendy",
-"hates",
-"walis",
-"ragee",
-"safed",
-"onlay",
-"hiver",
-"kippa",
-"vatus",
-"wawls",
-"ouphs",
-"runds",
-"nicol",
-"clips",
-"buist",
-"embog",
-"zygal",
-"faine",
-"salep",
-"jakey",
-"pudge",
-"johns",
-"didie",
-"palis",
-"lichi",
-"hawms",
-"waspy",
-"yodle",
-"niner",
-"fugus",
-"deets",
-"opahs",
-"bores",
-"bykes",
-"pinas",
-"kasme",
-"saist",
-"commy",
-"slaps",
-"mouls",
-"epris",
-"winos",
-"yourn",
-"malwa",
-"keech",
-"boogy",
-"frugs",
-"evohe",
-"doted",
-"tabis",
-"plong",
-"pricy",
-"odist",
-"hiant",
-"polis",
-"broos",
-"bruts",
-"trist",
-"noser",
-"rasse",
-"wersh",
-"brosy",
-"gaids",
-"grues",
-"louns",
-"darcy",
-"tomia",
-"mulse",
-"rines",
-"nudes",
-"puers",
-"kiore",
-"biffs",
-"durst",
-"wonky",
-"micht",
-"spaul",
-"prams",
-"kulfi",
-"noops",
-"clast",
-"dowds",
-"harls",
-"yapps",
-"anker",
-"poley",
-"debye",
-"quoll",
-"rayah",
-"kibbi",
-"input",
-"pleon",
-"blert",
-"mohos",
-"oktas",
-"hooky",
-"amped",
-"tipis",
-"rubai",
-"abcee",
-"sprew",
-"sizel",
-"minas",
-"smolt",
-"blads",
-"hashy",
-"gages",
-"divas",
-"zowee",
-"guids",
-"snars",
-"brins",
-"siroc",
-"kents",
-"sykes",
-"morph",
-"ouzos",
-"malik",
-"tohos",
-"adunc",
-"weirs",
-"sends",
-"derma",
-"radii",
-"muggs",
-"serfs",
-"gawcy",
-"hygge",
-"murly",
-"soger",
-"grufe",
-"linos",
-"pudus",
-"stims",
-"fleam",
-"jawan",
-"bates",
-"urned",
-"frits",
-"celeb",
-"mochs",
-"rehem",
-"meves",
-"skeps",
-"prana",
-"fizzy",
-"vowed",
-"chace",
-"dowls",
-"tweel",
-"speld",
-"enfix",
-"nitre",
-"kokam",
-"bucku",
-"gaucy",
-"moove",
-"skite",
-"girrs",
-"novas",
-"fugie",
-"kissy",
-"coomy",
-"mikes",
-"tawas",
-"vutty",
-"saags",
-"cyber",
-"wames",
-"beton",
-"bilby",
-"sohur",
-"labia",
-"zebec",
-"alews",
-"gnats",
-"lepta",
-"alant",
-"limma",
-"porty",
-"wined",
-"urite",
-"pappy",
-"genes",
-"saola",
-"bosie",
-"pease",
-"pouke",
-"pinny",
-"sexer",
-"paged",
-"slews",
-"steil",
-"laris",
-"muser",
-"ranke",
-"goads",
-"cyans",
-"ashet",
-"progs",
-"garbs",
-"reate",
-"zimbs",
-"keema",
-"leare",
-"tarre",
-"toled",
-"rales",
-"wraps",
-"battu",
-"doody",
-"achoo",
-"deled",
-"puces",
-"zinco",
-"abask",
-"maron",
-"outro",
-"doven",
-"paver",
-"spewy",
-"bedes",
-"wally",
-"pales",
-"fanks",
-"forel",
-"anata",
-"skyte",
-"winze",
-"shama",
-"barny",
-"dimbo",
-"glees",
-"deawy",
-"nudzh",
-"grouf",
-"kyaks",
-"felid",
-"yawed",
-"wools",
-"codas",
-"simps",
-"ratty",
-"spaes",
-"enure",
-"slorm",
-"sarge",
-"woold",
-"mhorr",
-"objet",
-"ulzie",
-"xylol",
-"ooped",
-"emule",
-"apiol",
-"paren",
-"culet",
-"gyros",
-"koras",
-"conus",
-"fills",
-"decad",
-"slugs",
-"mucks",
-"vlogs",
-"tokes",
-"kokum",
-"goals",
-"bombe",
-"emeus",
-"nebek",
-"falaj",
-"pulps",
-"tewel",
-"newbs",
-"rohes",
-"toted",
-"nucha",
-"poind",
-"avels",
-"arefy",
-"kauru",
-"lenos",
-"himbo",
-"alcos",
-"pixie",
-"nival",
-"bisom",
-"garms",
-"dolos",
-"teaed",
-"arear",
-"kakas",
-"whipt",
-"bokes",
-"blatt",
-"fogle",
-"loral",
-"louie",
-"towed",
-"bajus",
-"bared",
-"trooz",
-"waged",
-"mowas",
-"mihis",
-"triff",
-"mochy",
-"nauch",
-"adsum",
-"flaks",
-"snots",
-"finks",
-"agloo",
-"posit",
-"setal",
-"bonie",
-"newie",
-"coved",
-"dores",
-"lutea",
-"gadge",
-"japed",
-"socks",
-"jupon",
-"wefte",
-"soler",
-"clays",
-"druse",
-"hunky",
-"nowty",
-"dynes",
-"sutra",
-"hotly",
-"devos",
-"gryce",
-"pelas",
-"rubin",
-"lamer",
-"plesh",
-"spims",
-"urvas",
-"viers",
-"septs",
-"jaups",
-"alure",
-"jiffs",
-"andro",
-"gadis",
-"stows",
-"kulan",
-"aguna",
-"bulgy",
-"caphs",
-"ponga",
-"foxed",
-"aches",
-"toppy",
-"gormy",
-"drant",
-"erics",
-"alvar",
-"neifs",
-"addio",
-"wetas",
-"login",
-"geyan",
-"roons",
-"lyams",
-"lisks",
-"tames",
-"iches",
-"smeek",
-"ganof",
-"hided",
-"stime",
-"qaids",
-"coomb",
-"doobs",
-"hazan",
-"mower",
-"tulpa",
-"mayed",
-"tubae",
-"puffs",
-"boche",
-"caneh",
-"curbs",
-"rykes",
-"breys",
-"chank",
-"avine",
-"garni",
-"liney",
-"zooea",
-"annat",
-"garum",
-"ethal",
-"skell",
-"veles",
-"kests",
-"wojus",
-"ghees",
-"jowls",
-"reiks",
-"nerds",
-"motza",
-"buoys",
-"kliks",
-"diced",
-"repot",
-"warms",
-"ummed",
-"doxes",
-"dynel",
-"jeffs",
-"yeggs",
-"boffs",
-"dusts",
-"ranga",
-"kipps",
-"blurs",
-"orate",
-"bawns",
-"mungs",
-"yelms",
-"feart",
-"arnas",
-"nitro",
-"dulls",
-"swack",
-"mashy",
-"feyer",
-"wongi",
-"suids",
-"izzat",
-"cobza",
-"mires",
-"neume",
-"hanks",
-"stilb",
-"poked",
-"roust",
-"gluer",
-"turms",
-"mooly",
-"parle",
-"azurn",
-"quaky",
-"deshi",
-"yales",
-"boyfs",
-"trugo",
-"lardy",
-"wangs",
-"riata",
-"tzars",
-"biome",
-"lomes",
-"tenes",
-"unbox",
-"bears",
-"segol",
-"glute",
-"smuts",
-"thesp",
-"nalla",
-"kakis",
-"pical",
-"roguy",
-"voids",
-"fumet",
-"whios",
-"almas",
-"dikey",
-"coffs",
-"kefir",
-"aquae",
-"wrast",
-"civvy",
-"carap",
-"yelps",
-"prial",
-"lyase",
-"reame",
-"maneb",
-"boffo",
-"resow",
-"lusks",
-"exons",
-"byrls",
-"raids",
-"kalam",
-"flump",
-"raine",
-"flams",
-"hoers",
-"titis",
-"whang",
-"huers",
-"arcos",
-"funks",
-"slish",
-"pures",
-"padri",
-"siver",
-"drave",
-"yoofs",
-"symar",
-"belga",
-"ronde",
-"shins",
-"penna",
-"baisa",
-"igapo",
-"lammy",
-"treen",
-"slyer",
-"yucch",
-"oinks",
-"baels",
-"foals",
-"orant",
-"machi",
-"nohow",
-"sicky",
-"ochry",
-"cacas",
-"bouns",
-"incel",
-"triol",
-"nuffs",
-"taxed",
-"galea",
-"wowee",
-"skees",
-"sudds",
-"zineb",
-"diels",
-"miche",
-"morts",
-"hangi",
-"wushu",
-"dalis",
-"specs",
-"gopik",
-"biked",
-"joles",
-"filmi",
-"vexes",
-"pogos",
-"cyano",
-"raths",
-"ligan",
-"tacan",
-"doles",
-"novum",
-"cohoe",
-"baaed",
-"sugos",
-"garre",
-"mulls",
-"kedgy",
-"sieth",
-"kelts",
-"oshac",
-"coala",
-"swims",
-"wrawl",
-"koffs",
-"deman",
-"pally",
-"demit",
-"shops",
-"jells",
-"fract",
-"forze",
-"hafiz",
-"kypes",
-"segue",
-"souts",
-"biner",
-"leans",
-"axmen",
-"vinos",
-"upter",
-"fjeld",
-"lefty",
-"gobos",
-"nitry",
-"incog",
-"bimas",
-"torrs",
-"caver",
-"dares",
-"kaing",
-"harks",
-"bents",
-"flong",
-"retag",
-"clows",
-"heals",
-"jambs",
-"gigot",
-"bayer",
-"cardi",
-"plica",
-"piler",
-"onium",
-"busty",
-"odors",
-"glibs",
-"gombo",
-"yelks",
-"tanhs",
-"ippon",
-"gamme",
-"hiply",
-"ergon",
-"pases",
-"limns",
-"bowet",
-"aider",
-"stunk",
-"fleek",
-"scaff",
-"podex",
-"suets",
-"robed",
-"huhus",
-"fugle",
-"fonly",
-"pooka",
-"ricks",
-"dodos",
-"goony",
-"harim",
-"snaps",
-"tasar",
-"saids",
-"pisky",
-"blaff",
-"lolls",
-"alums",
-"orval",
-"purls",
-"shuns",
-"snoot",
-"rewax",
-"upsee",
-"poney",
-"kamas",
-"stopt",
-"gawps",
-"hudud",
-"mumus",
-"leccy",
-"fauns",
-"ogres",
-"urate",
-"kaika",
-"hakus",
-"coils",
-"docos",
-"becke",
-"tikas",
-"shojo",
-"sabre",
-"junks",
-"fuero",
-"tiyns",
-"kubie",
-"muted",
-"porae",
-"abear",
-"mangs",
-"rigol",
-"yippy",
-"urubu",
-"amate",
-"readd",
-"flaps",
-"nolls",
-"doabs",
-"eches",
-"ident",
-"neums",
-"fauve",
-"filed",
-"rojis",
-"urbex",
-"wanks",
-"faked",
-"rakis",
-"defog",
-"poovy",
-"dormy",
-"emics",
-"lunas",
-"knowe",
-"rumes",
-"gryke",
-"jatos",
-"wootz",
-"barca",
-"isles",
-"wheen",
-"legge",
-"eased",
-"topis",
-"gyres",
-"gompa",
-"bally",
-"hansa",
-"deans",
-"flisk",
-"genro",
-"tubes",
-"oidia",
-"cives",
-"tarns",
-"lawed",
-"fifes",
-"mekka",
-"culti",
-"zones",
-"merls",
-"undee",
-"khafs",
-"sarin",
-"cinqs",
-"jambu",
-"yampy",
-"perve",
-"salat",
-"moted",
-"crans",
-"zanze",
-"haets",
-"pined",
-"orixa",
-"kutus",
-"trons",
-"yumps",
-"chimb",
-"sigla",
-"scows",
-"doona",
-"caboc",
-"lezes",
-"sampi",
-"weros",
-"pibal",
-"kulak",
-"blobs",
-"sinky",
-"carns",
-"dhuti",
-"ferly",
-"obits",
-"bakes",
-"eyass",
-"gypos",
-"kecks",
-"gleds",
-"kazis",
-"pirls",
-"tinds",
-"bools",
-"manky",
-"kalis",
-"touts",
-"gimme",
-"gazes",
-"lathy",
-"manat",
-"hends",
-"mouch",
-"lurve",
-"trabs",
-"fawns",
-"whump",
-"lewis",
-"smaik",
-"hefts",
-"bigae",
-"mamee",
-"qophs",
-"mayas",
-"capex",
-"nould",
-"sells",
-"wauks",
-"yecch",
-"cosec",
-"flaws",
-"koses",
-"konbu",
-"glime",
-"sanes",
-"emirs",
-"fowth",
-"pelfs",
-"motey",
-"cusps",
-"soyas",
-"loure",
-"soces",
-"xysts",
-"shier",
-"exurb",
-"potin",
-"shuln",
-"lawer",
-"pyran",
-"bardo",
-"salpa",
-"pirns",
-"poule",
-"taluk",
-"snaws",
-"adrad",
-"cells",
-"anyon",
-"teels",
-"durgy",
-"gliff",
-"rache",
-"titty",
-"froze",
-"oared",
-"lapje",
-"gudes",
-"coset",
-"cedis",
-"byked",
-"dinar",
-"hykes",
-"avgas",
-"esker",
-"tossy",
-"cours",
-"yeses",
-"awork",
-"iodic",
-"sudor",
-"clats",
-"ozeki",
-"pelts",
-"semie",
-"namer",
-"feued",
-"goier",
-"golds",
-"meane",
-"clame",
-"kendo",
-"mints",
-"arles",
-"ugged",
-"dunks",
-"welke",
-"xoana",
-"tifts",
-"skets",
-"shool",
-"chott",
-"hiois",
-"coria",
-"wheys",
-"pooed",
-"crios",
-"crepy",
-"quant",
-"yuppy",
-"yagis",
-"rakus",
-"spets",
-"atmos",
-"bourg",
-"curfs",
-"samfu",
-"acyls",
-"unlaw",
-"richt",
-"brose",
-"mebos",
-"immew",
-"muxes",
-"longs",
-"zimbi",
-"choof",
-"pacts",
-"drows",
-"awdls",
-"duroc",
-"stats",
-"malam",
-"pucka",
-"arroz",
-"myall",
-"ayrie",
-"shris",
-"urbia",
-"absit",
-"xenia",
-"plans",
-"fasti",
-"herby",
-"wedel",
-"utile",
-"dirls",
-"nippy",
-"volks",
-"wines",
-"aumil",
-"pohed",
-"deice",
-"whits",
-"ginks",
-"bronc",
-"rayne",
-"shuls",
-"abaka",
-"letch",
-"paiks",
-"murra",
-"panty",
-"sayon",
-"roans",
-"clapt",
-"tsadi",
-"botty",
-"scoup",
-"bowne",
-"drest",
-"ouens",
-"denes",
-"turps",
-"hallo",
-"cylix",
-"gerne",
-"stong",
-"bhaji",
-"meeds",
-"chico",
-"sasse",
-"podgy",
-"cuish",
-"joeys",
-"motes",
-"ceroc",
-"damme",
-"loden",
-"beare",
-"zurfs",
-"korma",
-"kawas",
-"remex",
-"howre",
-"acing",
-"moria",
-"agene",
-"enorm",
-"kants",
-"fados",
-"coxal",
-"kukri",
-"chirm",
-"stich",
-"sweir",
-"margs",
-"upbow",
-"cauls",
-"penne",
-"romal",
-"indie",
-"duros",
-"atria",
-"frory",
-"defis",
-"culty",
-"abrim",
-"flirs",
-"gybed",
-"gibes",
-"grece",
-"thelf",
-"thema",
-"yogis",
-"umble",
-"jimpy",
-"gamps",
-"mythy",
-"curst",
-"yomps",
-"quena",
-"duper",
-"quayd",
-"babul",
-"bajan",
-"percs",
-"renga",
-"gairs",
-"guiro",
-"sieur",
-"sakia",
-"waffs",
-"paska",
-"oncet",
-"ruche",
-"frees",
-"seams",
-"casks",
-"cohab",
-"rives",
-"sheds",
-"forme",
-"telae",
-"tendu",
-"buffy",
-"serry",
-"heugh",
-"knaur",
-"coady",
-"gulps",
-"snugs",
-"tabun",
-"ohias",
-"hokis",
-"envoi",
-"refed",
-"jello",
-"lavas",
-"stipa",
-"floes",
-"kluge",
-"nimbs",
-"dunsh",
-"crews",
-"goxes",
-"rizas",
-"surfy",
-"towze",
-"nexts",
-"tiyin",
-"humic",
-"peans",
-"mecks",
-"puked",
-"weets",
-"hewed",
-"geode",
-"tosas",
-"nowls",
-"roums",
-"pance",
-"shaws",
-"ginge",
-"divna",
-"neper",
-"yowza",
-"clomb",
-"rewon",
-"haves",
-"mythi",
-"apeak",
-"spaer",
-"youks",
-"leuch",
-"hault",
-"yonis",
-"exfil",
-"lumps",
-"tache",
-"pelta",
-"wails",
-"wiped",
-"chics",
-"poral",
-"marse",
-"petre",
-"faery",
-"indol",
-"mondo",
-"ronts",
-"bunde",
-"hayey",
-"sheas",
-"curch",
-"laxes",
-"merde",
-"jonty",
-"cymae",
-"lazos",
-"wells",
-"raggy",
-"pardi",
-"leers",
-"ettle",
-"sarky",
-"huffs",
-"clote",
-"trogs",
-"tamps",
-"dicts",
-"sials",
-"pelma",
-"pokie",
-"heder",
-"boney",
-"hemps",
-"gugas",
-"oobit",
-"crogs",
-"xerus",
-"glift",
-"bings",
-"jotty",
-"trefa",
-"macle",
-"unzip",
-"bongs",
-"diact",
-"bares",
-"heeds",
-"resid",
-"lings",
-"noily",
-"baurs",
-"makar",
-"whift",
-"melds",
-"reamy",
-"crons",
-"hijra",
-"soken",
-"trued",
-"upbye",
-"darns",
-"snipy",
-"fired",
-"milds",
-"cloke",
-"stobs",
-"coppy",
-"cohog",
-"feebs",
-"souct",
-"pling",
-"heyed",
-"dunes",
-"abmho",
-"biros",
-"bhais",
-"vuggs",
-"scrae",
-"anura",
-"okras",
-"mizzy",
-"aight",
-"lummy",
-"neddy",
-"macer",
-"roopy",
-"zills",
-"vughs",
-"ruffs",
-"czars",
-"lingy",
-"glace",
-"crits",
-"kerbs",
-"oracy",
-"aggie",
-"beaky",
-"orcas",
-"vauch",
-"cleve",
-"gundy",
-"conky",
-"nandu",
-"teats",
-"guqin",
-"guana",
-"thous",
-"chark",
-"vents",
-"speks",
-"wonga",
-"soral",
-"busts",
-"siler",
-"undug",
-"klett",
-"acker",
-"repos",
-"stedd",
-"ditzy",
-"mommy",
-"trant",
-"osmol",
-"skelp",
-"deare",
-"sines",
-"deles",
-"yukos",
-"monos",
-"pugil",
-"roshi",
-"gippy",
-"baldy",
-"minny",
-"shope",
-"dunts",
-"arepa",
-"fyked",
-"teene",
-"ezine",
-"duett",
-"sippy",
-"wenge",
-"ajiva",
-"lants",
-"neral",
-"yexed",
-"ombre",
-"degas",
-"lacey",
-"fritz",
-"kaifs",
-"flics",
-"caped",
-"rishi",
-"muntu",
-"ohone",
-"uncus",
-"leats",
-"telco",
-"licks",
-"dongs",
-"numbs",
-"samek",
-"kinin",
-"blaws",
-"glial",
-"luged",
-"nerka",
-"nidal",
-"arias",
-"ticed",
-"lieve",
-"gerah",
-"veeps",
-"mucho",
-"kibes",
-"inwit",
-"murti",
-"balus",
-"prows",
-"alane",
-"sools",
-"zaris",
-"humfs",
-"fleys",
-"choco",
-"wenny",
-"barps",
-"besit",
-"pints",
-"thewy",
-"bepat",
-"fifed",
-"cajon",
-"smarm",
-"lowes",
-"orang",
-"azury",
-"waift",
-"derns",
-"vacua",
-"elute",
-"gopak",
-"brent",
-"linga",
-"linns",
-"sunna",
-"agars",
-"faver",
-"aunes",
-"weens",
-"acock",
-"fries",
-"decor",
-"murks",
-"trems",
-"mases",
-"shogs",
-"satai",
-"owche",
-"prays",
-"zoaea",
-"haiks",
-"mavie",
-"stylo",
-"pagod",
-"blunk",
-"gazoo",
-"harns",
-"oflag",
-"quist",
-"rewin",
-"lieus",
-"evets",
-"sauch",
-"anana",
-"dikes",
-"punks",
-"gonef",
-"eniac",
-"keeno",
-"alary",
-"musts",
-"japer",
-"spyal",
-"mumms",
-"luces",
-"sumis",
-"fayed",
-"rudes",
-"cyclo",
-"linny",
-"ogmic",
-"ummah",
-"baboo",
-"aides",
-"gauch",
-"trigs",
-"hurts",
-"direr",
-"cuifs",
-"meint",
-"warts",
-"cesta",
-"ootid",
-"ancle",
-"deked",
-"holed",
-"inned",
-"maiko",
-"effed",
-"perts",
-"glike",
-"jafas",
-"hutia",
-"humps",
-"menad",
-"bowse",
-"dater",
-"sicks",
-"slobs",
-"groma",
-"skids",
-"jehus",
-"arses",
-"wowed",
-"yfere",
-"furrs",
-"toros",
-"droid",
-"marka",
-"ycond",
-"skatt",
-"hoven",
-"meows",
-"seeks",
-"almud",
-"darbs",
-"ajies",
-"confs",
-"cerne",
-"kumis",
-"reifs",
-"discs",
-"moats",
-"enmew",
-"shims",
-"nahal",
-"stirs",
-"unmew",
-"torts",
-"tholi",
-"freon",
-"unbag",
-"axles",
-"razoo",
-"pukas",
-"peavy",
-"rants",
-"goory",
-"adzes",
-"zippy",
-"phuts",
-"kyloe",
-"dudes",
-"yetts",
-"gwine",
-"shaya",
-"trams",
-"untax",
-"murls",
-"gaols",
-"jasey",
-"stend",
-"gaups",
-"upled",
-"sorbs",
-"biker",
-"dreed",
-"troad",
-"dawah",
-"danny",
-"quims",
-"emove",
-"kembo",
-"targe",
-"baned",
-"currs",
-"jalop",
-"cants",
-"tewed",
-"apaid",
-"touks",
-"farls",
-"pimas",
-"abamp",
-"biogs",
-"fugio",
-"unlay",
-"canso",
-"yeuky",
-"duces",
-"tosed",
-"ables",
-"zoris",
-"lupin",
-"rosti",
-"tsade",
-"basse",
-"rotas",
-"auloi",
-"dings",
-"frena",
-"telic",
-"wilco",
-"spies",
-"hajes",
-"skied",
-"palla",
-"swamy",
-"labis",
-"acnes",
-"varus",
-"winna",
-"jubes",
-"shoyu",
-"enurn",
-"maths",
-"felty",
-"casts",
-"peart",
-"mirin",
-"seity",
-"lycee",
-"degum",
-"basti",
-"mewls",
-"zinky",
-"mirza",
-"plues",
-"fezzy",
-"ponts",
-"helio",
-"frorn",
-"folky",
-"sugan",
-"anole",
-"skelf",
-"furth",
-"musth",
-"moers",
-"kalif",
-"retie",
-"naans",
-"veena",
-"curny",
-"katis",
-"rooty",
-"hypes",
-"kyack",
-"blawn",
-"weans",
-"calps",
-"regar",
-"lurks",
-"wicca",
-"koori",
-"pipul",
-"praus",
-"soils",
-"fonds",
-"ouped",
-"varve",
-"frere",
-"jiggy",
-"visne",
-"neath",
-"nowed",
-"sawer",
-"races",
-"flitt",
-"molla",
-"pages",
-"escar",
-"cesti",
-"ousts",
-"email",
-"omovs",
-"unsod",
-"geeky",
-"bolas",
-"ronin",
-"rosed",
-"hoten",
-"naifs",
-"flyby",
-"boxla",
-"herns",
-"lowed",
-"reest",
-"dript",
-"seely",
-"korun",
-"agmas",
-"tains",
-"lemed",
-"sicko",
-"domal",
-"zhomo",
-"soldo",
-"unlit",
-"comps",
-"proas",
-"meers",
-"waide",
-"olent",
-"wakes",
-"dozed",
-"meved",
-"hokum",
-"womyn",
-"freet",
-"debus",
-"goyle",
-"folia",
-"rindy",
-"grege",
-"hobos",
-"bolix",
-"deash",
-"chemo",
-"bidis",
-"gighe",
-"kurus",
-"deaws",
-"geoid",
-"caaed",
-"karsy",
-"kranz",
-"gabby",
-"revet",
-"pecks",
-"chavs",
-"karos",
-"kvell",
-"tabus",
-"quays",
-"geest",
-"skogs",
-"demob",
-"treed",
-"gogos",
-"nards",
-"woful",
-"tries",
-"smees",
-"quare",
-"avise",
-"suing",
-"seism",
-"sowse",
-"stane",
-"clons",
-"scrob",
-"tours",
-"uncia",
-"cadie",
-"mises",
-"karri",
-"reens",
-"noway",
-"quyte",
-"guyed",
-"gunny",
-"pisos",
-"scoug",
-"lakes",
-"tigon",
-"erned",
-"hyper",
-"nifty",
-"bogan",
-"prier",
-"sined",
-"wurst",
-"fouat",
-"vairy",
-"widdy",
-"spile",
-"acers",
-"kades",
-"wifes",
-"gadid",
-"vaned",
-"janns",
-"pilaw",
-"lycra",
-"limbi",
-"waurs",
-"vimen",
-"braza",
-"sadis",
-"tondo",
-"krais",
-"resaw",
-"spacy",
-"pinks",
-"fayne",
-"sazes",
-"joked",
-"grise",
-"culch",
-"micky",
-"putti",
-"toran",
-"vichy",
-"acari",
-"imped",
-"scatt",
-"kelpy",
-"gapos",
-"copen",
-"fands",
-"dumbs",
-"hains",
-"chias",
-"shiai",
-"shaps",
-"napas",
-"rubes",
-"camis",
-"lurex",
-"drabs",
-"dojos",
-"bapus",
-"laldy",
-"aurei",
-"gymps",
-"dinge",
-"serra",
-"fremd",
-"gouch",
-"dancy",
-"neems",
-"roups",
-"chads",
-"boule",
-"luvvy",
-"braxy",
-"marms",
-"loris",
-"doorn",
-"amins",
-"sobas",
-"spars",
-"halfs",
-"coups",
-"kanes",
-"maned",
-"getup",
-"brods",
-"poort",
-"terns",
-"karas",
-"gilly",
-"towzy",
-"buras",
-"fecht",
-"oxers",
-"junky",
-"lairy",
-"zibet",
-"typps",
-"dagos",
-"suint",
-"moits",
-"nouns",
-"fauts",
-"stear",
-"yucas",
-"grrls",
-"koans",
-"bingy",
-"recks",
-"cooer",
-"ahuru",
-"looed",
-"calfs",
-"obole",
-"duroy",
-"booky",
-"vares",
-"cocas",
-"arish",
-"indew",
-"ducky",
-"iambi",
-"wilja",
-"lotes",
-"bemad",
-"sklim",
-"waxer",
-"sacks",
-"howbe",
-"apeek",
-"etats",
-"rakia",
-"mesal",
-"unify",
-"sours",
-"lawin",
-"muley",
-"roven",
-"exeem",
-"skats",
-"whear",
-"quonk",
-"refel",
-"whews",
-"smaze",
-"ureal",
-"laree",
-"blype",
-"velum",
-"haggs",
-"absey",
-"goers",
-"panda",
-"coirs",
-"crame",
-"paras",
-"stots",
-"milos",
-"curns",
-"parps",
-"gursh",
-"knags",
-"meads",
-"grovy",
-"outta",
-"smoot",
-"parra",
-"masty",
-"wroot",
-"sauls",
-"ihram",
-"duffs",
-"newer",
-"ridgy",
-"iglus",
-"hokku",
-"meany",
-"fluor",
-"eking",
-"ponce",
-"farts",
-"saker",
-"crost",
-"awing",
-"kithe",
-"lasts",
-"crise",
-"spugs",
-"loued",
-"taces",
-"embus",
-"toras",
-"sekos",
-"namma",
-"jolty",
-"lassy",
-"gyppy",
-"profs",
-"chimp",
-"nerks",
-"dykon",
-"mazut",
-"yurta",
-"perps",
-"scyes",
-"puton",
-"tetes",
-"crems",
-"tolly",
-"gally",
-"volte",
-"brers",
-"chevy",
-"nagas",
-"gipsy",
-"quads",
-"aways",
-"gobar",
-"imino",
-"zorro",
-"wagyu",
-"munis",
-"wifty",
-"dazer",
-"tuffs",
-"capul",
-"carvy",
-"ached",
-"pareu",
-"ramal",
-"armer",
-"sonsy",
-"moils",
-"lurer",
-"blits",
-"brule",
-"erick",
-"duked",
-"yorks",
-"mozed",
-"moobs",
-"cowls",
-"bazoo",
-"obied",
-"crusy",
-"hones",
-"kicky",
-"rimed",
-"bunce",
-"arvee",
-"syens",
-"comus",
-"peels",
-"gases",
-"veale",
-"snoke",
-"tomos",
-"rated",
-"meals",
-"semis",
-"cahow",
-"taals",
-"mauts",
-"aking",
-"sinds",
-"iroko",
-"mirvs",
-"pervo",
-"rebec",
-"torsk",
-"canid",
-"blats",
-"delos",
-"sipes",
-"eeven",
-"unlet",
-"flexo",
-"owrie",
-"pekoe",
-"weeks",
-"qibla",
-"geits",
-"boeps",
-"nabes",
-"lulus",
-"naevi",
-"vangs",
-"dhikr",
-"pikau",
-"skail",
-"tryke",
-"wauff",
-"pated",
-"swits",
-"kexes",
-"mihas",
-"pupae",
-"slogs",
-"noons",
-"raffs",
-"hyson",
-"astun",
-"mulie",
-"gobby",
-"aliya",
-"ditas",
-"sinks",
-"spins",
-"tawts",
-"tassa",
-"rotal",
-"buats",
-"jokey",
-"waacs",
-"capos",
-"wilts",
-"diwan",
-"rotis",
-"yawps",
-"baccy",
-"wulls",
-"urase",
-"fouds",
-"ronte",
-"kesar",
-"ulnad",
-"riffs",
-"rifts",
-"ceorl",
-"flite",
-"tufty",
-"grots",
-"kindy",
-"tiffs",
-"sidha",
-"gauds",
-"joyed",
-"pikul",
-"muzak",
-"dsobo",
-"shads",
-"doxie",
-"yourt",
-"meted",
-"belar",
-"doggy",
-"arsis",
-"probs",
-"sapan",
-"kanga",
-"nonis",
-"daals",
-"sture",
-"cists",
-"aggri",
-"lemme",
-"quich",
-"thirl",
-"peece",
-"lumas",
-"lited",
-"sharn",
-"ivies",
-"apods",
-"farcy",
-"icons",
-"lamas",
-"avers",
-"tinty",
-"skosh",
-"stire",
-"flabs",
-"bobac",
-"strak",
-"vivas",
-"ragga",
-"joled",
-"nooks",
-"eyots",
-"tomes",
-"poddy",
-"reais",
-"khans",
-"aunts",
-"divos",
-"oldie",
-"manga",
-"porns",
-"alkie",
-"puggy",
-"doree",
-"loric",
-"guaco",
-"kutis",
-"monks",
-"celli",
-"weils",
-"rudas",
-"rewed",
-"bezes",
-"hulls",
-"cowry",
-"skyrs",
-"soots",
-"spait",
-"etuis",
-"wonts",
-"zoppo",
-"neele",
-"kudos",
-"ishes",
-"kabar",
-"gesso",
-"flubs",
-"cutis",
-"swops",
-"navew",
-"khazi",
-"donsy",
-"kelim",
-"yirrs",
-"viner",
-"fouth",
-"scray",
-"begat",
-"easle",
-"topoi",
-"egmas",
-"preop",
-"ceria",
-"plink",
-"haems",
-"caged",
-"parks",
-"chams",
-"sprod",
-"abler",
-"fulls",
-"moile",
-"sayed",
-"syrah",
-"clavi",
-"hulas",
-"scans",
-"rangs",
-"gnaws",
-"bawls",
-"laers",
-"tunds",
-"cloys",
-"sneap",
-"grees",
-"cades",
-"nemns",
-"nevel",
-"noirs",
-"zupan",
-"mooed",
-"lauch",
-"orfes",
-"poems",
-"brane",
-"purin",
-"sensa",
-"scuse",
-"arett",
-"empts",
-"geums",
-"felly",
-"jaaps",
-"dholl",
-"stuns",
-"furzy",
-"vices",
-"katti",
-"tilak",
-"boors",
-"iotas",
-"gummi",
-"musit",
-"mutha",
-"moths",
-"strad",
-"shute",
-"taroc",
-"thees",
-"imams",
-"ebons",
-"nuked",
-"caird",
-"enlit",
-"abris",
-"sowar",
-"wolds",
-"festa",
-"feeds",
-"bowes",
-"rumps",
-"tacho",
-"gungy",
-"doucs",
-"waled",
-"doole",
-"purer",
-"condo",
-"thanx",
-"pwned",
-"tuxes",
-"moggy",
-"troys",
-"whata",
-"sajou",
-"rewan",
-"esses",
-"brags",
-"renne",
-"wents",
-"mercs",
-"dhaks",
-"carls",
-"kerfs",
-"turme",
-"maror",
-"cruft",
-"emote",
-"thrae",
-"milor",
-"flips",
-"wayed",
-"deals",
-"hejra",
-"uprun",
-"shule",
-"runch",
-"mixes",
-"loper",
-"ossia",
-"oulks",
-"twink",
-"tafia",
-"homas",
-"dials",
-"tirls",
-"wonks",
-"quair",
-"breid",
-"acton",
-"sease",
-"wekas",
-"amaut",
-"soily",
-"boppy",
-"holon",
-"fetas",
-"moder",
-"favas",
-"lazar",
-"blags",
-"meiny",
-"dinic",
-"pails",
-"esile",
-"stere",
-"vives",
-"tetri",
-"cloam",
-"staws",
-"shahs",
-"bergs",
-"japes",
-"dawed",
-"gonzo",
-"sorbo",
-"ngaio",
-"peize",
-"glads",
-"borgo",
-"kawed",
-"mpret",
-"vibey",
-"dufus",
-"haafs",
-"owres",
-"lubra",
-"peyse",
-"duals",
-"kiddo",
-"merks",
-"pinup",
-"hived",
-"haith",
-"elmen",
-"pulls",
-"riven",
-"enzym",
-"aiery",
-"wavey",
-"ensew",
-"poopy",
-"rezes",
-"pekin",
-"jills",
-"rheas",
-"gushy",
-"nuder",
-"kheth",
-"hewgh",
-"ureic",
-"dikas",
-"tappa",
-"neeld",
-"slipe",
-"loads",
-"firks",
-"senas",
-"melts",
-"urges",
-"melty",
-"beals",
-"thack",
-"wills",
-"plumy",
-"almah",
-"rater",
-"gaitt",
-"proms",
-"kisan",
-"sairs",
-"phono",
-"kirby",
-"sutta",
-"execs",
-"agley",
-"awave",
-"calix",
-"ludes",
-"boral",
-"downa",
-"liers",
-"goors",
-"nemas",
-"rabis",
-"picks",
-"jouks",
-"pervs",
-"thowl",
-"jibed",
-"topes",
-"lense",
-"wides",
-"basen",
-"sones",
-"awash",
-"vibex",
-"aredd",
-"vawte",
-"oleos",
-"howls",
-"hoied",
-"oumas",
-"pooja",
-"piths",
-"fohns",
-"males",
-"coley",
-"dzhos",
-"ayahs",
-"rafts",
-"monie",
-"wytes",
-"etwee",
-"hales",
-"unhip",
-"arval",
-"loped",
-"stank",
-"shily",
-"udals",
-"fribs",
-"skyre",
-"crwth",
-"ceils",
-"shags",
-"wrick",
-"whamo",
-"dates",
-"yacks",
-"volti",
-"riels",
-"yulan",
-"tones",
-"gawks",
-"soaps",
-"desse",
-"tikis",
-"turds",
-"fakes",
-"chawk",
-"sonse",
-"vised",
-"shchi",
-"thein",
-"regos",
-"poult",
-"twyer",
-"oxter",
-"rawly",
-"aryls",
-"perce",
-"snods",
-"tawie",
-"sawah",
-"monty",
-"gamer",
-"smirs",
-"dared",
-"coops",
-"quods",
-"lamby",
-"draws",
-"dipso",
-"gecks",
-"belee",
-"fiere",
-"spued",
-"erevs",
-"dinks",
-"lysed",
-"spoom",
-"duels",
-"rores",
-"larnt",
-"blabs",
-"cries",
-"laari",
-"grapy",
-"caums",
-"tolan",
-"lutes",
-"refry",
-"hokey",
-"guyse",
-"sansa",
-"besat",
-"inbox",
-"swail",
-"kofta",
-"libri",
-"bunia",
-"visie",
-"derth",
-"happi",
-"gryde",
-"hempy",
-"bundu",
-"hoppy",
-"bawks",
-"cursi",
-"yince",
-"ceros",
-"hives",
-"karzy",
-"hents",
-"tires",
-"leres",
-"telos",
-"lemel",
-"tondi",
-"maven",
-"leary",
-"cubes",
-"gites",
-"zines",
-"saith",
-"kohen",
-"metre",
-"cutes",
-"bitos",
-"savoy",
-"henny",
-"mirky",
-"becap",
-"poufs",
-"ploys",
-"swire",
-"jaxie",
-"trots",
-"poxed",
-"dyked",
-"dimps",
-"zymic",
-"zendo",
-"yangs",
-"inbye",
-"fraim",
-"ciels",
-"raked",
-"phpht",
-"bicep",
-"sabes",
-"cones",
-"trims",
-"nepit",
-"ceder",
-"madge",
-"tryma",
-"bluey",
-"leams",
-"mirly",
-"opter",
-"gouts",
-"yawns",
-"speel",
-"botel",
-"mules",
-"mento",
-"tyees",
-"sargo",
-"zilla",
-"acini",
-"nance",
-"waulk",
-"lambs",
-"bassy",
-"ulpan",
-"hoops",
-"minge",
-"women",
-"ruing",
-"coses",
-"vilde",
-"hears",
-"soras",
-"pauas",
-"hetes",
-"saman",
-"ratal",
-"foxie",
-"pratt",
-"picas",
-"nocks",
-"treif",
-"leant",
-"chaco",
-"slips",
-"furry",
-"dowed",
-"myopy",
-"zoeal",
-"doyly",
-"rises",
-"sooey",
-"smews",
-"repeg",
-"cines",
-"calmy",
-"dosha",
-"prigs",
-"aweto",
-"spalt",
-"rebar",
-"luxer",
-"hohed",
-"speer",
-"beaks",
-"rynds",
-"ambos",
-"speir",
-"glues",
-"boite",
-"deely",
-"redye",
-"fungs",
-"goeth",
-"samey",
-"dryly",
-"gogga",
-"subah",
-"deffo",
-"cavas",
-"drams",
-"twaes",
-"alcid",
-"sdein",
-"sooky",
-"gelts",
-"yobbo",
-"larns",
-"jumpy",
-"mills",
-"flims",
-"pingo",
-"scall",
-"chats",
-"apism",
-"glost",
-"goofy",
-"abuts",
-"rials",
-"sixer",
-"dorse",
-"kayle",
-"shams",
-"hoyed",
-"ylems",
-"ferns",
-"goffs",
-"mawrs",
-"trugs",
-"hanky",
-"knits",
-"pyins",
-"seric",
-"feare",
-"began",
-"satem",
-"loast",
-"pyned",
-"shtum",
-"wuxia",
-"bases",
-"vardy",
-"ictic",
-"refix",
-"pechs",
-"niffs",
-"ferny",
-"teils",
-"ottos",
-"surat",
-"wheep",
-"sheel",
-"wisha",
-"hongi",
-"pands",
-"aizle",
-"abaci",
-"babka",
-"desks",
-"sixmo",
-"yonic",
-"jawed",
-"cared",
-"graal",
-"abled",
-"nazir",
-"ogles",
-"smaak",
-"dwalm",
-"jefes",
-"maxes",
-"treck",
-"bumph",
-"dawen",
-"fidge",
-"ghest",
-"skrik",
-"snows",
-"wends",
-"holos",
-"kaiak",
-"poyou",
-"sceat",
-"cozes",
-"danks",
-"antas",
-"ranid",
-"midgy",
-"booai",
-"pokal",
-"toque",
-"recco",
-"deems",
-"ciggy",
-"gooks",
-"typey",
-"rahui",
-"grans",
-"nazis",
-"leger",
-"herls",
-"moxas",
-"euros",
-"ulnae",
-"ephas",
-"spaws",
-"matlo",
-"palls",
-"orlop",
-"nests",
-"teade",
-"tunny",
-"ogled",
-"meynt",
-"bolds",
-"zocco",
-"feens",
-"duing",
-"snits",
-"arpen",
-"sirra",
-"queme",
-"gived",
-"joual",
-"geeps",
-"apgar",
-"klaps",
-"plotz",
-"nurrs",
-"borts",
-"teffs",
-"bundt",
-"drats",
-"lepra",
-"tacks",
-"artel",
-"ovoli",
-"wacky",
-"glisk",
-"aeros",
-"rinks",
-"bunje",
-"kirks",
-"meril",
-"thins",
-"cwtch",
-"unpeg",
-"chits",
-"routh",
-"sopra",
-"basts",
-"bauds",
-"studs",
-"prief",
-"safes",
-"nerol",
-"perms",
-"anted",
-"pukes",
-"hapax",
-"blins",
-"moups",
-"torcs",
-"ernes",
-"botes",
-"kebar",
-"favel",
-"moper",
-"aulic",
-"snash",
-"didos",
-"laked",
-"spods",
-"golpe",
-"hemes",
-"toker",
-"routs",
-"torse",
-"hijab",
-"faddy",
-"subas",
-"apses",
-"scabs",
-"leirs",
-"levis",
-"spied",
-"pioys",
-"gamas",
-"stets",
-"venge",
-"serrs",
-"pharm",
-"ajwan",
-"maiks",
-"pyral",
-"zoons",
-"swaps",
-"bacha",
-"hoiks",
-"sibbs",
-"rinds",
-"daces",
-"aeons",
-"heres",
-"klick",
-"hauns",
-"guans",
-"rownd",
-"shoon",
-"hoked",
-"hurds",
-"plats",
-"jaggs",
-"lezza",
-"cores",
-"vendu",
-"voled",
-"shmoe",
-"sekts",
-"soddy",
-"songs",
-"zarfs",
-"mease",
-"pesos",
-"beigy",
-"wared",
-"booed",
-"gists",
-"flees",
-"antra",
-"kapas",
-"faena",
-"mixte",
-"solos",
-"wanle",
-"dobes",
-"heids",
-"sneck",
-"coxed",
-"lered",
-"poove",
-"ankhs",
-"orris",
-"yesks",
-"dolls",
-"herse",
-"conin",
-"slebs",
-"domes",
-"dashi",
-"hanse",
-"akita",
-"laten",
-"bluer",
-"bassi",
-"conns",
-"saheb",
-"temes",
-"palpi",
-"noels",
-"azuki",
-"minke",
-"campo",
-"raser",
-"teuch",
-"ravin",
-"ritts",
-"heedy",
-"spect",
-"sayid",
-"stymy",
-"bolts",
-"skols",
-"shies",
-"eisel",
-"beaux",
-"olpae",
-"swarf",
-"tooms",
-"prats",
-"woons",
-"cymes",
-"exeat",
-"jigot",
-"roofs",
-"ainga",
-"dawts",
-"hiems",
-"milpa",
-"whoof",
-"yitie",
-"hoxed",
-"disks",
-"vitas",
-"oases",
-"theic",
-"fiars",
-"swizz",
-"hypos",
-"durns",
-"socas",
-"jirga",
-"zoner",
-"polos",
-"quats",
-"campy",
-"patly",
-"bemas",
-"yolks",
-"longa",
-"herma",
-"fusks",
-"refis",
-"ibrik",
-"hoved",
-"hoors",
-"serks",
-"palas",
-"spink",
-"amido",
-"rurps",
-"konks",
-"bilks",
-"spues",
-"styme",
-"powin",
-"skugs",
-"egest",
-"susus",
-"clems",
-"tilly",
-"spawl",
-"wited",
-"piers",
-"yechs",
-"horal",
-"nipas",
-"bikes",
-"unces",
-"yarco",
-"cutty",
-"naled",
-"halwa",
-"ceded",
-"almes",
-"gowks",
-"shirs",
-"rusma",
-"sered",
-"hymns",
-"hikoi",
-"axled",
-"pongy",
-"typto",
-"khuds",
-"wites",
-"mozes",
-"cooze",
-"bwazi",
-"talpa",
-"zetas",
-"platt",
-"keens",
-"shorl",
-"abbed",
-"chica",
-"gerbe",
-"thang",
-"parge",
-"fords",
-"shyer",
-"cooee",
-"fusts",
-"visas",
-"dreks",
-"clues",
-"joins",
-"wanna",
-"verra",
-"creds",
-"plews",
-"appay",
-"winge",
-"leggo",
-"rearm",
-"moong",
-"beans",
-"leapt",
-"meffs",
-"beefs",
-"bacca",
-"aunty",
-"mired",
-"remap",
-"jeers",
-"vealy",
-"wisht",
-"skeen",
-"lomas",
-"sycon",
-"emmew",
-"rehab",
-"purrs",
-"doeks",
-"bosun",
-"yokul",
-"unmet",
-"corks",
-"fitna",
-"pawas",
-"dexes",
-"cnida",
-"bludy",
-"suses",
-"frape",
-"amowt",
-"wacko",
-"punto",
-"daint",
-"ohing",
-"braes",
-"nares",
-"jarta",
-"aygre",
-"looie",
-"jambe",
-"plier",
-"choli",
-"drubs",
-"moust",
-"naves",
-"balun",
-"acred",
-"cripe",
-"klong",
-"goaty",
-"cuffs",
-"tater",
-"geats",
-"waked",
-"grued",
-"iring",
-"nuddy",
-"judos",
-"gular",
-"chuse",
-"soths",
-"reive",
-"hawks",
-"faros",
-"arede",
-"chugs",
-"gales",
-"drouk",
-"redon",
-"yufts",
-"jives",
-"awoke",
-"faggy",
-"loggy",
-"ixias",
-"roily",
-"asker",
-"pards",
-"dsomo",
-"liard",
-"beted",
-"rekey",
-"kehua",
-"skivy",
-"whizz",
-"jacky",
-"kotch",
-"micks",
-"saims",
-"biach",
-"irids",
-"ratos",
-"psoas",
-"tymps",
-"preys",
-"mohel",
-"lyses",
-"bobos",
-"rhyne",
-"chirl",
-"donut",
-"erses",
-"whiny",
-"vaire",
-"gonna",
-"valse",
-"blume",
-"nifes",
-"moyls",
-"rived",
-"jeans",
-"wades",
-"gyoza",
-"duvet",
-"maids",
-"axons",
-"coate",
-"binks",
-"firry",
-"rowth",
-"shrow",
-"borna",
-"foods",
-"leeze",
-"bubba",
-"burks",
-"taver",
-"linac",
-"womby",
-"dusks",
-"mudir",
-"axone",
-"tozes",
-"turbo",
-"camus",
-"ramen",
-"goats",
-"spews",
-"trows",
-"groks",
-"steek",
-"spard",
-"assot",
-"lests",
-"crudy",
-"atigi",
-"gurns",
-"nills",
-"offie",
-"rates",
-"genua",
-"haars",
-"ungag",
-"wakfs",
-"hoody",
-"tamin",
-"pynes",
-"moyas",
-"roams",
-"chare",
-"ticks",
-"snell",
-"gonks",
-"oppos",
-"forza",
-"butle",
-"elide",
-"prill",
-"blart",
-"wadts",
-"gyeld",
-"sangh",
-"fuddy",
-"atrip",
-"aboil",
-"roset",
-"relet",
-"nouny",
-"salet",
-"tenty",
-"swole",
-"carbo",
-"glits",
-"carts",
-"arvos",
-"pinko",
-"yomim",
-"rotos",
-"cysts",
-"unkid",
-"frowy",
-"flexi",
-"ofays",
-"glens",
-"caxon",
-"skeos",
-"sunks",
-"padma",
-"javas",
-"busky",
-"pager",
-"batts",
-"ploat",
-"faxes",
-"yobby",
-"jinni",
-"tawed",
-"cokes",
-"youse",
-"loave",
-"bosks",
-"yojan",
-"maxed",
-"fitte",
-"gluts",
-"ranas",
-"oyers",
-"epopt",
-"wanes",
-"jembe",
-"calks",
-"baffy",
-"mobes",
-"paves",
-"femmy",
-"salse",
-"sculs",
-"firer",
-"parky",
-"trads",
-"mimes",
-"barer",
-"globs",
-"isbas",
-"nairu",
-"karts",
-"woken",
-"borks",
-"speal",
-"hamed",
-"qajaq",
-"cocks",
-"maaed",
-"kiwis",
-"stoor",
-"wynns",
-"yeeds",
-"upend",
-"sonny",
-"hippy",
-"kobos",
-"frags",
-"faves",
-"urson",
-"warns",
-"vinas",
-"laufs",
-"typal",
-"degus",
-"gonch",
-"sager",
-"nixes",
-"laxed",
-"heths",
-"fabby",
-"bubas",
-"ayont",
-"kapow",
-"benty",
-"boles",
-"dukas",
-"shill",
-"zobos",
-"impis",
-"moult",
-"coxib",
-"baled",
-"belon",
-"blist",
-"gadjo",
-"ovolo",
-"walds",
-"jinne",
-"burfi",
-"betas",
-"kloof",
-"tores",
-"lassi",
-"tacos",
-"sarks",
-"nelis",
-"poupe",
-"boord",
-"flaxy",
-"eevns",
-"vifda",
-"juked",
-"hatha",
-"froes",
-"icker",
-"kibla",
-"sulus",
-"swoln",
-"hurls",
-"butoh",
-"praty",
-"nobby",
-"bhats",
-"noris",
-"thuds",
-"cions",
-"buroo",
-"duppy",
-"adays",
-"schul",
-"dirke",
-"retox",
-"feals",
-"mitre",
-"laves",
-"inerm",
-"spelk",
-"hyleg",
-"dunno",
-"retia",
-"bunks",
-"hooty",
-"vexer",
-"tajes",
-"antis",
-"haily",
-"sonly",
-"aline",
-"qubit",
-"liane",
-"lulls",
-"pervy",
-"lifts",
-"fiefs",
-"griff",
-"croze",
-"cowps",
-"bigos",
-"antar",
-"koban",
-"yaffs",
-"diane",
-"suers",
-"mongs",
-"menes",
-"ngati",
-"hotch",
-"togas",
-"fykes",
-"cleik",
-"quate",
-"rymme",
-"fubby",
-"bawrs",
-"hebes",
-"memes",
-"liber",
-"snees",
-"tunes",
-"threw",
-"sprug",
-"pyoid",
-"sophs",
-"dorms",
-"thaim",
-"hames",
-"twiny",
-"owsen",
-"honds",
-"bahts",
-"mynas",
-"ixtle",
-"macks",
-"poboy",
-"sloid",
-"molds",
-"pirog",
-"fubsy",
-"plouk",
-"cabas",
-"boxty",
-"hazes",
-"skaws",
-"moola",
-"oints",
-"vases",
-"kydst",
-"acros",
-"scaud",
-"cymar",
-"naker",
-"yarks",
-"bobak",
-"peage",
-"sensi",
-"woker",
-"keeks",
-"solas",
-"rukhs",
-"douce",
-"homos",
-"stews",
-"manos",
-"laded",
-"freer",
-"beers",
-"rumbo",
-"galas",
-"blams",
-"aloed",
-"rieve",
-"jagas",
-"jewed",
-"ticky",
-"knobs",
-"whids",
-"riots",
-"hylas",
-"buses",
-"canns",
-"dodgy",
-"nosey",
-"olpes",
-"kipes",
-"neuks",
-"toffs",
-"broch",
-"debes",
-"yeahs",
-"lynes",
-"ebbet",
-"redub",
-"tranq",
-"unset",
-"hoons",
-"aport",
-"lassu",
-"yclad",
-"nomoi",
-"taish",
-"fuzes",
-"garbo",
-"duomi",
-"senti",
-"pends",
-"titre",
-"tanga",
-"goary",
-"pucer",
-"hench",
-"potch",
-"kikes",
-"ngana",
-"dorks",
-"fujis",
-"bluet",
-"toaze",
-"trets",
-"smalm",
-"lotah",
-"runty",
-"ceili",
-"birse",
-"aspie",
-"fyrds",
-"cloye",
-"trock",
-"queys",
-"dhols",
-"opals",
-"hokes",
-"ligge",
-"diddy",
-"sames",
-"feods",
-"orzos",
-"seyen",
-"douar",
-"wroke",
-"arums",
-"vrows",
-"auras",
-"scups",
-"azyme",
-"riled",
-"pilei",
-"gibel",
-"cozie",
-"taros",
-"lossy",
-"betes",
-"ariot",
-"graip",
-"tophi",
-"bezzy",
-"dedal",
-"piker",
-"gouks",
-"mahua",
-"accas",
-"toits",
-"kells",
-"ervil",
-"kyang",
-"daggy",
-"clefs",
-"arsed",
-"sanko",
-"suent",
-"samas",
-"spats",
-"ramee",
-"wived",
-"nodal",
-"papes",
-"soops",
-"roose",
-"kebob",
-"carse",
-"whoso",
-"lweis",
-"pocks",
-"slyly",
-"bizes",
-"guyle",
-"bided",
-"hoosh",
-"bucks",
-"yeves",
-"riyal",
-"laura",
-"budis",
-"abyes",
-"halms",
-"gooky",
-"showd",
-"fease",
-"tousy",
-"airts",
-"lippy",
-"newts",
-"fenks",
-"merse",
-"acais",
-"blash",
-"zoeas",
-"undid",
-"ileal",
-"matey",
-"mimed",
-"reaks",
-"gongs",
-"roins",
-"tilts",
-"ehing",
-"mairs",
-"gulpy",
-"powan",
-"welks",
-"ilial",
-"shoos",
-"vaped",
-"crapy",
-"pappi",
-"meshy",
-"hongs",
-"judgy",
-"goops",
-"bajra",
-"vinal",
-"quoif",
-"dosai",
-"chibs",
-"bekah",
-"syncs",
-"adman",
-"fonda",
-"scrat",
-"damar",
-"cerge",
-"crees",
-"talcy",
-"benet",
-"petar",
-"foxes",
-"fones",
-"plots",
-"vamps",
-"wader",
-"faffs",
-"layin",
-"reeks",
-"tamis",
-"surra",
-"dungy",
-"aurum",
-"bento",
-"tauld",
-"liang",
-"doxed",
-"kirns",
-"snyes",
-"tsars",
-"heben",
-"twits",
-"ahint",
-"emerg",
-"ureas",
-"heuch",
-"jooks",
-"irone",
-"clods",
-"wolly",
-"yuked",
-"nirls",
-"mutis",
-"cronk",
-"hyles",
-"hilts",
-"ungum",
-"blots",
-"scowp",
-"eathe",
-"almug",
-"homie",
-"estro",
-"pepla",
-"jobes",
-"belah",
-"pines",
-"edits",
-"fazed",
-"bused",
-"sangs",
-"slurs",
-"hacks",
-"krabs",
-"chocs",
-"azygy",
-"motus",
-"pyets",
-"preon",
-"aalii",
-"voars",
-"tared",
-"combs",
-"kevel",
-"knars",
-"kolos",
-"steem",
-"rhody",
-"gotta",
-"roker",
-"sewan",
-"fuffy",
-"exine",
-"ornis",
-"peags",
-"fitts",
-"kaury",
-"hause",
-"medle",
-"thawy",
-"dwaal",
-"smeik",
-"moony",
-"geans",
-"twier",
-"narco",
-"maxis",
-"pulas",
-"bousy",
-"aspro",
-"yarak",
-"fared",
-"gowls",
-"modge",
-"malas",
-"beaty",
-"ripps",
-"frize",
-"cafes",
-"dowps",
-"shows",
-"immit",
-"hings",
-"mafic",
-"lezzy",
-"ardri",
-"esnes",
-"amoks",
-"algor",
-"gaurs",
-"pizes",
-"pisco",
-"wasms",
-"wigga",
-"cauld",
-"whare",
-"drice",
-"macho",
-"delph",
-"brize",
-"fixes",
-"waker",
-"smits",
-"comfy",
-"agast",
-"bukes",
-"mezze",
-"gleed",
-"roate",
-"guffs",
-"heapy",
-"lotos",
-"aboma",
-"wises",
-"raile",
-"lanas",
-"talea",
-"masts",
-"fiked",
-"dints",
-"logia",
-"waned",
-"bufty",
-"voema",
-"tofts",
-"birks",
-"cults",
-"munga",
-"pawaw",
-"cleep",
-"leeks",
-"ouzel",
-"rills",
-"towse",
-"smeke",
-"hayle",
-"tyiyn",
-"chems",
-"seifs",
-"yawls",
-"muils",
-"polly",
-"yawey",
-"loons",
-"henge",
-"toyos",
-"loury",
-"lobos",
-"vaper",
-"kiley",
-"durrs",
-"lound",
-"saggy",
-"gobbo",
-"popes",
-"skirr",
-"reist",
-"raved",
-"vapes",
-"milts",
-"deary",
-"genal",
-"barro",
-"septa",
-"flaff",
-"selah",
-"mowra",
-"whins",
-"deave",
-"rolag",
-"nonas",
-"sodas",
-"kidel",
-"bobol",
-"krone",
-"chave",
-"cozed",
-"lanes",
-"coves",
-"doner",
-"lubes",
-"oncus",
-"tawai",
-"hayer",
-"waldo",
-"cogie",
-"mopes",
-"casco",
-"artal",
-"peres",
-"neeze",
-"aquas",
-"whips",
-"inarm",
-"conks",
-"strig",
-"dauds",
-"crept",
-"peery",
-"heros",
-"tippy",
-"stept",
-"oupas",
-"gyves",
-"gyppo",
-"manas",
-"spics",
-"axils",
-"debug",
-"neons",
-"sloot",
-"halid",
-"mabes",
-"litre",
-"mudge",
-"uncos",
-"gated",
-"mused",
-"tweep",
-"repin",
-"lalls",
-"warks",
-"orgic",
-"urnal",
-"crues",
-"leese",
-"soyuz",
-"filks",
-"godso",
-"sakti",
-"tufas",
-"mocks",
-"stoae",
-"stens",
-"pawns",
-"thegn",
-"waite",
-"clies",
-"askos",
-"waney",
-"lipes",
-"kacks",
-"bocks",
-"leses",
-"eales",
-"sweer",
-"dicty",
-"dwine",
-"noyed",
-"oozed",
-"crudo",
-"trona",
-"biggy",
-"ponks",
-"yauds",
-"verry",
-"balds",
-"mirex",
-"snarf",
-"naggy",
-"mifty",
-"sways",
-"uraos",
-"skoff",
-"cobbs",
-"mutes",
-"pipis",
-"renos",
-"tehrs",
-"reddy",
-"yages",
-"yells",
-"khadi",
-"slams",
-"jukus",
-"berko",
-"foins",
-"turrs",
-"renig",
-"sadza",
-"doura",
-"jehad",
-"piing",
-"horah",
-"brere",
-"bindi",
-"veney",
-"gilpy",
-"certs",
-"gybes",
-"rouls",
-"pulik",
-"sepad",
-"equid",
-"osmic",
-"stang",
-"areae",
-"poots",
-"viver",
-"torta",
-"tophe",
-"flary",
-"sybow",
-"manto",
-"swelt",
-"borel",
-"boaks",
-"jowed",
-"lairs",
-"karst",
-"blite",
-"slojd",
-"conne",
-"kytes",
-"fikes",
-"yrapt",
-"shivs",
-"ramet",
-"toshy",
-"vrous",
-"drail",
-"lerps",
-"gibed",
-"dales",
-"carpi",
-"zings",
-"festy",
-"logon",
-"sylva",
-"kanae",
-"kaids",
-"ching",
-"praos",
-"aspis",
-"ganch",
-"bleys",
-"rudie",
-"briks",
-"tutty",
-"rille",
-"thiol",
-"vints",
-"halva",
-"blady",
-"deids",
-"bhoot",
-"tatts",
-"boree",
-"toads",
-"tuans",
-"kilim",
-"skegg",
-"trest",
-"tatty",
-"kinos",
-"aimed",
-"sidhe",
-"braks",
-"untin",
-"yipes",
-"picky",
-"begem",
-"jarks",
-"aarti",
-"weems",
-"rueda",
-"unrid",
-"scams",
-"kythe",
-"aptly",
-"skyer",
-"pumas",
-"faqir",
-"premy",
-"realo",
-"bawds",
-"beano",
-"mawns",
-"chape",
-"maist",
-"sawed",
-"supes",
-"relie",
-"sloom",
-"vughy",
-"linty",
-"flews",
-"aleck",
-"wanze",
-"blips",
-"hires",
-"purty",
-"sabha",
-"muffs",
-"dears",
-"veers",
-"weete",
-"panim",
-"mohrs",
-"muset",
-"resat",
-"kumys",
-"mochi",
-"jures",
-"kapus",
-"kiers",
-"vigia",
-"imshi",
-"brios",
-"perse",
-"hully",
-"dowar",
-"butty",
-"spuds",
-"punga",
-"kawau",
-"riems",
-"edges",
-"wiver",
-"ileus",
-"rasps",
-"blimy",
-"aiver",
-"leear",
-"sield",
-"nabla",
-"craic",
-"zesty",
-"banks",
-"kokas",
-"ryked",
-"teths",
-"waqfs",
-"pions",
-"nears",
-"styre",
-"hizen",
-"terne",
-"lepid",
-"annas",
-"drays",
-"locie",
-"quops",
-"laigh",
-"rusts",
-"scapa",
-"genny",
-"zizit",
-"puses",
-"flows",
-"busti",
-"cotes",
-"telia",
-"shwas",
-"lenes",
-"visto",
-"doddy",
-"daych",
-"anoas",
-"bagie",
-"rokes",
-"mengs",
-"uredo",
-"sauba",
-"milks",
-"togue",
-"keyer",
-"dervs",
-"wigan",
-"hoagy",
-"chins",
-"ahind",
-"hodad",
-"jeels",
-"imshy",
-"pareo",
-"haole",
-"dorad",
-"egger",
-"tusks",
-"mutts",
-"tubby",
-"dauts",
-"fyles",
-"bokos",
-"deers",
-"lazzo",
-"leady",
-"unais",
-"cavie",
-"gojis",
-"renin",
-"wairs",
-"roofy",
-"moops",
-"gosse",
-"totes",
-"diyas",
-"stimy",
-"lawns",
-"ninon",
-"cuvee",
-"ewked",
-"barbs",
-"pacas",
-"psion",
-"sifts",
-"ybore",
-"voila",
-"saugh",
-"mines",
-"varia",
-"calid",
-"proin",
-"vegie",
-"ansae",
-"ydred",
-"shalm",
-"goras",
-"seers",
-"metes",
-"doper",
-"mates",
-"ribby",
-"ogees",
-"buppy",
-"yabas",
-"gamed",
-"woofy",
-"jagra",
-"luted",
-"hazed",
-"nooky",
-"retro",
-"linky",
-"sural",
-"divis",
-"dyads",
-"chack",
-"atoks",
-"merel",
-"synds",
-"aidos",
-"terfe",
-"wyled",
-"cager",
-"piets",
-"sures",
-"temse",
-"donga",
-"ikons",
-"goldy",
-"ozzie",
-"gyved",
-"twank",
-"sarus",
-"nkosi",
-"mamie",
-"vivda",
-"bluds",
-"kabab",
-"besaw",
-"vrils",
-"coifs",
-"spazz",
-"yedes",
-"mosts",
-"sarod",
-"tusky",
-"psoai",
-"unbed",
-"brits",
-"askoi",
-"garbe",
-"kibbe",
-"waxes",
-"wasts",
-"cukes",
-"yocks",
-"alang",
-"aggry",
-"elchi",
-"surgy",
-"yarrs",
-"whoot",
-"chirk",
-"weals",
-"etape",
-"dukka",
-"robot",
-"dreys",
-"volar",
-"vells",
-"deere",
-"panni",
-"rugae",
-"umbre",
-"coded",
-"patin",
-"gorms",
-"tolar",
-"rajas",
-"sayer",
-"risus",
-"umiaq",
-"vleis",
-"tenny",
-"endew",
-"plops",
-"neese",
-"bowat",
-"muirs",
-"devis",
-"tonus",
-"kivas",
-"gobbi",
-"sista",
-"fudgy",
-"wawes",
-"clomp",
-"coped",
-"slubb",
-"peise",
-"sokol",
-"argal",
-"lehua",
-"regie",
-"hurly",
-"perky",
-"wormy",
-"biffy",
-"darer",
-"popsy",
-"stean",
-"boysy",
-"lytta",
-"razes",
-"stags",
-"owler",
-"crine",
-"kaugh",
-"babas",
-"dewed",
-"barfs",
-"lefts",
-"marcs",
-"redds",
-"goafs",
-"ocker",
-"lyted",
-"pucan",
-"fares",
-"lolog",
-"prems",
-"ryots",
-"bigly",
-"plack",
-"blets",
-"reded",
-"sozin",
-"menge",
-"lubed",
-"viold",
-"brung",
-"soums",
-"sutor",
-"ghast",
-"tripy",
-"kidge",
-"clach",
-"sownd",
-"datos",
-"dweeb",
-"jolls",
-"fetta",
-"farci",
-"dited",
-"nempt",
-"kenos",
-"eyrir",
-"clept",
-"ileac",
-"hedgy",
-"dykes",
-"poynt",
-"zerks",
-"oohed",
-"teaze",
-"charr",
-"walla",
-"stela",
-"beray",
-"wazir",
-"cawed",
-"duomo",
-"rotan",
-"xrays",
-"riads",
-"drips",
-"skits",
-"folic",
-"syren",
-"denay",
-"blive",
-"comte",
-"mumsy",
-"ginzo",
-"nirly",
-"mokis",
-"tsuba",
-"misgo",
-"binal",
-"capiz",
-"dered",
-"wexes",
-"mulga",
-"odeon",
-"tices",
-"rubli",
-"teloi",
-"lazed",
-"teads",
-"kiter",
-"gnars",
-"boded",
-"gaita",
-"shtik",
-"wands",
-"reeds",
-"toped",
-"zanja",
-"unwet",
-"nyaff",
-"earnt",
-"ratha",
-"kybos",
-"sowms",
-"parev",
-"sughs",
-"retry",
-"amove",
-"sylis",
-"halos",
-"unmix",
-"bolls",
-"jibes",
-"crims",
-"rutin",
-"dibbs",
-"moppy",
-"biles",
-"wacke",
-"craal",
-"lovey",
-"bunts",
-"quags",
-"silos",
-"grike",
-"pukus",
-"cosed",
-"reiki",
-"eorls",
-"ruggy",
-"kames",
-"remen",
-"sculk",
-"uplit",
-"gemmy",
-"zlote",
-"lumbi",
-"scart",
-"beath",
-"glows",
-"halts",
-"corey",
-"axion",
-"vails",
-"teiid",
-"colog",
-"drook",
-"boyos",
-"seans",
-"galls",
-"laddy",
-"feuds",
-"sumos",
-"hakas",
-"ricer",
-"leany",
-"jamon",
-"bends",
-"blays",
-"boult",
-"louts",
-"ulans",
-"duars",
-"loids",
-"flamm",
-"snibs",
-"brigs",
-"elint",
-"brogh",
-"dumbo",
-"zexes",
-"ratus",
-"erhus",
-"vinew",
-"chais",
-"gurus",
-"araks",
-"kepis",
-"truer",
-"elfed",
-"pungs",
-"aband",
-"calos",
-"sunis",
-"unaus",
-"daric",
-"miggs",
-"suhur",
-"poohs",
-"maims",
-"gadso",
-"laxer",
-"tumpy",
-"bemix",
-"faiks",
-"taggy",
-"bravi",
-"craws",
-"drere",
-"yucko",
-"koppa",
-"mobie",
-"allis",
-"masks",
-"felts",
-"maneh",
-"snies",
-"chode",
-"ryper",
-"ulnas",
-"brock",
-"powns",
-"tushy",
-"aulos",
-"pises",
-"infos",
-"samps",
-"ummas",
-"purpy",
-"dexie",
-"palay",
-"zincs",
-"vulgo",
-"sammy",
-"pulka",
-"docks",
-"yuzus",
-"sakes",
-"muton",
-"urger",
-"cuber",
-"temed",
-"colly",
-"budos",
-"pules",
-"herry",
-"grows",
-"bundy",
-"tasks",
-"kayos",
-"succi",
-"baghs",
-"sowth",
-"corby",
-"ebook",
-"hides",
-"trior",
-"jalap",
-"valis",
-"souce",
-"seton",
-"snoek",
-"surds",
-"docht",
-"wamus",
-"eyers",
-"norks",
-"paysd",
-"mends",
-"quipo",
-"wrang",
-"rodes",
-"marra",
-"motts",
-"emacs",
-"sluts",
-"anglo",
-"daine",
-"sorel",
-"ulama",
-"duans",
-"tucks",
-"tatus",
-"cowed",
-"sechs",
-"zabra",
-"touns",
-"bwana",
-"cozey",
-"scran",
-"theek",
-"tyros",
-"hurra",
-"metol",
-"links",
-"taigs",
-"sheal",
-"scoog",
-"nided",
-"pioye",
-"circs",
-"amias",
-"licht",
-"oubit",
-"lills",
-"panga",
-"bints",
-"alays",
-"veily",
-"seame",
-"lases",
-"umpty",
-"unhat",
-"madre",
-"glary",
-"boose",
-"yests",
-"lurry",
-"prang",
-"odism",
-"bivia",
-"yucks",
-"oleic",
-"aleft",
-"whaps",
-"ashed",
-"legit",
-"hooly",
-"aboon",
-"vises",
-"wheft",
-"urent",
-"wains",
-"fader",
-"potts",
-"sient",
-"keeve",
-"ombus",
-"sonne",
-"brugh",
-"looky",
-"zigan",
-"kalpa",
-"abbes",
-"pulmo",
-"bangs",
-"taits",
-"plaas",
-"hoper",
-"varix",
-"knubs",
-"stoln",
-"upran",
-"prase",
-"hoick",
-"omers",
-"eldin",
-"kembs",
-"nurdy",
-"pepos",
-"marvy",
-"mugga",
-"cuffo",
-"vales",
-"gilet",
-"netts",
-"suits",
-"braai",
-"polys",
-"styli",
-"daurs",
-"burds",
-"reuse",
-"wries",
-"pyxed",
-"skims",
-"fanal",
-"taler",
-"hogen",
-"flamy",
-"qapik",
-"taras",
-"nurds",
-"baulk",
-"loony",
-"kerel",
-"moble",
-"zatis",
-"resto",
-"barre",
-"shott",
-"vants",
-"raspy",
-"pyots",
-"chich",
-"boohs",
-"shish",
-"zooty",
-"jeats",
-"dopey",
-"arbas",
-"emmys",
-"doilt",
-"ginny",
-"mechs",
-"flawy",
-"galed",
-"expat",
-"limen",
-"wokka",
-"scody",
-"atmas",
-"arars",
-"ament",
-"omlah",
-"pluot",
-"flors",
-"cardy",
-"fakey",
-"sprog",
-"echos",
-"defat",
-"yogin",
-"goels",
-"girly",
-"updry",
-"ealed",
-"clews",
-"refly",
-"yerba",
-"flype",
-"dobla",
-"webby",
-"powre",
-"zaman",
-"sists",
-"braws",
-"gaspy",
-"mitch",
-"glaur",
-"octas",
-"erugo",
-"molal",
-"cutin",
-"hoove",
-"flory",
-"clart",
-"fogie",
-"paled",
-"dowly",
-"jubas",
-"abets",
-"noule",
-"tifos",
-"pekan",
-"skyfs",
-"trigo",
-"lande",
-"burqa",
-"budas",
-"rusks",
-"rapes",
-"chars",
-"murri",
-"tolus",
-"oxies",
-"doseh",
-"ponty",
-"flegs",
-"talas",
-"toeas",
-"brats",
-"litas",
-"demic",
-"wanty",
-"docus",
-"yogic",
-"hable",
-"mobby",
-"entia",
-"ovine",
-"emcee",
-"mikra",
-"fuffs",
-"poofy",
-"subha",
-"mirks",
-"hecht",
-"piert",
-"sleys",
-"yawny",
-"ships",
-"doled",
-"exits",
-"trios",
-"farer",
-"moons",
-"ablet",
-"goosy",
-"sodic",
-"blude",
-"awols",
-"wifie",
-"kitul",
-"swopt",
-"orgia",
-"rotes",
-"puhas",
-"crewe",
-"schav",
-"elain",
-"fique",
-"moste",
-"noint",
-"segni",
-"nenes",
-"uncoy",
-"fraps",
-"piezo",
-"lauan",
-"mitis",
-"naffs",
-"yeven",
-"pendu",
-"nixer",
-"owies",
-"noses",
-"varec",
-"manty",
-"enarm",
-"mooks",
-"musha",
-"seels",
-"warby",
-"mothy",
-"lenis",
-"porin",
-"mawks",
-"uhuru",
-"spaed",
-"antes",
-"brede",
-"seirs",
-"jived",
-"phyla",
-"kinas",
-"appui",
-"liman",
-"kanas",
-"rones",
-"souks",
-"cutto",
-"whops",
-"yrivd",
-"aheap",
-"impot",
-"sokah",
-"ayelp",
-"mauri",
-"spaza",
-"stent",
-"dinna",
-"punji",
-"allel",
-"pedes",
-"qanat",
-"bourd",
-"sloan",
-"hoods",
-"adhan",
-"coact",
-"ruder",
-"baloo",
-"wards",
-"farse",
-"laund",
-"oches",
-"stoai",
-"diffs",
-"linum",
-"farms",
-"cissy",
-"vomer",
-"soaks",
-"ariki",
-"bikie",
-"daubs",
-"kench",
-"gambs",
-"piani",
-"fitch",
-"lisps",
-"spier",
-"kevil",
-"irade",
-"awmry",
-"citer",
-"props",
-"royne",
-"tulsi",
-"odder",
-"tells",
-"finos",
-"centu",
-"pushy",
-"kilty",
-"trike",
-"wamed",
-"pills",
-"gilds",
-"cromb",
-"beedi",
-"mazey",
-"dured",
-"snary",
-"bizzy",
-"malmy",
-"honky",
-"fango",
-"yolky",
-"mobey",
-"tride",
-"proll",
-"sowle",
-"bonza",
-"auric",
-"jebel",
-"kandy",
-"sturt",
-"yowls",
-"baith",
-"lazes",
-"withs",
-"kerky",
-"bazar",
-"bouts",
-"pedro",
-"boabs",
-"doums",
-"longe",
-"zazen",
-"tanas",
-"afars",
-"kains",
-"theed",
-"zedas",
-"synth",
-"amies",
-"yogas",
-"seeps",
-"roton",
-"bunty",
-"kurre",
-"paise",
-"gault",
-"soars",
-"wilga",
-"dwelt",
-"soole",
-"sordo",
-"pones",
-"spane",
-"staph",
-"gyred",
-"rowme",
-"meats",
-"mensh",
-"paspy",
-"basto",
-"shash",
-"burrs",
-"saves",
-"bunns",
-"ofter",
-"hexer",
-"axite",
-"dines",
-"benes",
-"dadah",
-"clunk",
-"boygs",
-"cunts",
-"yarfa",
-"waded",
-"haffs",
-"husos",
-"jinns",
-"cavel",
-"loopy",
-"sybbe",
-"sepic",
-"vegos",
-"cited",
-"fanes",
-"roues",
-"bizzo",
-"turfs",
-"ewhow",
-"amiga",
-"dells",
-"noxes",
-"pight",
-"sores",
-"aroha",
-"turks",
-"siens",
-"agism",
-"swees",
-"rayed",
-"spald",
-"wadge",
-"unsew",
-"luffs",
-"brail",
-"fiche",
-"nongs",
-"scala",
-"siled",
-"potes",
-"jotas",
-"styes",
-"peins",
-"feyly",
-"aulas",
-"tazze",
-"geals",
-"lenti",
-"slipt",
-"perog",
-"unked",
-"atman",
-"vigas",
-"rubby",
-"stude",
-"nertz",
-"plows",
-"yeesh",
-"helos",
-"pomps",
-"raced",
-"brond",
-"chook",
-"swags",
-"filet",
-"bidon",
-"timbo",
-"kutch",
-"kogal",
-"baler",
-"agers",
-"exams",
-"zakat",
-"fenis",
-"laevo",
-"fecks",
-"idees",
-"leugh",
-"glady",
-"boyed",
-"wispy",
-"drent",
-"napes",
-"lemes",
-"pyric",
-"poops",
-"berme",
-"lowne",
-"ender",
-"situp",
-"jibba",
-"zoism",
-"syver",
-"ludic",
-"padle",
-"dazes",
-"eughs",
-"motty",
-"poncy",
-"cital",
-"enoki",
-"apert",
-"bayes",
-"rucks",
-"dwaum",
-"wocks",
-"octan",
-"lozen",
-"wiled",
-"bowrs",
-"egads",
-"coure",
-"soppy",
-"sonce",
-"golfs",
-"sofar",
-"idyls",
-"recon",
-"gemel",
-"knuts",
-"murrs",
-"habus",
-"jaggy",
-"duxes",
-"innit",
-"wiggy",
-"stade",
-"coopt",
-"chivs",
-"taxon",
-"fonts",
-"maced",
-"fiqhs",
-"bails",
-"bayts",
-"toses",
-"nevus",
-"simul",
-"socko",
-"bobas",
-"inion",
-"ammos",
-"caffs",
-"patka",
-"porny",
-"texts",
-"narky",
-"kotos",
-"tsubo",
-"brens",
-"sowne",
-"zaxes",
-"ponds",
-"walie",
-"gulet",
-"gangs",
-"caved",
-"semee",
-"pheer",
-"coths",
-"sokes",
-"rebid",
-"pates",
-"gauzy",
-"filos",
-"naams",
-"otaku",
-"damps",
-"fucks",
-"posey",
-"nunny",
-"oners",
-"rares",
-"amrit",
-"poyse",
-"salle",
-"gotch",
-"roars",
-"carny",
-"emure",
-"senvy",
-"onces",
-"posts",
-"hiked",
-"corni",
-"yerds",
-"sabed",
-"kievs",
-"viler",
-"oomph",
-"chiel",
-"cered",
-"quino",
-"jetes",
-"bubal",
-"ovens",
-"clubs",
-"ixnay",
-"sirih",
-"arked",
-"pared",
-"foams",
-"breds",
-"creps",
-"kieve",
-"loans",
-"trape",
-"jokol",
-"malts",
-"kerry",
-"luges",
-"lengs",
-"raits",
-"furca",
-"yewen",
-"goban",
-"attap",
-"clops",
-"karks",
-"evils",
-"wecht",
-"beses",
-"ogeed",
-"coted",
-"dinos",
-"stoss",
-"amnic",
-"vined",
-"coled",
-"enews",
-"banes",
-"poled",
-"haram",
-"bachs",
-"odour",
-"lofts",
-"fient",
-"hepar",
-"mawed",
-"akela",
-"limas",
-"torsi",
-"drees",
-"toric",
-"tykes",
-"adits",
-"genty",
-"snool",
-"steds",
-"ennog",
-"parve",
-"porer",
-"vocab",
-"peare",
-"egged",
-"eilds",
-"ataxy",
-"geyer",
-"boart",
-"troak",
-"mavin",
-"jodel",
-"netop",
-"whort",
-"parma",
-"shawn",
-"yukky",
-"sweed",
-"dolts",
-"igged",
-"zoned",
-"rozit",
-"agrin",
-"crout",
-"nouls",
-"smorg",
-"rowed",
-"frets",
-"kaiks",
-"earls",
-"malax",
-"palea",
-"dirts",
-"meath",
-"baffs",
-"vairs",
-"winns",
-"molys",
-"moors",
-"spays",
-"whens",
-"paolo",
-"flane",
-"mimsy",
-"pears",
-"fells",
-"skeds",
-"lours",
-"milty",
-"lacet",
-"tronc",
-"outby",
-"doozy",
-"razed",
-"pebas",
-"caman",
-"spifs",
-"birsy",
-"cires",
-"fatly",
-"brool",
-"mawky",
-"buffs",
-"korus",
-"strae",
-"donny",
-"peris",
-"vivat",
-"weels",
-"sowed",
-"hazer",
-"maile",
-"googs",
-"speat",
-"kempy",
-"yites",
-"deoxy",
-"gulls",
-"eaned",
-"bewet",
-"simba",
-"zygon",
-"flans",
-"zooey",
-"fiest",
-"hosen",
-"dowts",
-"posed",
-"dhals",
-"squit",
-"jomos",
-"hefte",
-"spate",
-"gutty",
-"lirks",
-"appuy",
-"toile",
-"scudi",
-"preve",
-"ourie",
-"reals",
-"azans",
-"psoae",
-"taber",
-"eejit",
-"cadee",
-"jagir",
-"aceta",
-"tocks",
-"shiur",
-"tanky",
-"hylic",
-"gazon",
-"monas",
-"maire",
-"gyans",
-"acidy",
-"krewe",
-"tanna",
-"sards",
-"selfs",
-"gambo",
-"avion",
-"mased",
-"tugra",
-"ayres",
-"matts",
-"drusy",
-"dolia",
-"keros",
-"korai",
-"elogy",
-"reink",
-"rurus",
-"melas",
-"flued",
-"culls",
-"paans",
-"snabs",
-"lyres",
-"lobus",
-"frigs",
-"forbs",
-"ooses",
-"royst",
-"dhaba",
-"yokes",
-"fluky",
-"eyrie",
-"guimp",
-"scaws",
-"unsaw",
-"yorps",
-"duply",
-"micos",
-"ruses",
-"aldea",
-"curls",
-"duits",
-"rutty",
-"dauby",
-"neemb",
-"gloop",
-"relit",
-"lades",
-"mings",
-"naras",
-"sunns",
-"besee",
-"gades",
-"lodes",
-"thymy",
-"gelee",
-"prads",
-"puzel",
-"naeve",
-"aided",
-"skear",
-"darre",
-"pulli",
-"tanks",
-"tepas",
-"helms",
-"cetes",
-"umpie",
-"tagma",
-"getas",
-"tiars",
-"amyls",
-"idant",
-"bundh",
-"malty",
-"jarps",
-"ghazi",
-"opens",
-"deres",
-"oasts",
-"goest",
-"whiss",
-"nowts",
-"unlid",
-"dreer",
-"shuts",
-"mures",
-"weamb",
-"alifs",
-"moxie",
-"jirre",
-"hists",
-"idola",
-"muter",
-"weeke",
-"warbs",
-"nummy",
-"dobro",
-"demes",
-"aduki",
-"clave",
-"baits",
-"mooli",
-"doers",
-"yucky",
-"shite",
-"kilts",
-"yoked",
-"cytes",
-"kelep",
-"zitis",
-"delfs",
-"admen",
-"gilts",
-"pouff",
-"smerk",
-"poons",
-"aecia",
-"melik",
-"gunky",
-"bajri",
-"dewar",
-"devot",
-"tians",
-"rakes",
-"sorns",
-"veils",
-"moron",
-"rolfs",
-"synes",
-"moras",
-"firns",
-"soote",
-"colts",
-"latke",
-"udons",
-"flyte",
-"gippo",
-"blore",
-"blued",
-"malls",
-"scudo",
-"shoer",
-"borak",
-"eruct",
-"eliad",
-"tuque",
-"albas",
-"weeny",
-"ratoo",
-"sexto",
-"koker",
-"grads",
-"boink",
-"crome",
-"kynde",
-"rahed",
-"skint",
-"hucks",
-"undos",
-"pross",
-"cooms",
-"woofs",
-"lowry",
-"fests",
-"giust",
-"nying",
-"imbar",
-"limba",
-"rumpo",
-"stede",
-"merch",
-"nooit",
-"skuas",
-"herye",
-"civie",
-"apted",
-"waugh",
-"chynd",
-"manic",
-"hiree",
-"scogs",
-"lopes",
-"puler",
-"durry",
-"pauls",
-"rhime",
-"saddo",
-"grubs",
-"hauld",
-"cesse",
-"zests",
-"brust",
-"slier",
-"tings",
-"bohos",
-"phene",
-"yarns",
-"arere",
-"sitka",
-"putto",
-"nikab",
-"deils",
-"veals",
-"oping",
-"boked",
-"odyle",
-"bromo",
-"sewar",
-"pilis",
-"mutch",
-"thilk",
-"bubus",
-"gunge",
-"neals",
-"gappy",
-"skene",
-"carks",
-"ammon",
-"signa",
-"fifis",
-"ysame",
-"hissy",
-"woald",
-"mieve",
-"levas",
-"rarer",
-"ancho",
-"derat",
-"kuris",
-"spayd",
-"yesty",
-"jaspe",
-"hoord",
-"airth",
-"putts",
-"agria",
-"gaths",
-"ryals",
-"sella",
-"yowes",
-"bloop",
-"uptak",
-"lomed",
-"yirks",
-"resod",
-"toked",
-"moots",
-"pampa",
-"agoge",
-"lakhs",
-"primy",
-"snath",
-"devas",
-"buhls",
-"cooey",
-"plyer",
-"morae",
-"swigs",
-"pians",
-"ambry",
-"fordo",
-"lurgi",
-"unget",
-"wazoo",
-"fists",
-"cedes",
-"wawas",
-"giber",
-"apode",
-"vanes",
-"reggo",
-"phons",
-"caves",
-"jnana",
-"leaks",
-"ontic",
-"breer",
-"colds",
-"synch",
-"offed",
-"bitte",
-"caups",
-"ither",
-"parki",
-"weise",
-"nerts",
-"begar",
-"wheal",
-"afros",
-"anear",
-"daiko",
-"zeals",
-"wicky",
-"chays",
-"rebbe",
-"grame",
-"ekkas",
-"orles",
-"doges",
-"gunks",
-"gares",
-"decos",
-"seepy",
-"lidos",
-"payed",
-"haded",
-"raird",
-"kophs",
-"terek",
-"liefs",
-"bocci",
-"aidoi",
-"ixora",
-"oucht",
-"boons",
-"gelds",
-"zonda",
-"dites",
-"tryer",
-"kbars",
-"haufs",
-"katas",
-"aiyee",
-"clype",
-"coude",
-"garis",
-"aswim",
-"smurs",
-"pawer",
-"ablow",
-"lowps",
-"tiler",
-"laiks",
-"shays",
-"derms",
-"rorts",
-"recal",
-"nixed",
-"ratas",
-"glazy",
-"gomer",
-"horme",
-"jedis",
-"trats",
-"tarok",
-"fluey",
-"pilch",
-"loops",
-"styed",
-"cacks",
-"mites",
-"liven",
-"wadds",
-"roule",
-"thens",
-"chive",
-"orals",
-"nalas",
-"neist",
-"vends",
-"yugas",
-"takky",
-"arpas",
-"keets",
-"hards",
-"filum",
-"hooka",
-"diker",
-"halon",
-"bayed",
-"recit",
-"debud",
-"umphs",
-"pored",
-"dilli",
-"remix",
-"nutsy",
-"borde",
-"onkus",
-"mausy",
-"tical",
-"nancy",
-"kooks",
-"dogey",
-"allod",
-"lyart",
-"goold",
-"votes",
-"flung",
-"sprad",
-"milia",
-"lytes",
-"tuath",
-"botts",
-"spean",
-"keels",
-"frust",
-"pinta",
-"shura",
-"trods",
-"reccy",
-"tapet",
-"rance",
-"shmek",
-"cauks",
-"sured",
-"shent",
-"shits",
-"slopy",
-"gosht",
-"vegas",
-"lilts",
-"mimeo",
-"flocs",
-"dewax",
-"bambi",
-"muhly",
-"sucks",
-"kahal",
-"fogou",
-"maare",
-"scail",
-"wanky",
-"bortz",
-"uteri",
-"promo",
-"bayle",
-"gaums",
-"frush",
-"miles",
-"emits",
-"conia",
-"kreng",
-"gebur",
-"sagas",
-"earst",
-"lumme",
-"hoser",
-"doups",
-"blent",
-"phish",
-"trode",
-"gyron",
-"whaur",
-"boody",
-"sulci",
-"bhuna",
-"fugly",
-"curds",
-"vraic",
-"diene",
-"ralph",
-"smugs",
-"beets",
-"paler",
-"kores",
-"culms",
-"myths",
-"spale",
-"pakka",
-"codec",
-"femal",
-"swile",
-"goles",
-"sings",
-"ochre",
-"tiddy",
-"haled",
-"dorrs",
-"unica",
-"kelty",
-"muons",
-"pashm",
-"finca",
-"stumm",
-"meins",
-"stirp",
-"tolls",
-"cides",
-"wynds",
-"oller",
-"vills",
-"sloes",
-"saics",
-"grone",
-"gings",
-"morat",
-"byded",
-"laved",
-"foyle",
-"panes",
-"cauri",
-"paire",
-"staps",
-"upsey",
-"haros",
-"syned",
-"welts",
-"poods",
-"taths",
-"alefs",
-"mosso",
-"novae",
-"punts",
-"pilao",
-"sixte",
-"sowff",
-"grein",
-"unpen",
-"gibli",
-"roque",
-"gains",
-"surah",
-"zymes",
-"derny",
-"vinic",
-"oggin",
-"boets",
-"fines",
-"heils",
-"slims",
-"pouty",
-"wacks",
-"javel",
-"heeze",
-"naiks",
-"pores",
-"rayas",
-"nerdy",
-"kaims",
-"fisty",
-"brims",
-"voted",
-"amene",
-"frays",
-"chaft",
-"soman",
-"cabob",
-"abele",
-"delly",
-"tubar",
-"loord",
-"flava",
-"jocko",
-"punky",
-"cases",
-"gnows",
-"loxed",
-"roary",
-"treys",
-"mayst",
-"liars",
-"mohur",
-"films",
-"saser",
-"eases",
-"perks",
-"woosh",
-"strim",
-"dekes",
-"chowk",
-"metif",
-"layup",
-"sessa",
-"nates",
-"salop",
-"primi",
-"vitta",
-"lesbo",
-"phizz",
-"gemot",
-"kails",
-"odeum",
-"nomes",
-"monic",
-"hokas",
-"jupes",
-"goons",
-"soree",
-"bedad",
-"lotta",
-"pedis",
-"lures",
-"brees",
-"dived",
-"grabs",
-"rimae",
-"tauts",
-"shews",
-"cills",
-"plies",
-"laval",
-"lunet",
-"gowds",
-"solds",
-"louis",
-"whups",
-"murid",
-"fondu",
-"shone",
-"trips",
-"dungs",
-"twigs",
-"smogs",
-"yurts",
-"staun",
-"dwams",
-"situs",
-"agami",
-"missy",
-"doeth",
-"britt",
-"musks",
-"blaer",
-"tided",
-"pruta",
-"samel",
-"towns",
-"corms",
-"casky",
-"scuft",
-"hails",
-"tapen",
-"omrah",
-"coste",
-"cains",
-"rimes",
-"tules",
-"snead",
-"miaou",
-"nabis",
-"viols",
-"reify",
-"goopy",
-"mofos",
-"dorty",
-"waken",
-"kroon",
-"kente",
-"alist",
-"pacha",
-"ikans",
-"lowts",
-"bliny",
-"poake",
-"lakin",
-"bimah",
-"lokes",
-"crays",
-"ganev",
-"ruana",
-"clans",
-"steme",
-"kists",
-"fella",
-"agued",
-"gowan",
-"cuits",
-"oaker",
-"coder",
-"baken",
-"gaits",
-"bling",
-"woops",
-"thale",
-"comix",
-"sewen",
-"glums",
-"sdayn",
-"lyssa",
-"roked",
-"prent",
-"jilts",
-"moyle",
-"wembs",
-"afear",
-"leuds",
-"gofer",
-"basho",
-"axing",
-"emeer",
-"starr",
-"recap",
-"asyla",
-"fiats",
-"fains",
-"bauks",
-"scraw",
-"tawer",
-"dorbs",
-"stivy",
-"minae",
-"techs",
-"pixes",
-"caese",
-"convo",
-"netes",
-"overs",
-"gravs",
-"pouks",
-"rajes",
-"sithe",
-"kebab",
-"buret",
-"outed",
-"maggs",
-"tuism",
-"tozed",
-"nimps",
-"lytic",
-"jumar",
-"roded",
-"algum",
-"horas",
-"twals",
-"fyces",
-"tuktu",
-"rauns",
-"teend",
-"frass",
-"trank",
-"padis",
-"serai",
-"ragas",
-"tiros",
-"asdic",
-"yills",
-"reech",
-"segos",
-"litai",
-"exing",
-"lames",
-"tapas",
-"hakes",
-"posho",
-"boyla",
-"gleby",
-"tirrs",
-"acmic",
-"deeps",
-"raggs",
-"telly",
-"rupia",
-"anomy",
-"chons",
-"brith",
-"ports",
-"calpa",
-"pudic",
-"slags",
-"scand",
-"cooed",
-"fanga",
-"frati",
-"treyf",
-"oiler",
-"musse",
-"clung",
-"bodge",
-"fairs",
-"dahls",
-"umbos",
-"xenic",
-"loche",
-"lefte",
-"ponzu",
-"fuzed",
-"flote",
-"safer",
-"volta",
-"oribi",
-"nagor",
-"kulas",
-"skody",
-"diram",
-"capot",
-"dunam",
-"musos",
-"sukuk",
-"gools",
-"jukes",
-"cabby",
-"spide",
-"gripy",
-"minks",
-"klang",
-"pured",
-"sored",
-"kamis",
-"jobed",
-"sijos",
-"fused",
-"skews",
-"petri",
-"khets",
-"trois",
-"doser",
-"cakey",
-"quids",
-"savin",
-"slows",
-"fytte",
-"adzed",
-"derig",
-"titup",
-"sehri",
-"herms",
-"swith",
-"typos",
-"agios",
-"medii",
-"yonks",
-"puffa",
-"disme",
-"ulvas",
-"zebub",
-"hullo",
-"halfa",
-"pacta",
-"menta",
-"fedex",
-"justs",
-"rides",
-"yowie",
-"quass",
-"hunts",
-"akkas",
-"rends",
-"kaphs",
-"oboes",
-"leavy",
-"ecrus",
-"sites",
-"linds",
-"laich",
-"welch",
-"debur",
-"dohyo",
-"taser",
-"iftar",
-"albee",
-"rarks",
-"raped",
-"enols",
-"caned",
-"emyde",
-"gandy",
-"etics",
-"glops",
-"blees",
-"lochs",
-"fundi",
-"rungs",
-"doest",
-"buhrs",
-"virid",
-"nappa",
-"whilk",
-"gloms",
-"touze",
-"cocci",
-"motis",
-"boomy",
-"abore",
-"foley",
-"reorg",
-"ginch",
-"zeins",
-"merer",
-"niton",
-"tasso",
-"bries",
-"bivvy",
-"brast",
-"nisse",
-"ylkes",
-"cacky",
-"murex",
-"zeros",
-"rowie",
-"aitus",
-"cents",
-"gator",
-"miffs",
-"bonce",
-"wisps",
-"coyed",
-"abram",
-"glaik",
-"bakra",
-"thete",
-"roves",
-"misch",
-"saned",
-"pouts",
-"thugs",
-"regma",
-"yoick",
-"wedgy",
-"ovals",
-"chiru",
-"treks",
-"spivs",
-"swots",
-"chubs",
-"dotes",
-"ogams",
-"roils",
-"fatwa",
-"unbid",
-"noggs",
-"hesps",
-"tewit",
-"mauby",
-"tonne",
-"eying",
-"tepoy",
-"ruers",
-"plebs",
-"gaped",
-"loirs",
-"burps",
-"duded",
-"curat",
-"ictal",
-"narre",
-"avyze",
-"nazes",
-"coqui",
-"hance",
-"saunt",
-"coked",
-"adred",
-"ojime",
-"coden",
-"fural",
-"smoor",
-"birls",
-"inspo",
-"rangi",
-"heats",
-"hotty",
-"betta",
-"banak",
-"caron",
-"enrol",
-"frosh",
-"cogon",
-"kerve",
-"rimus",
-"yores",
-"paals",
-"redia",
-"gurls",
-"scary",
-"grese",
-"bevor",
-"wrung",
-"jeton",
-"sweel",
-"canes",
-"marge",
-"dempt",
-"atopy",
-"buchu",
-"denet",
-"rests",
-"neaps",
-"gride",
-"ravey",
-"priss",
-"nadas",
-"lunes",
-"traik",
-"cruor",
-"towsy",
-"meous",
-"agist",
-"hoves",
-"nanas",
-"rakee",
-"bozos",
-"caked",
-"bohea",
-"wirer",
-"volve",
-"grisy",
-"boars",
-"enows",
-"cagot",
-"jibbs",
-"notum",
-"pulks",
-"stonk",
-"rawin",
-"lythe",
-"bipod",
-"rifer",
-"namus",
-"ejido",
-"sider",
-"bumbo",
-"vired",
-"urare",
-"wizes",
-"fungo",
-"eidos",
-"hoghs",
-"birle",
-"hinky",
-"ketol",
-"chang",
-"evite",
-"horks",
-"selle",
-"dries",
-"reans",
-"arled",
-"flays",
-"bungy",
-"burka",
-"borty",
-"hydro",
-"busks",
-"cocco",
-"clous",
-"stell",
-"pikas",
-"vexil",
-"cotan",
-"exeme",
-"shote",
-"sited",
-"choil",
-"afara",
-"bines",
-"kight",
-"spyre",
-"groof",
-"wodge",
-"writs",
-"seils",
-"slomo",
-"almeh",
-"gazal",
-"piums",
-"comas",
-"jesse",
-"intis",
-"zappy",
-"carrs",
-"nulls",
-"hants",
-"bitsy",
-"backs",
-"tamal",
-"raiks",
-"doats",
-"jirds",
-"douks",
-"vower",
-"rumly",
-"machs",
-"hared",
-"mixup",
-"mails",
-"scrow",
-"pocky",
-"saner",
-"pavin",
-"parrs",
-"slats",
-"armil",
-"fazes",
-"petti",
-"jocky",
-"swats",
-"epees",
-"welly",
-"poted",
-"barfi",
-"flosh",
-"yabby",
-"celts",
-"corky",
-"hauds",
-"taira",
-"brack",
-"tanty",
-"swerf",
-"takhi",
-"epics",
-"hakim",
-"mokos",
-"ghats",
-"crias",
-"flits",
-"koura",
-"kaval",
-"peghs",
-"stems",
-"galut",
-"blubs",
-"spits",
-"kamik",
-"tatie",
-"seiza",
-"artis",
-"softa",
-"datal",
-"takis",
-"mardy",
-"proke",
-"genii",
-"cippi",
-"lusts",
-"yerks",
-"oonts",
-"tinks",
-"olios",
-"ataps",
-"carer",
-"moten",
-"aglee",
-"jiber",
-"disas",
-"clift",
-"napoo",
-"xysti",
-"haoma",
-"tenne",
-"fuzil",
-"chivy",
-"scuta",
-"uneth",
-"kombu",
-"cobby",
-"tythe",
-"gayer",
-"nolos",
-"triac",
-"mains",
-"vogie",
-"donko",
-"tocky",
-"loges",
-"girns",
-"cense",
-"tynde",
-"gives",
-"wilds",
-"freit",
-"wrens",
-"toges",
-"audad",
-"galvo",
-"masas",
-"pomes",
-"bacco",
-"pelon",
-"smowt",
-"husks",
-"copes",
-"glaum",
-"shola",
-"porks",
-"bytes",
-"odals",
-"cunei",
-"itchy",
-"miros",
-"murva",
-"skimo",
-"dowle",
-"swung",
-"noyes",
-"debby",
-"colby",
-"sorda",
-"paseo",
-"howes",
-"gears",
-"slaes",
-"smirr",
-"sware",
-"ensky",
-"norms",
-"apers",
-"troke",
-"emend",
-"unfix",
-"umped",
-"bulks",
-"twite",
-"simas",
-"kokra",
-"fidos",
-"homey",
-"halse",
-"illth",
-"sooks",
-"vehme",
-"liart",
-"roids",
-"chaws",
-"chana",
-"proto",
-"rhyta",
-"phang",
-"rands",
-"trone",
-"fanos",
-"scaur",
-"voddy",
-"gater",
-"podge",
-"prunt",
-"jambo",
-"camos",
-"resit",
-"jeeze",
-"koels",
-"alaps",
-"pulao",
-"belts",
-"ydrad",
-"folie",
-"rugal",
-"yarer",
-"slays",
-"darks",
-"ugali",
-"chows",
-"qorma",
-"demoi",
-"clams",
-"cubed",
-"miaul",
-"taxer",
-"toney",
-"tends",
-"sowfs",
-"rifty",
-"dunny",
-"picra",
-"botas",
-"dropt",
-"boeuf",
-"daffs",
-"howso",
-"hudna",
-"donah",
-"babus",
-"dicey",
-"latah",
-"pavid",
-"ovels",
-"sefer",
-"tardo",
-"lavra",
-"boils",
-"staig",
-"fents",
-"gobis",
-"gumps",
-"roped",
-"dawds",
-"uncap",
-"choon",
-"zupas",
-"wooed",
-"azlon",
-"arils",
-"khats",
-"hadst",
-"cooch",
-"lards",
-"fices",
-"tryps",
-"ascon",
-"shtup",
-"deeve",
-"jisms",
-"teins",
-"rewth",
-"polts",
-"mosey",
-"penks",
-"lunks",
-"bulbs",
-"chapt",
-"hosed",
-"beeps",
-"sires",
-"couta",
-"neves",
-"comal",
-"schmo",
-"eupad",
-"bawty",
-"maces",
-"certy",
-"booay",
-"yaars",
-"usure",
-"biggs",
-"potae",
-"hoots",
-"holme",
-"agros",
-"imids",
-"shoed",
-"upped",
-"fetwa",
-"ahing",
-"taxol",
-"dopas",
-"mizen",
-"lased",
-"pekes",
-"thans",
-"kiaat",
-"huias",
-"amirs",
-"setts",
-"maill",
-"guars",
-"gyals",
-"sagum",
-"banya",
-"boong",
-"peaze",
-"rewet",
-"molas",
-"prise",
-"brame",
-"aflaj",
-"doomy",
-"coyer",
-"fiers",
-"forky",
-"verts",
-"preif",
-"paten",
-"payor",
-"tiers",
-"cusks",
-"poppa",
-"pikes",
-"peepe",
-"sudsy",
-"rebit",
-"mesto",
-"ayaya",
-"repro",
-"laker",
-"zonks",
-"tichy",
-"hoses",
-"prost",
-"pikey",
-"barms",
-"savey",
-"sesey",
-"mojos",
-"glias",
-"whity",
-"pipas",
-"mezes",
-"muids",
-"lipas",
-"jails",
-"daman",
-"rices",
-"porta",
-"salps",
-"trins",
-"hajis",
-"exies",
-"femes",
-"blaes",
-"turnt",
-"karns",
-"kynds",
-"polje",
-"fayre",
-"lated",
-"skool",
-"lores",
-"pubco",
-"kagos",
-"bunds",
-"cluey",
-"panko",
-"diets",
-"kreep",
-"chaya",
-"ungod",
-"laics",
-"onery",
-"jutes",
-"palsa",
-"starn",
-"debel",
-"cuspy",
-"okays",
-"swapt",
-"orgue",
-"noobs",
-"yappy",
-"tangy",
-"burbs",
-"korat",
-"parly",
-"pyats",
-"gussy",
-"volae",
-"arret",
-"buzzy",
-"nubby",
-"loppy",
-"cheka",
-"rager",
-"reaps",
-"chirt",
-"benni",
-"weest",
-"jujus",
-"swage",
-"djins",
-"elven",
-"oddly",
-"yealm",
-"clots",
-"marls",
-"lilos",
-"urman",
-"fuses",
-"unred",
-"repps",
-"roles",
-"smore",
-"kiefs",
-"naped",
-"bussu",
-"tarty",
-"jhala",
-"ahold",
-"krang",
-"sayst",
-"sorta",
-"tacet",
-"trild",
-"hejab",
-"pissy",
-"minty",
-"luaus",
-"proul",
-"flops",
-"bisks",
-"yrent",
-"filii",
-"towts",
-"jours",
-"dolci",
-"burns",
-"lobes",
-"decaf",
-"gamay",
-"burse",
-"skegs",
-"makis",
-"ploye",
-"ainee",
-"mauzy",
-"gants",
-"sabot",
-"butes",
-"wider",
-"apsos",
-"pewit",
-"updos",
-"coxae",
-"dearn",
-"warty",
-"sassy",
-"globi",
-"lucks",
-"nappe",
-"hynde",
-"scums",
-"ylike",
-"tyned",
-"pombe",
-"stoun",
-"qadis",
-"dolma",
-"kugel",
-"talcs",
-"boras",
-"skios",
-"azons",
-"reman",
-"snush",
-"gabba",
-"ragis",
-"jivey",
-"senza",
-"chums",
-"copay",
-"pucks",
-"lanks",
-"rello",
-"girds",
-"icers",
-"resus",
-"sated",
-"serre",
-"coost",
-"mesas",
-"furol",
-"peeks",
-"bungs",
-"aland",
-"muras",
-"jougs",
-"pozzy",
-"tokos",
-"jocos",
-"crips",
-"fetes",
-"curdy",
-"comby",
-"yaird",
-"cusso",
-"gleis",
-"zebus",
-"tates",
-"cepes",
-"kikoi",
-"noter",
-"saree",
-"zilas",
-"vozhd",
-"dyers",
-"wolfs",
-"nduja",
-"agons",
-"hithe",
-"duads",
-"gasps",
-"cages",
-"milko",
-"allee",
-"merle",
-"foyne",
-"roneo",
-"sados",
-"kufis",
-"gonia",
-"lazzi",
-"slype",
-"ludos",
-"hanap",
-"plied",
-"birrs",
-"jumby",
-"munts",
-"rumpy",
-"bunya",
-"notal",
-"thraw",
-"powny",
-"redox",
-"foody",
-"paedo",
-"rifte",
-"amids",
-"sumph",
-"sopor",
-"shiel",
-"holks",
-"vodou",
-"sujee",
-"clued",
-"buffa",
-"omasa",
-"scags",
-"abune",
-"byres",
-"evhoe",
-"loafs",
-"binds",
-"amahs",
-"toing",
-"agger",
-"oboli",
-"pogey",
-"saine",
-"talaq",
-"massa",
-"berob",
-"argle",
-"vroom",
-"kerns",
-"maras",
-"sewin",
-"dykey",
-"moira",
-"ickle",
-"istle",
-"elpee",
-"holla",
-"mulsh",
-"siker",
-"combi",
-"kelly",
-"lowns",
-"riley",
-"riper",
-"leets",
-"mense",
-"miaow",
-"gynae",
-"fehme",
-"arame",
-"biffo",
-"sises",
-"knive",
-"nikah",
-"houff",
-"tumps",
-"neafe",
-"lawks",
-"aargh",
-"piggy",
-"mened",
-"mysid",
-"dozes",
-"grebo",
-"piend",
-"abaya",
-"wussy",
-"twats",
-"simis",
-"cimar",
-"crura",
-"khaph",
-"tuyer",
-"omits",
-"taxor",
-"looms",
-"nicks",
-"ycled",
-"doter",
-"fibre",
-"beres",
-"dicks",
-"dorsa",
-"fillo",
-"rosts",
-"rorie",
-"squeg",
-"suber",
-"unpin",
-"pokes",
-"jugum",
-"kaama",
-"glams",
-"taupe",
-"codes",
-"soare",
-"plugs",
-"rozet",
-"mered",
-"gummy",
-"cheth",
-"sythe",
-"sypes",
-"forby",
-"gucks",
-"rheme",
-"clipt",
-"stowp",
-"bodes",
-"pawls",
-"spiff",
-"wests",
-"hemin",
-"ettin",
-"noles",
-"bests",
-"potoo",
-"halls",
-"arets",
-"zonae",
-"unwon",
-"fores",
-"tharm",
-"dumka",
-"ceaze",
-"knots",
-"boofy",
-"spart",
-"harts",
-"leaze",
-"tests",
-"peals",
-"urped",
-"yirth",
-"chiks",
-"reads",
-"crags",
-"crare",
-"spuer",
-"corns",
-"piled",
-"hirer",
-"blaud",
-"fibro",
-"twilt",
-"roupy",
-"dault",
-"acids",
-"suras",
-"coeds",
-"gucky",
-"highs",
-"wetly",
-"nutso",
-"gigas",
-"tubas",
-"tungs",
-"presa",
-"djinn",
-"brans",
-"luxes",
-"claut",
-"sedes",
-"wauls",
-"ocrea",
-"iambs",
-"yards",
-"drack",
-"katal",
-"crena",
-"tenia",
-"pujas",
-"eques",
-"solde",
-"packs",
-"molts",
-"yoker",
-"duras",
-"locis",
-"faurd",
-"midis",
-"parae",
-"retax",
-"howff",
-"pluff",
-"thigs",
-"cleek",
-"scuts",
-"basks",
-"raker",
-"finny",
-"raxes",
-"nicer",
-"hoars",
-"gents",
-"kiths",
-"pulis",
-"strep",
-"limps",
-"boing",
-"cruds",
-"cotts",
-"buaze",
-"grins",
-"kanji",
-"sewel",
-"poeps",
-"penes",
-"copsy",
-"carby",
-"imine",
-"yauld",
-"grund",
-"inorb",
-"yabba",
-"grams",
-"scops",
-"yelts",
-"texes",
-"orcin",
-"reels",
-"jades",
-"archi",
-"donas",
-"lysin",
-"waved",
-"uraei",
-"poses",
-"sluit",
-"raged",
-"pagle",
-"paven",
-"rivas",
-"sikas",
-"daled",
-"taiko",
-"sanga",
-"dorts",
-"wipes",
-"bania",
-"wombs",
-"borms",
-"afrit",
-"oorie",
-"slove",
-"bedye",
-"deevs",
-"selva",
-"thurl",
-"runed",
-"musar",
-"sared",
-"sorer",
-"acmes",
-"lints",
-"styte",
-"razer",
-"samen",
-"goofs",
-"stond",
-"occam",
-"racks",
-"proso",
-"honks",
-"pasts",
-"dowie",
-"skelm",
-"kamme",
-"glode",
-"biled",
-"ogive",
-"worts",
-"shand",
-"pings",
-"gasts",
-"yapon",
-"rojak",
-"semes",
-"poler",
-"grice",
-"barby",
-"crool",
-"ollav",
-"zezes",
-"linux",
-"titch",
-"rooky",
-"abray",
-"vasts",
-"skiey",
-"talks",
-"solah",
-"tinas",
-"mahwa",
-"pargo",
-"bandh",
-"touzy",
-"cloot",
-"cohos",
-"hushy",
-"emong",
-"daris",
-"trays",
-"stonn",
-"dangs",
-"beins",
-"pents",
-"biali",
-"topee",
-"basij",
-"alans",
-"ranis",
-"nimbi",
-"snebs",
-"thuya",
-"sneed",
-"paeon",
-"alods",
-"delis",
-"embox",
-"obang",
-"tuina",
-"penie",
-"yummo",
-"mulla",
-"flurr",
-"meare",
-"pooks",
-"pells",
-"breis",
-"rails",
-"silen",
-"arrah",
-"hoyas",
-"morro",
-"marri",
-"bason",
-"reede",
-"adios",
-"shaly",
-"mirid",
-"tepal",
-"holts",
-"kuias",
-"incut",
-"yukes",
-"draps",
-"umiac",
-"exuls",
-"embow",
-"dicht",
-"rouen",
-"muist",
-"fumer",
-"wroth",
-"unsee",
-"obols",
-"podal",
-"sheva",
-"nitty",
-"seaze",
-"haick",
-"beths",
-"shero",
-"tavah",
-"rekes",
-"pseud",
-"galah",
-"giros",
-"bomas",
-"gonys",
-"lanch",
-"gleys",
-"desex",
-"mesel",
-"flota",
-"saris",
-"limed",
-"dital",
-"mapau",
-"juvie",
-"altho",
-"ovist",
-"risps",
-"toyer",
-"palps",
-"natis",
-"imari",
-"teaks",
-"gowns",
-"skeer",
-"cleck",
-"grith",
-"matza",
-"cures",
-"swayl",
-"godet",
-"peles",
-"bibbs",
-"sluse",
-"frows",
-"brogs",
-"brume",
-"koros",
-"tyers",
-"steno",
-"roted",
-"tummy",
-"kooky",
-"prese",
-"oncer",
-"skeed",
-"urali",
-"uveas",
-"inrun",
-"blocs",
-"aahed",
-"okehs",
-"cadgy",
-"toged",
-"shere",
-"heame",
-"tegua",
-"diols",
-"marae",
-"nides",
-"chado",
-"cogue",
-"tuffe",
-"avale",
-"incle",
-"tatou",
-"halal",
-"lorel",
-"dooms",
-"azine",
-"hikes",
-"vatic",
-"begad",
-"yarto",
-"lears",
-"larky",
-"aguti",
-"pippy",
-"slunk",
-"lamed",
-"cribs",
-"hopak",
-"flues",
-"pygal",
-"azyms",
-"reses",
-"lexes",
-"wuses",
-"datto",
-"pesto",
-"felch",
-"cowan",
-"ramin",
-"hecks",
-"spang",
-"whirs",
-"poupt",
-"cetyl",
-"tiles",
-"intil",
-"ribas",
-"toffy",
-"kojis",
-"hexes",
-"spiks",
-"vlies",
-"yaups",
-"mucic",
-"punka",
-"yikes",
-"myops",
-"gurly",
-"fisks",
-"gipon",
-"spiry",
-"owled",
-"ramus",
-"gadje",
-"redos",
-"lordy",
-"snuck",
-"zuzim",
-"podia",
-"orpin",
-"amban",
-"hinau",
-"slive",
-"aruhe",
-"chota",
-"tiges",
-"pacos",
-"syker",
-"niqab",
-"gorps",
-"scapi",
-"tined",
-"advew",
-"mazes",
-"curli",
-"nines",
-"marts",
-"salue",
-"yirds",
-"skens",
-"zulus",
-"stoas",
-"coxes",
-"vizir",
-"yules",
-"paxes",
-"unwit",
-"rupee",
-"kaies",
-"luxed",
-"dules",
-"laths",
-"goths",
-"stewy",
-"opine",
-"saros",
-"saice",
-"eruvs",
-"bombo",
-"kilps",
-"agood",
-"artic",
-"teles",
-"zingy",
-"iller",
-"apoop",
-"sayne",
-"fades",
-"bluid",
-"mohua",
-"hying",
-"hyped",
-"knurs",
-"todde",
-"kinks",
-"benny",
-"tophs",
-"deros",
-"pryse",
-"huzzy",
-"redes",
-"pupas",
-"zinke",
-"spork",
-"umras",
-"whyda",
-"nikau",
-"warez",
-"lunts",
-"fouls",
-"coarb",
-"dalts",
-"ewers",
-"kagus",
-"inked",
-"zoist",
-"scrab",
-"keirs",
-"agita",
-"queyn",
-"gatch",
-"klieg",
-"neive",
-"xylan",
-"khors",
-"uptie",
-"roved",
-"grogs",
-"kerma",
-"nodes",
-"dhows",
-"sofas",
-"nurls",
-"chimo",
-"knosp",
-"quais",
-"raphe",
-"tenno",
-"porky",
-"gowfs",
-"vests",
-"patus",
-"hillo",
-"eyres",
-"bancs",
-"laces",
-"hauls",
-"crunk",
-"yexes",
-"kangs",
-"evens",
-"airer",
-"gramp",
-"tronk",
-"noups",
-"nubia",
-"wrier",
-"taube",
-"plook",
-"ticca",
-"gapes",
-"ksars",
-"tsked",
-"firie",
-"hodja",
-"hawed",
-"bolar",
-"frogs",
-"puled",
-"togae",
-"latte",
-"mopey",
-"pukey",
-"malic",
-"spumy",
-"brise",
-"antsy",
-"drome",
-"mvule",
-"prion",
-"rotte",
-"octad",
-"yiked",
-"yowed",
-"skeef",
-"janes",
-"redid",
-"frats",
-"sills",
-"snogs",
-"wryer",
-"pikis",
-"peons",
-"resew",
-"swies",
-"gonof",
-"urdee",
-"ramis",
-"zincy",
-"hoggs",
-"rathe",
-"caids",
-"zaidy",
-"phots",
-"goyim",
-"knaps",
-"seres",
-"plaps",
-"virge",
-"fezes",
-"favus",
-"abbas",
-"towny",
-"muled",
-"hyphy",
-"wrate",
-"peggy",
-"hules",
-"suete",
-"sices",
-"dawks",
-"loxes",
-"gooly",
-"snowk",
-"siped",
-"jarls",
-"skort",
-"pawed",
-"baals",
-"steen",
-"zobus",
-"shaul",
-"seral",
-"seise",
-"alkos",
-"oundy",
-"tarps",
-"warst",
-"coofs",
-"teems",
-"howfs",
-"terfs",
-"wudus",
-"spilt",
-"yeans",
-"rudds",
-"woopy",
-"genas",
-"kaneh",
-"racon",
-"houfs",
-"roist",
-"yummy",
-"soups",
-"lotsa",
-"golps",
-"barra",
-"bolos",
-"miffy",
-"lovie",
-"swobs",
-"croci",
-"cuter",
-"doffs",
-"derro",
-"ulyie",
-"pirai",
-"baths",
-"smout",
-"shied",
-"pomos",
-"etens",
-"ruffe",
-"dorky",
-"yente",
-"abers",
-"rebop",
-"feers",
-"hamza",
-"balms",
-"poofs",
-"labda",
-"micas",
-"spred",
-"brava",
-"burgs",
-"krona",
-"ergos",
-"ketas",
-"pools",
-"mikva",
-"roops",
-"jammy",
-"timps",
-"phare",
-"gimpy"
-}
\ No newline at end of file
+
+def __getattr__(attr):
+    if attr == "wordset":
+        value = set(word_data.word_list("api"))
+        globals()[attr] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
@@ -1,10 +1,12 @@
 import random
-from wordle_ai import LetterState
-from wordle_db import words as word_db
-from wordle_api import GameStatus
+import word_data
+from states import LetterState, GameStatus
+from pattern_codec import from_game_state
 
 class WordleGame:
-  def __init__(self, words = word_db):
+  def __init__(self, words = None):
+    if words is None:
+      words = word_data.word_list("words")
     self.words = words
 
   def guess(self, word):
@@ -86,4 +88,7 @@ class WordleGame:
     return self.game_state
 
   def get_game_state(self):
-    return self.game_state[-1]
\ No newline at end of file
+    return self.game_state[-1]
+
+  def get_pattern(self):
+    return from_game_state(self.game_state[-1])
@@ -7,42 +7,56 @@
 # All rights reserved.
 # ------------------------------------------------------------------------------
 
-from wordle_game import WordleGame
-from wordle_db import words
-from wordle_ai import *
-from wordle_api import *
-from wordle_db3 import wordset as wordset3
-from wordle_db2 import wordset as wordset2
+from wordle_api import WordleAPI
+from states import GameStatus
+from vocabularies import get_vocabulary, vocabulary_from_argv, DEFAULT_GUESSES, DEFAULT_ANSWERS
+from opening_book import OpeningBook
+
+
+def load_ai(guesses, answers):
+    # numpy and the pattern table load on first use
+    from wordle_ai import WordleAI
+    from pattern_table import PatternTable
+    ai = WordleAI(answers, PatternTable.load(guesses, answers))
+    ai.get_frequencies()
+    return ai
 
     
 def main():
     game = WordleAPI()
-    ai = WordleAI(wordset3)
+    guesses = get_vocabulary(DEFAULT_GUESSES)
+    answers = vocabulary_from_argv("answers", DEFAULT_ANSWERS)
+    # A saved book gives the first guess before the ai is loaded
+    ai = None
+    book = OpeningBook.peek(guesses, answers)
+    if book is None:
+        ai = load_ai(guesses, answers)
+        book = OpeningBook.load_or_build(ai)
 
     status = game.start_game()
-    # 1. Insert default first guess
-    status = game.guess('crane')
+    # (guess, pattern) pairs played so far
+    history = []
+    # 1. Insert first guess from the opening book
+    next_guess = book.first
+    status = game.guess(next_guess)
+    if ai is None:
+        ai = load_ai(guesses, answers)
+    ai.opening_book = book
+    pattern_table = ai.pattern_table
     while status == GameStatus.ONGOING:
         # 2. Prune list based on result
-        ai.prune_words_v2(game.get_game_state())
-        print(f"Remaining words - {len(ai.possible_words)}")
-        # 3. Calculate entropy for all remaining words and
-        #   select word with highest entropy
-        max_entropy = 0.0
-        next_guess = None
-
-        if ai.possible_words == set():
+        history += [(next_guess, game.get_pattern())]
+        ai.prune_by_pattern(pattern_table.guess_ids[next_guess], history[-1][1])
+        print(f"Remaining words - {ai.count_possible_words()}")
+        if ai.count_possible_words() == 0:
             # WARNING: This should not be entered, this would be erroneous
             print("ERROR: Possible word set is empty")
             break
 
-        for word in ai.possible_words:
-            if next_guess is None:
-                next_guess = word
-            word_entropy = ai.calculate_entropy(word)
-            if word_entropy > max_entropy:
-                next_guess = word
-        
+        # 3. Second guess from the opening book, then the endgame solver
+        #   or the best ranked guess, like the benchmark plays
+        next_guess = ai.next_guess(history)
+
         # 4. Guess word and get result
         status = game.guess(next_guess)
         # 5. Repeat 2-4 until answer is guessed or max guesses
@@ -0,0 +1,35 @@
+# ------------------------------------------------------------------------------
+# fixtures.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+from src.wordle_ai import WordleAI
+from src.pattern_codec import ALL_GREEN
+from src.pattern_table import PatternTable, build_pattern_table
+
+class SolverFixture:
+    # A solver over 16 answers, guessing from them and two other words
+
+    def setUp(self) -> None:
+        self.answers = ["cigar", "rebut", "sissy", "humph", "awake", "blush", "focal", "evade",
+                        "naval", "serve", "heath", "dwarf", "model", "karma", "stink", "grade"]
+        guesses = self.answers + ["crane", "slate"]
+        self.table = PatternTable(build_pattern_table(guesses, self.answers), guesses, self.answers)
+        self.ai = WordleAI(self.answers, self.table)
+        self.ai.get_frequencies()
+
+    def _play(self, answer_id):
+        # One game at a time, the way benchmark.Solver plays
+        self.ai.reset_candidates()
+        history = []
+        while True:
+            guess = self.ai.next_guess(history)
+            guess_id = self.table.guess_ids[guess]
+            pattern = int(self.table.table[guess_id, answer_id])
+            history.append((guess, pattern))
+            if pattern == ALL_GREEN:
+                return [word for word, _ in history]
+            self.ai.prune_by_pattern(guess_id, pattern)
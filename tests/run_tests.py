@@ -12,6 +12,19 @@ import unittest
 
 # Unit test imports
 from tests.test_wordle_ai import *
+from tests.test_pattern_table import *
+from tests.test_ranking import *
+from tests.test_opening_book import *
+from tests.test_memo_store import *
+from tests.test_batch_simulator import *
+from tests.test_endgame import *
+from tests.test_anytime import *
+from tests.test_sampling import *
+from tests.test_word_data import *
+from tests.test_startup import *
+from tests.test_word_registry import *
+from tests.test_catalog import *
+from tests.test_benchmark import *
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,45 @@
+# ------------------------------------------------------------------------------
+# test_anytime.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import time
+import unittest
+import numpy as np
+from src.anytime import *
+from src.pattern_table import words_to_array
+from tests.fixtures import SolverFixture
+
+class TestAnytime(SolverFixture, unittest.TestCase):
+
+    def test_1_letter_scores(self):
+        candidates = words_to_array(["cigar", "cider", "civic"])
+        scores = letter_scores(words_to_array(["cider", "civic", "zzzzz"]), candidates)
+        # Letters in every candidate or none of them tell nothing
+        self.assertEqual(scores[2], 0.0)
+        self.assertGreater(scores[0], scores[1])
+        # Characters outside a-z, like in the api word "no(a)", are scored too
+        scores = letter_scores(words_to_array(["no(a)", "cider"]), words_to_array(["no(a)", "cigar"]))
+        self.assertTrue(np.isfinite(scores).all())
+
+    def test_2_complete(self):
+        selection = select_guesses(self.ai, time.perf_counter() + 60, k=5)
+        self.assertTrue(selection.complete)
+        self.assertEqual(selection.evaluated, selection.total)
+        self.assertEqual(selection.total, len(self.table.answers))
+        self.assertEqual(selection.ranking, self.ai.rank_guesses(k=5))
+
+    def test_3_deadline(self):
+        # Past the deadline the heuristic's best guesses are returned
+        selection = select_guesses(self.ai, time.perf_counter() - 1, k=3)
+        self.assertFalse(selection.complete)
+        self.assertEqual(selection.evaluated, 0)
+        self.assertEqual(len(selection.ranking), 3)
+
+        ids = np.arange(4)
+        selection = select_guesses(self.ai, time.perf_counter() + 60, ids, k=10)
+        self.assertEqual(selection.total, 4)
+        self.assertEqual(len(selection.ranking), 4)
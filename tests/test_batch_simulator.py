@@ -0,0 +1,65 @@
+# ------------------------------------------------------------------------------
+# test_batch_simulator.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.batch_simulator import *
+from src.decision_tree import DecisionTree
+from tests.fixtures import SolverFixture
+
+class TestBatchSimulator(SolverFixture, unittest.TestCase):
+
+    def test_1_matches_single_games(self):
+        played, choices = simulate_lockstep(self.ai)
+        self.assertEqual(len(played), len(self.table.answers))
+        for answer_id, guesses in played.items():
+            self.assertEqual(guesses[-1], self.table.answers[answer_id])
+            self.assertEqual(guesses, self._play(answer_id))
+        # Games sharing a path share guess choices
+        self.assertLess(choices, sum(len(guesses) for guesses in played.values()))
+
+    def test_2_subset_of_answers(self):
+        played, _ = simulate_lockstep(self.ai, answer_ids=np.array([3, 7]))
+        self.assertEqual(sorted(played), [3, 7])
+
+
+class TestDecisionTree(SolverFixture, unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "decision_tree.bin")
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_1_matches_single_games(self):
+        tree = DecisionTree.compile(self.ai)
+        # Every node solves exactly one answer when only candidates are guessed
+        self.assertEqual(len(tree.guesses), len(self.table.answers))
+        for answer_id in range(len(self.table.answers)):
+            expected = self._play(answer_id)
+            history = []
+            for guess in expected:
+                self.assertEqual(tree.lookup(history), guess)
+                history.append((guess, self.table.pattern(guess, self.table.answers[answer_id])))
+
+    def test_2_save_and_load(self):
+        tree = DecisionTree.load_or_compile(self.ai, self.path)
+        self.assertTrue((tree.children == DecisionTree.compile(self.ai).children).all())
+        # A tree loaded into the ai answers next_guess by walking it
+        self.ai.decision_tree = tree
+        self.ai.rank_guesses = None
+        self.assertEqual(self.ai.next_guess([]), self.table.guesses[tree.guesses[0]])
+        self.assertIsNone(tree.lookup([("slate", 0)]))
+
+        self.ai.scoring_mode = "weighted"
+        with self.assertRaises(ValueError):
+            DecisionTree.load(self.path, self.ai)
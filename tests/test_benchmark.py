@@ -0,0 +1,64 @@
+# ------------------------------------------------------------------------------
+# test_benchmark.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import contextlib
+import io
+import unittest
+from unittest import mock
+from src.benchmark import *
+from src.opening_book import OpeningBook
+from src.pattern_table import PatternTable
+from tests.fixtures import SolverFixture
+
+class TestBenchmark(SolverFixture, unittest.TestCase):
+
+    def _patched(self):
+        # Use the fixture's table, and books that aren't saved next to the modules
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(PatternTable, "load", return_value=self.table))
+        stack.enter_context(mock.patch.object(OpeningBook, "load_or_build",
+                                              side_effect=lambda ai, path=None: OpeningBook.build(ai)))
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        return stack
+
+    def _played(self, games):
+        return {answer: played for answer, (played, _) in games.items()}
+
+    def test_1_runs_agree(self):
+        with self._patched():
+            sequential, _ = run_benchmark(self.table.guesses, self.answers, workers=1)
+            pooled, _ = run_benchmark(self.table.guesses, self.answers, workers=2, chunksize=3)
+            lockstep, _ = run_lockstep(self.table.guesses, self.answers)
+        self.assertEqual(len(sequential), len(self.answers))
+        # Same games whichever way they're played
+        self.assertEqual(self._played(pooled), self._played(sequential))
+        self.assertEqual(self._played(lockstep), self._played(sequential))
+        self.assertEqual(sequential["cigar"][0][-1], "cigar")
+
+    def test_2_summarize(self):
+        games = {"cigar": (["cigar"], 0.5),
+                 "rebut": (["crane"] * 6 + ["rebut"], 1.5),
+                 "sissy": (["crane", "slate", "sissy"], 1.0)}
+        summary = summarize(games, 2.0)
+        self.assertEqual(summary["games"], 3)
+        self.assertAlmostEqual(summary["mean"], 11 / 3)
+        self.assertEqual(summary["distribution"], {1: 1, 3: 1, 7: 1})
+        # More than MAX_GUESSES guesses is a failure, exactly MAX_GUESSES isn't
+        self.assertEqual(summary["failures"], ["rebut"])
+        games["sissy"] = (["crane"] * 5 + ["sissy"], 1.0)
+        self.assertEqual(summarize(games, 2.0)["failures"], ["rebut"])
+        self.assertEqual(summary["max_game_seconds"], 1.5)
+        self.assertEqual(summary["games_per_second"], 1.5)
+
+    def test_3_no_book_no_endgame(self):
+        # Every choice is ranked, so the prefilter audit sees all of them
+        solver = Solver(self.table, prefilter=True, opening_book=False, endgame_threshold=0)
+        self.assertIsNone(solver.ai.opening_book)
+        _, choices = simulate_lockstep(solver.ai)
+        self.assertEqual(solver.ai.prefilter_stats["rankings"], choices)
+        self.assertGreater(choices, 1)
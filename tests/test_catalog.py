@@ -0,0 +1,59 @@
+# ------------------------------------------------------------------------------
+# test_catalog.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import unittest
+from src import word_data
+from src.catalog import *
+from src.vocabularies import get_vocabulary
+from src.word_registry import get_registry
+
+class TestDictionaryCatalog(unittest.TestCase):
+
+    def test_1_bundled_lists(self):
+        catalog = get_catalog()
+        self.assertIs(get_catalog(), catalog)
+        self.assertEqual(catalog.names, ["words", "api", "answers"])
+        # Every word is stored once
+        self.assertEqual(len(catalog.words), 14094)
+        for name in catalog.names:
+            self.assertIs(catalog.word_list(name), get_vocabulary(name))
+            self.assertEqual(catalog.words_of(catalog.id_array(name)), catalog.word_list(name))
+            self.assertEqual(catalog.mask(name).sum(), len(catalog.word_list(name)))
+        with self.assertRaises(ValueError):
+            catalog.word_list("missing")
+        # Registry ids are catalog ids
+        registry = get_registry()
+        self.assertEqual(catalog.ids["cigar"], registry.ids["cigar"])
+        self.assertEqual(catalog.ids_of(["cigar", "rebut"]).tolist(),
+                         [registry.ids["cigar"], registry.ids["rebut"]])
+
+    def test_2_set_algebra(self):
+        catalog = get_catalog()
+        words, api, answers = (set(get_vocabulary(name)) for name in ("words", "api", "answers"))
+        self.assertEqual(len(catalog.difference("api", "words")), 1122)
+        self.assertEqual(set(catalog.words_of(catalog.difference("api", "words"))), api - words)
+        self.assertEqual(set(catalog.words_of(catalog.intersection("words", "answers"))), answers)
+        self.assertEqual(len(catalog.union("words", "api", "answers")), len(catalog.words))
+        self.assertEqual(len(catalog.difference("answers", "words")), 0)
+
+    def test_3_add_list(self):
+        catalog = DictionaryCatalog.from_word_data()
+        lexicon = word_data.word_list(word_data.LEXICON)
+        answers_mask = catalog.mask("answers")
+        ids = catalog.add_list("mine", ["cigar", "qqqqq", "cigar"])
+        self.assertEqual(ids.tolist(), [catalog.ids["cigar"], len(lexicon), catalog.ids["cigar"]])
+        self.assertEqual(catalog.word_list("mine"), ["cigar", "qqqqq", "cigar"])
+        # The shared lexicon doesn't grow, masks follow the catalog's
+        self.assertEqual(len(lexicon), 14094)
+        self.assertEqual(len(catalog.mask("answers")), len(lexicon) + 1)
+        self.assertEqual(catalog.mask("answers").sum(), answers_mask.sum())
+        self.assertEqual(catalog.words_of(catalog.difference("mine", "answers")), ["qqqqq"])
+        with self.assertRaises(ValueError):
+            catalog.add_list("mine", ["rebut"])
+        with self.assertRaises(ValueError):
+            get_catalog().ids_of(["qqqqq"])
@@ -0,0 +1,59 @@
+# ------------------------------------------------------------------------------
+# test_endgame.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import unittest
+import numpy as np
+from src.endgame import *
+from tests.fixtures import SolverFixture
+
+class TestEndgameSolver(SolverFixture, unittest.TestCase):
+
+    def _mean_guesses(self):
+        return np.mean([len(self._play(answer_id)) for answer_id in range(len(self.table.answers))])
+
+    def test_1_not_worse_than_greedy(self):
+        solver = EndgameSolver(self.table)
+        guess_id, expected = solver.best_guess(np.arange(len(self.table.answers)))
+        self.assertEqual(self.ai.next_guess([]), self.table.guesses[guess_id])
+        self.assertAlmostEqual(self._mean_guesses(), expected)
+
+        self.ai.endgame_threshold = None
+        self.assertLessEqual(expected, self._mean_guesses())
+
+    def test_2_small_sets(self):
+        solver = EndgameSolver(self.table)
+        self.assertEqual(solver.best_guess([5]), (self.table.guess_ids["blush"], 1.0))
+        # Guessing either of two candidates takes 1.5 guesses on average
+        guess_id, expected = solver.best_guess([0, 1])
+        self.assertIn(self.table.guesses[guess_id], ["cigar", "rebut"])
+        self.assertEqual(expected, 1.5)
+
+    def test_3_time_budget(self):
+        solver = EndgameSolver(self.table, time_budget=0.0)
+        self.assertIsNone(solver.best_guess(np.arange(len(self.table.answers))))
+        # next_guess falls back to the ranking
+        self.ai.endgame_time_budget = 0.0
+        self.assertEqual(self.ai.next_guess([]), self.ai.rank_guesses(k=1)[0][0])
+
+    def test_4_node_budget(self):
+        candidate_ids = np.arange(len(self.table.answers))
+        solver = EndgameSolver(self.table)
+        result = solver.best_guess(candidate_ids)
+        nodes = solver.memo[candidate_ids.tobytes()][2]
+        # Memo hits are charged their nodes, so a warm memo needs the same budget
+        for memo in (dict(), solver.memo):
+            short = EndgameSolver(self.table, node_budget=nodes - 1)
+            short.memo = dict(memo)
+            self.assertIsNone(short.best_guess(candidate_ids))
+            enough = EndgameSolver(self.table, node_budget=nodes)
+            enough.memo = dict(memo)
+            self.assertEqual(enough.best_guess(candidate_ids), result)
+
+        self.ai.endgame_nodes = nodes - 1
+        self.assertEqual(self.ai.next_guess([]), self.ai.rank_guesses(k=1)[0][0])
+        self.assertIn(f"endgame=20/{nodes - 1}", self.ai.get_strategy())
@@ -0,0 +1,59 @@
+# ------------------------------------------------------------------------------
+# test_memo_store.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import os
+import tempfile
+import unittest
+from src.wordle_ai import WordleAI
+from src.pattern_table import PatternTable, build_pattern_table
+from src.memo_store import *
+
+class TestMemoStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "memo.sqlite")
+        self.ranking = [("raise", 5.8), ("arise", 5.7), ("irate", 5.6)]
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_1_get_put(self):
+        store = MemoStore(self.path)
+        self.assertIsNone(store.get((3, 12345), "entropy", 3))
+        store.put((3, 12345), "entropy", 3, self.ranking)
+        self.assertEqual(store.get((3, 12345), "entropy", 2), self.ranking[:2])
+        # Stored with a smaller k, or under another mode
+        self.assertIsNone(store.get((3, 12345), "entropy", 10))
+        self.assertIsNone(store.get((3, 12345), "weighted", 3))
+        # A second connection, e.g. from another process, sees the row
+        self.assertEqual(MemoStore(self.path).get((3, 12345), "entropy", 3), self.ranking)
+        store.close()
+
+    def test_2_eviction(self):
+        store = MemoStore(self.path, max_entries=10)
+        for i in range(25):
+            store.put((1, i), "entropy", 3, self.ranking)
+        self.assertLessEqual(len(store), 10)
+        # The most recent entry survives
+        self.assertIsNotNone(store.get((1, 24), "entropy", 3))
+        store.close()
+
+    def test_3_wordle_ai(self):
+        guesses = ["ducks", "eerie", "avoid", "there", "aloud"]
+        answers = ["avoid", "avail", "aloud", "about", "there"]
+        table = PatternTable(build_pattern_table(guesses, answers), guesses, answers)
+        ai = WordleAI(answers, table, MemoStore(self.path))
+        ai.get_frequencies()
+        ranking = ai.rank_guesses(k=3)
+
+        # A cold ai sharing the store doesn't score anything
+        cold = WordleAI(answers, table, MemoStore(self.path))
+        cold.get_frequencies()
+        cold.calculate_entropies = None
+        self.assertEqual(cold.rank_guesses(k=3), ranking)
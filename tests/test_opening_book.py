@@ -0,0 +1,76 @@
+# ------------------------------------------------------------------------------
+# test_opening_book.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import tempfile
+import unittest
+from src.wordle_ai import WordleAI
+from src.pattern_table import PatternTable, build_pattern_table
+from src.opening_book import *
+
+class TestOpeningBook(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.guesses = ["avoid", "avail", "aloud", "about", "there", "ducks"]
+        self.answers = ["avoid", "avail", "aloud", "about", "there"]
+        self.table = PatternTable(build_pattern_table(self.guesses, self.answers),
+                                  self.guesses, self.answers)
+        self.ai = WordleAI(self.answers, self.table)
+        self.ai.get_frequencies()
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_1_build(self):
+        self.ai.opening_book = marker = object()
+        book = OpeningBook.build(self.ai)
+        self.assertIs(self.ai.opening_book, marker)
+        self.ai.opening_book = None
+        # Moves come from next_guess, the endgame solver for this few answers
+        self.assertEqual(book.first, self.ai.next_guess([]))
+        # The first guess splits every answer apart
+        self.assertEqual(len(book.second), 5)
+        pattern = self.table.pattern(book.first, "there")
+        self.assertEqual(book.lookup([]), book.first)
+        self.assertEqual(book.lookup([(book.first, pattern)]), "there")
+        # Out of book after a different first guess or two moves
+        self.assertIsNone(book.lookup([("ducks", pattern)]))
+        self.assertIsNone(book.lookup([(book.first, pattern), ("there", pattern)]))
+
+    def test_2_load_or_build(self):
+        path = book_path(self.ai, self.tmpdir.name)
+        book = OpeningBook.load_or_build(self.ai, path)
+        loaded = OpeningBook.load(path, self.ai)
+        self.assertEqual(loaded.first, book.first)
+        self.assertEqual(loaded.second, book.second)
+
+        other = WordleAI(self.guesses, PatternTable(build_pattern_table(self.guesses), self.guesses))
+        with self.assertRaises(ValueError):
+            OpeningBook.load(path, other)
+        # Books built with other priors or scoring are stale too
+        self.ai.prior_width = 8
+        self.assertNotEqual(book_path(self.ai, self.tmpdir.name), path)
+        with self.assertRaises(ValueError):
+            OpeningBook.load(path, self.ai)
+        self.ai.prior_width = WordleAI(self.answers, self.table).prior_width
+        self.ai.endgame_threshold = None
+        with self.assertRaises(ValueError):
+            OpeningBook.load(path, self.ai)
+        self.ai.endgame_threshold = 20
+        self.ai.scoring_mode = "sampled"
+        with self.assertRaises(ValueError):
+            OpeningBook.load(path, self.ai)
+
+    def test_3_peek(self):
+        # Finds a saved book from the word lists alone
+        self.assertIsNone(OpeningBook.peek(self.guesses, self.answers, self.tmpdir.name))
+        book = OpeningBook.load_or_build(self.ai, book_path(self.ai, self.tmpdir.name))
+        peeked = OpeningBook.peek(self.guesses, self.answers, self.tmpdir.name)
+        self.assertEqual((peeked.first, peeked.second), (book.first, book.second))
+        self.assertEqual(default_strategy(self.table.word_list_hash), self.ai.get_strategy())
+        self.assertIsNone(OpeningBook.peek(self.guesses, self.guesses, self.tmpdir.name))
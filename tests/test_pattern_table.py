@@ -0,0 +1,131 @@
+# ------------------------------------------------------------------------------
+# test_pattern_table.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import os
+import tempfile
+import unittest
+from multiprocessing import shared_memory
+import numpy as np
+from src.pattern_table import *
+from src.pattern_codec import *
+from src.shared_table import SharedPatternTable, attach
+
+class TestPatternTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.guesses = ["eerie", "crane", "speed", "abbey", "there"]
+        self.answers = ["there", "crane", "abide", "kebab"]
+
+    def test_1_known_patterns(self):
+        table = build_pattern_table(self.guesses, self.answers)
+        # Guess: eerie, Answer: there
+        # Yellows don't consume letters, so both leading e's are yellow
+        self.assertEqual(table[0, 0], from_string("yyyeg"))
+        # Guess: crane, Answer: crane
+        self.assertEqual(table[1, 1], ALL_GREEN)
+        # Guess: abbey, Answer: kebab
+        self.assertEqual(table[3, 3], from_string("yygye"))
+        # Guess: speed, Answer: abide
+        self.assertEqual(table[2, 2], from_string("eeyyy"))
+
+    def test_2_square_diagonal(self):
+        table = build_pattern_table(self.guesses)
+        self.assertEqual(table.shape, (5, 5))
+        self.assertTrue((np.diag(table) == ALL_GREEN).all())
+
+    def test_3_block_size_independent(self):
+        full = build_pattern_table(self.guesses, self.answers)
+        # A tiny budget forces one guess per block
+        blocked = build_pattern_table(self.guesses, self.answers, memory_budget=1)
+        self.assertTrue((full == blocked).all())
+
+
+class TestPatternCodec(unittest.TestCase):
+
+    def test_1_encode_decode(self):
+        self.assertEqual(encode([0, 0, 0, 0, 0]), 0)
+        self.assertEqual(encode([2, 2, 2, 2, 2]), ALL_GREEN)
+        for code in range(NUM_PATTERNS):
+            self.assertEqual(encode(decode(code)), code)
+            self.assertEqual(from_string(to_string(code)), code)
+
+    def test_2_encode_array(self):
+        codes = encode_array(DECODE_TABLE)
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertTrue((codes == np.arange(NUM_PATTERNS)).all())
+
+    def test_3_from_game_state(self):
+        # Guessed word: ducks, Answer: avoid
+        guess = [
+            {'letter':'u', 'state':0, 'position':1},
+            {'letter':'d', 'state':1, 'position':0},
+            {'letter':'c', 'state':0, 'position':2},
+            {'letter':'k', 'state':0, 'position':3},
+            {'letter':'s', 'state':0, 'position':4}
+        ]
+        self.assertEqual(from_game_state(guess), from_string("yeeee"))
+        response = [{'letter':c, 'state':s} for c, s in zip("ducks", [1, 0, 0, 0, 0])]
+        self.assertEqual(from_api_response(response), from_string("yeeee"))
+
+
+class TestPatternTableFile(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.words = ["crane", "tares", "abbey", "kebab"]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "pat_table.bin")
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_1_save_and_load(self):
+        table = build_pattern_table(self.words)
+        save_pattern_table(self.path, table, self.words)
+        loaded = load_pattern_table(self.path, self.words)
+        self.assertIsInstance(loaded, np.memmap)
+        self.assertTrue((loaded == table).all())
+
+    def test_2_stale_table_rejected(self):
+        save_pattern_table(self.path, build_pattern_table(self.words), self.words)
+        with self.assertRaises(ValueError):
+            load_pattern_table(self.path, ["crane", "tares", "abbey", "aback"])
+
+    def test_3_load_or_build(self):
+        built = load_or_build_pattern_table(self.path, self.words)
+        self.assertTrue((built == build_pattern_table(self.words)).all())
+        # A different dictionary rebuilds the table in place
+        other = ["crane", "tares"]
+        rebuilt = load_or_build_pattern_table(self.path, other)
+        self.assertEqual(rebuilt.shape, (2, 2))
+
+    def test_4_rectangular_table(self):
+        guesses = self.words + ["there", "eerie"]
+        answers = ["kebab", "crane"]
+        table = PatternTable.load(guesses, answers,
+                                  path=table_path(guesses, answers, self.tmpdir.name))
+        self.assertEqual(table.shape, (6, 2))
+        self.assertEqual(table.pattern("crane", "crane"), ALL_GREEN)
+        self.assertEqual(table.pattern("abbey", "kebab"), from_string("yygye"))
+        self.assertEqual(table.answer_ids["crane"], 1)
+        self.assertEqual(len(table.row("eerie")), 2)
+
+
+class TestSharedPatternTable(unittest.TestCase):
+
+    def test_1_publish_and_attach(self):
+        words = ["crane", "tares", "abbey", "kebab"]
+        table = PatternTable(build_pattern_table(words, words[:2]), words, words[:2])
+        with SharedPatternTable(table) as shared:
+            attached = attach(shared.handle)
+            self.assertTrue((attached.table == table.table).all())
+            self.assertTrue((attached.answer_guess_ids == table.answer_guess_ids).all())
+            self.assertFalse(attached.table.flags.writeable)
+            name = shared.handle.name
+        # The owner unlinks the segment on close
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
@@ -0,0 +1,30 @@
+# ------------------------------------------------------------------------------
+# test_ranking.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import unittest
+import numpy as np
+from src.ranking import *
+
+class TestRanking(unittest.TestCase):
+
+    def test_1_top_k(self):
+        words = ["crane", "tares", "soare", "eerie", "kebab"]
+        scores = np.array([5.5, 6.1, 5.9, 2.0, 3.0])
+        self.assertEqual(top_k(scores, words, 3),
+                         [("tares", 6.1), ("soare", 5.9), ("crane", 5.5)])
+        # k larger than the number of words returns them all
+        self.assertEqual(len(top_k(scores, words, 10)), 5)
+        self.assertEqual(top_k(scores, words, 0), [])
+
+    def test_2_ties_broken_by_id(self):
+        scores = np.array([1.0, 2.0, 2.0, 2.0, 0.5])
+        self.assertEqual(list(top_k_indices(scores, 2)), [1, 2])
+        # Lower id wins, regardless of position
+        ids = np.array([40, 30, 20, 10, 0])
+        self.assertEqual(list(top_k_indices(scores, 2, ids)), [3, 2])
+        self.assertEqual(list(top_k_indices(scores, 4, ids)), [3, 2, 1, 0])
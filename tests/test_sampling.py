@@ -0,0 +1,49 @@
+# ------------------------------------------------------------------------------
+# test_sampling.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import unittest
+import numpy as np
+from src.sampling import *
+from tests.fixtures import SolverFixture
+
+class TestSampling(SolverFixture, unittest.TestCase):
+
+    def test_1_stratified_sample(self):
+        ids = np.arange(100, 200)
+        strata = np.repeat([0, 1, 2], [70, 25, 5])
+        sample, weights = stratified_sample(ids, strata, 20, np.random.default_rng(0))
+        self.assertEqual(len(set(sample)), len(sample))
+        self.assertAlmostEqual(weights.sum(), 100)
+        # Each stratum is sampled in proportion to its size
+        self.assertEqual(np.count_nonzero(sample < 170), 14)
+        self.assertEqual(np.count_nonzero(sample >= 195), 1)
+        # Samples larger than the candidates take them all
+        sample, weights = stratified_sample(ids, strata, 200, np.random.default_rng(0))
+        self.assertTrue((sample == ids).all() and (weights == 1).all())
+
+    def test_2_sampled_entropies(self):
+        ids = self.ai.get_candidate_ids()
+        guess_ids = np.arange(len(self.table.guesses))
+        exact = self.ai.calculate_entropies(ids, guess_ids)
+        estimates, bounds = sampled_entropies(self.table.table, ids, guess_ids,
+                                              self.ai.letters[ids, 0], len(ids))
+        # The whole candidate set is exact
+        self.assertTrue(np.allclose(estimates, exact))
+        estimates, bounds = sampled_entropies(self.table.table, ids, guess_ids,
+                                              self.ai.letters[ids, 0], 8, seed=1)
+        self.assertTrue((bounds >= 0).all())
+        # Most estimates are within their bound
+        self.assertGreater(np.mean(np.abs(estimates - exact) <= bounds), 0.5)
+
+    def test_3_scoring_mode(self):
+        exact = self.ai.rank_guesses(k=3)
+        self.ai.scoring_mode = "sampled"
+        self.ai.sample_size = 8
+        self.assertNotEqual(self.ai.get_memo_mode(), "entropy")
+        # The top k are always scored exactly
+        self.assertEqual(self.ai.rank_guesses(k=3), exact)
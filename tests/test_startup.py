@@ -0,0 +1,20 @@
+# ------------------------------------------------------------------------------
+# test_startup.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import unittest
+from src.startup_benchmark import ENTRY_POINTS, measure
+
+class TestStartup(unittest.TestCase):
+
+    def test_1_entry_points_stay_light(self):
+        # Heavy and optional modules load after the first guess
+        for module in ENTRY_POINTS:
+            result = measure(module)
+            self.assertFalse(result["numpy"], module)
+            self.assertFalse(result["requests"], module)
+            self.assertGreater(result["peak_rss_kb"], 0)
@@ -0,0 +1,96 @@
+# ------------------------------------------------------------------------------
+# test_word_data.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from src import word_data
+from src.pattern_table import words_to_array
+
+class TestWordData(unittest.TestCase):
+
+    def test_1_bundled_lists(self):
+        words = word_data.word_list("words")
+        answers = word_data.word_list("answers")
+        api = word_data.word_list("api")
+        self.assertEqual((len(words), len(api), len(answers)), (12972, 14094, 2315))
+        self.assertEqual(answers[:2], ["cigar", "rebut"])
+        self.assertEqual(api, sorted(api))
+        self.assertTrue(set(answers) <= set(words))
+        self.assertIs(word_data.word_list("words"), words)
+        self.assertTrue((word_data.word_array("answers") - ord("a") == words_to_array(answers)).all())
+
+        frequencies = word_data.frequencies()
+        self.assertEqual(frequencies.dtype, np.float32)
+        self.assertEqual(len(frequencies), len(words))
+        frequency_map = word_data.frequency_map()
+        self.assertEqual(list(frequency_map), sorted(words))
+        self.assertAlmostEqual(frequency_map[words[7]], float(frequencies[7]))
+
+    def test_2_shims(self):
+        from src.wordle_db import words
+        from src.wordle_db3 import wordset
+        from src.frequency_map import frequency_map
+        self.assertIs(words, word_data.word_list("words"))
+        self.assertIs(wordset, word_data.word_list("answers"))
+        self.assertIs(frequency_map, word_data.frequency_map())
+        with self.assertRaises(ImportError):
+            from src.wordle_db import wordset
+
+    def test_3_priors(self):
+        priors = word_data.priors()
+        # Bundled in the file, the same values and dtype as computed ones
+        self.assertEqual(priors.dtype, np.float64)
+        self.assertEqual(priors.tolist(), word_data.compute_priors().tolist())
+        self.assertIs(word_data.priors(), priors)
+        words = word_data.word_list("words")
+        frequencies = word_data.frequencies()
+        # The centre-th most frequent word sits at the middle of the sigmoid
+        ranked = np.argsort(-frequencies, kind="stable")
+        self.assertGreater(priors[ranked[word_data.PRIOR_CENTRE - 100]], 0.5)
+        self.assertLess(priors[ranked[word_data.PRIOR_CENTRE + 100]], 0.5)
+        wider = word_data.priors(20, 1000)
+        self.assertIs(word_data.priors(20, 1000), wider)
+        self.assertEqual(wider.dtype, np.float64)
+        self.assertEqual(np.argmax(wider), np.argmax(frequencies))
+        self.assertFalse(wider.flags.writeable)
+        self.assertEqual(len(wider), len(words))
+
+    def test_4_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "word_data.bin")
+            word_data.save_word_data(path, {"lexicon": ["cigar", "rebut", "sissy", "humph"],
+                                            "short": np.array([0, 1, 2]),
+                                            "freqs": np.array([0.5, 0.25, 0.125], dtype=np.float32),
+                                            "long": np.array([3])})
+            with mock.patch.multiple(word_data, DATA_PATH=path, _data=None, _sections=None,
+                                     _word_lists=dict(), _priors=dict()):
+                self.assertEqual(word_data.word_list("short"), ["cigar", "rebut", "sissy"])
+                self.assertEqual(word_data.word_list("long"), ["humph"])
+                self.assertEqual(word_data.word_ids("short").tolist(), [0, 1, 2])
+                self.assertEqual(bytes(word_data.word_array("long")[0]), b"humph")
+                self.assertEqual(word_data.list_names(), ["lexicon", "short", "long"])
+                self.assertEqual(word_data.frequencies().tolist(), [0.5, 0.25, 0.125])
+                with self.assertRaises(ValueError):
+                    word_data.word_list("freqs")
+                with self.assertRaises(ValueError):
+                    word_data.word_list("missing")
+            with self.assertRaises(ValueError):
+                word_data.save_word_data(path, {"bad": ["toolong"]})
+            with self.assertRaises(ValueError):
+                word_data.save_word_data(path, {"bad": np.array([1 << 16])})
+
+    def test_5_build(self):
+        # The bundled file is up to date with the word lists
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "word_data.bin")
+            word_data.build_word_data(word_data.SOURCE_DIR, path)
+            with open(path, "rb") as built, open(word_data.DATA_PATH, "rb") as bundled:
+                self.assertEqual(built.read(), bundled.read())
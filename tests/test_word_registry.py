@@ -0,0 +1,81 @@
+# ------------------------------------------------------------------------------
+# test_word_registry.py
+#
+# Copyright (c) 2022
+# All rights reserved.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import unittest
+from src.word_registry import *
+from src.wordle_ai import WordleAI, LetterState
+from src.vocabularies import get_vocabulary
+from src.pattern_table import PatternTable, build_pattern_table, words_to_array
+
+class TestWordRegistry(unittest.TestCase):
+
+    def test_1_interning(self):
+        registry = WordRegistry(["cigar", "rebut"])
+        self.assertEqual(registry.add(["sissy", "cigar"]), [2, 0])
+        self.assertEqual(registry.words[registry.ids["sissy"]], "sissy")
+        self.assertEqual(len(registry), 3)
+        self.assertIn("rebut", registry)
+        # Letters and hash follow added words
+        letters, content_hash = registry.letters, registry.content_hash
+        registry.add(["humph"])
+        self.assertEqual(len(registry.letters), 4)
+        self.assertTrue((registry.letters[:3] == letters).all())
+        self.assertNotEqual(registry.content_hash, content_hash)
+
+        frozen = WordRegistry(["cigar"], frozen=True)
+        self.assertEqual(frozen.add(["cigar"]), [0])
+        with self.assertRaises(ValueError):
+            frozen.add(["rebut"])
+
+    def test_2_shared_registry(self):
+        registry = get_registry()
+        self.assertIs(get_registry(), registry)
+        words = get_vocabulary("words")
+        # Ids follow the wordle source order
+        self.assertEqual(registry.words[:len(words)], words)
+        self.assertTrue((registry.letters[:len(words)] == words_to_array(words)).all())
+
+        first = WordleAI({"cigar", "rebut"})
+        second = WordleAI({"cigar", "qqqqq"})
+        self.assertIs(first.words, second.words)
+        self.assertEqual(first.word_indices["cigar"], registry.ids["cigar"])
+        self.assertIn("qqqqq", registry)
+        # Growing the shared registry doesn't break the other instance
+        first.possible_words = {"rebut"}
+        self.assertEqual(len(first.candidates), len(first.letters))
+        self.assertEqual(first.possible_words, {"rebut"})
+
+    def test_3_table_registry(self):
+        answers = ["cigar", "rebut"]
+        ai = WordleAI(answers, PatternTable(build_pattern_table(answers), answers))
+        self.assertIsNot(ai.registry, get_registry())
+        with self.assertRaises(ValueError):
+            ai.possible_words = {"sissy"}
+        # Tables over the same word lists share one registry and its letters
+        other = WordleAI(answers, PatternTable(build_pattern_table(answers), answers))
+        self.assertIs(other.registry, ai.registry)
+        self.assertIs(other.letters, ai.letters)
+        self.assertIs(get_table_registry(other.pattern_table), ai.registry)
+        different = ["cigar", "sissy"]
+        self.assertIsNot(WordleAI(different, PatternTable(build_pattern_table(different), different)).registry,
+                         ai.registry)
+
+    def test_4_growth_between_instances(self):
+        first = WordleAI({"cigar", "rebut"})
+        WordleAI({"qqqqz"})
+        first.reset_candidates()
+        game_state = [{"letter": "d", "state": LetterState.YELLOW, "position": 0}]
+        first.prune_words_v2(game_state)
+        self.assertEqual(first.possible_words, {"cigar", "rebut"})
+        # The masks follow the registry after first interns a word of its own
+        first.possible_words = {"cigar", "qqqqy"}
+        WordleAI({"qqqqx"})
+        first.reset_candidates()
+        first.prune_words_v2(game_state)
+        self.assertEqual(len(first.candidates), len(first.words))
+        self.assertEqual(first.possible_words, {"cigar", "rebut"})
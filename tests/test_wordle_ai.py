@@ -9,7 +9,12 @@
 
 # Python imports
 import unittest
+from unittest import mock
 from src.wordle_ai import *
+from src.pattern_table import PatternTable, build_pattern_table
+from src.pattern_codec import from_string, ALL_GREEN
+from src.vocabularies import get_vocabulary
+from tests.fixtures import SolverFixture
 
 class TestWordleAI(unittest.TestCase):
     """
@@ -90,3 +95,180 @@ class TestWordleAI(unittest.TestCase):
         ai = WordleAI(self.word_set_1)
         self.assertEqual(ai._get_yellow_set(self.game_state_1), expected_output)
 
+
+
+class TestWordleAICandidates(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.word_set_1 = {"avoid", "avoir", "avons", "avunt"}
+
+        # Guessed word(s): ducks
+        # Answer: avoid
+        self.game_state_1 = [
+            {'letter':'d', 'state':LetterState.YELLOW, 'position':0},
+            {'letter':'u', 'state':LetterState.EMPTY, 'position':1},
+            {'letter':'c', 'state':LetterState.EMPTY, 'position':2},
+            {'letter':'k', 'state':LetterState.EMPTY, 'position':3},
+            {'letter':'s', 'state':LetterState.EMPTY, 'position':4}
+        ]
+
+    def test_1_candidate_mask(self):
+        ai = WordleAI(self.word_set_1)
+        self.assertEqual(ai.count_possible_words(), 4)
+        self.assertEqual(ai.possible_words, self.word_set_1)
+        ids = ai.get_candidate_ids()
+        self.assertEqual({ai.words[i] for i in ids}, self.word_set_1)
+
+    def test_2_prune_words_v2(self):
+        # Any word with u,c,k,s at any position or d at position 0 is removed
+        ai = WordleAI(self.word_set_1)
+        ai.prune_words_v2(self.game_state_1)
+        self.assertEqual(ai.possible_words, {"avoid", "avoir"})
+        self.assertEqual(ai.count_possible_words(), 2)
+
+    def test_2_prune_words_v2_api(self):
+        # Api words with characters outside a-z never match a game state
+        api = get_vocabulary("api")
+        ai = WordleAI(api)
+        ai.prune_words_v2(self.game_state_1)
+        self.assertIn("avoid", ai.possible_words)
+        self.assertNotIn("no(a)", ai.possible_words)
+        self.assertTrue(all(word.isalpha() and word.islower() for word in ai.possible_words))
+
+    def test_3_unknown_words(self):
+        # Words missing from the vocabularies still get ids
+        ai = WordleAI({"zzzzz", "avoid"})
+        self.assertEqual(ai.possible_words, {"zzzzz", "avoid"})
+        ai.possible_words = {"avoid"}
+        self.assertEqual(ai.possible_words, {"avoid"})
+
+    def test_4_prune_by_pattern(self):
+        guesses = ["ducks", "eerie", "avoid"]
+        answers = ["avoid", "avoir", "avons", "avunt", "there", "eerie"]
+        table = PatternTable(build_pattern_table(guesses, answers), guesses, answers)
+        ai = WordleAI(answers, table)
+        # Guessed word(s): ducks, Answer: avoid
+        ai.prune_by_pattern(table.guess_ids["ducks"], from_string("yeeee"))
+        self.assertEqual(ai.possible_words, {"avoid"})
+
+        # Repeated letters are exact, unlike prune_words_v2
+        ai.possible_words = answers
+        ai.prune_by_pattern(table.guess_ids["eerie"], table.pattern("eerie", "there"))
+        self.assertEqual(ai.possible_words, {"there"})
+
+    def test_5_calculate_entropies(self):
+        guesses = ["ducks", "eerie", "avoid", "there", "aloud"]
+        answers = ["avoid", "avail", "aloud", "about", "there"]
+        table = PatternTable(build_pattern_table(guesses, answers), guesses, answers)
+        ai = WordleAI(answers, table)
+        ai.get_frequencies()
+        entropies = ai.calculate_entropies(guess_ids=np.arange(5))
+        for word, entropy in zip(guesses, entropies):
+            if word in ai.word_indices:
+                expected = ai.calculate_entropy_v2(word, table) - ai.frequencies[word]
+                self.assertAlmostEqual(entropy, expected)
+        # avoid gives a different pattern for every answer
+        self.assertAlmostEqual(entropies[2], math.log2(5))
+
+        weighted = ai.calculate_entropies(guess_ids=np.arange(5), weighted=True)
+        self.assertEqual(weighted.shape, (5,))
+        self.assertTrue((weighted >= 0).all())
+
+    def test_6_rank_guesses_memo(self):
+        guesses = ["ducks", "eerie", "avoid", "there", "aloud"]
+        answers = ["avoid", "avail", "aloud", "about", "there"]
+        table = PatternTable(build_pattern_table(guesses, answers), guesses, answers)
+        ai = WordleAI(answers, table)
+        ai.get_frequencies()
+        ranking = ai.rank_guesses(k=3)
+        self.assertEqual(ai.memo.stats(), {"size": 1, "hits": 0, "misses": 1})
+        # Same candidates in a different order hit the memo
+        self.assertEqual(ai.rank_guesses(np.array([4, 3, 2, 1, 0]), k=2), ranking[:2])
+        self.assertEqual(ai.memo.hits, 1)
+        # A larger k than was cached recomputes
+        ai.rank_guesses(k=5)
+        self.assertEqual(ai.memo.stats(), {"size": 1, "hits": 1, "misses": 2})
+        self.assertNotEqual(ai.get_fingerprint(np.array([0, 1])), ai.get_fingerprint(np.array([0, 2])))
+
+    def test_7_priors(self):
+        answers = ["cigar", "rebut", "sissy", "humph", "awake"]
+        table = PatternTable(build_pattern_table(answers + ["qqqqq"]), answers + ["qqqqq"], answers)
+        ai = WordleAI(answers, table)
+        ai.get_frequencies()
+        priors = word_data.priors()
+        words = word_data.word_list("words")
+        expected = [float(priors[words.index(word)]) for word in answers]
+        self.assertEqual(ai.word_priors.tolist(), expected)
+        # Guesses without a frequency get a prior of 0
+        self.assertEqual(ai.guess_priors.tolist(), expected + [0.0])
+        self.assertAlmostEqual(ai.get_word_probabilities().sum(), 1.0)
+        self.assertEqual(ai.frequencies["humph"], expected[3])
+
+        mode = ai.get_memo_mode()
+        ai.rank_guesses(k=1)
+        ai.prior_width = 8
+        ai.get_frequencies()
+        # Other priors are memoized apart from the default ones
+        self.assertNotEqual(ai.get_memo_mode(), mode)
+        self.assertEqual(ai.memo.stats()["size"], 0)
+        self.assertEqual(ai.word_priors.tolist(), word_data.compute_priors(8)[[words.index(word) for word in answers]].tolist())
+
+
+    def test_8_unguessable_candidates(self):
+        # Answers that aren't guesses, like api-only words, are still solved
+        guesses = ["cigar", "rebut", "sissy"]
+        answers = ["cigar", "no(a)", "ibid."]
+        ai = WordleAI(answers, PatternTable(build_pattern_table(guesses, answers), guesses, answers))
+        ai.get_frequencies()
+        ai.possible_words = {"no(a)", "ibid."}
+        ranking = ai.rank_guesses(k=3)
+        self.assertEqual(len(ranking), 3)
+        self.assertIn(ai.next_guess([("rebut", 0)]), guesses)
+
+class TestWordleAIScoring(SolverFixture, unittest.TestCase):
+
+    def test_1_lookahead(self):
+        answers, table, ai = self.answers, self.table, self.ai
+        greedy = ai.rank_guesses(k=16)
+        ai.scoring_mode = "lookahead"
+        ai.lookahead_width = 16
+        ranking = ai.rank_guesses(k=3)
+
+        def two_ply(guess):
+            # Entropy of guess plus the best follow-up in each partition, by brute force
+            parts = dict()
+            for answer in answers:
+                parts.setdefault(table.pattern(guess, answer), []).append(answer)
+            total = 0.0
+            for pattern, part in parts.items():
+                if pattern != ALL_GREEN:
+                    total += len(part) / len(answers) * max(
+                        ai.calculate_entropies(np.array([table.answer_ids[w] for w in part]),
+                                               np.array([table.guess_ids[w] for w in part])))
+            return total
+
+        expected = sorted(((word, score + two_ply(word)) for word, score in greedy),
+                          key=lambda entry: -entry[1])[:3]
+        self.assertEqual([word for word, _ in ranking], [word for word, _ in expected])
+        for (_, score), (_, expected_score) in zip(ranking, expected):
+            self.assertAlmostEqual(score, expected_score)
+        # Lookahead rankings are memoized apart from one-ply ones
+        self.assertEqual(ai.memo.stats()["size"], 2)
+
+    def test_2_prefilter(self):
+        answers, ai = self.answers, self.ai
+        ids = ai.get_candidate_ids()
+        # Small candidate sets are cheap enough to score every guess
+        self.assertEqual(len(ai.prefilter_guesses(ids, ids, k=3)), 16)
+
+        full = ai.rank_guesses(k=16)
+        ai.prefilter = True
+        ai.prefilter_audit = True
+        with mock.patch("src.wordle_ai.PREFILTER_MIN", 4), mock.patch("src.wordle_ai.PREFILTER_ENTRIES", 0):
+            kept = ai.prefilter_guesses(ids, ids, k=3)
+            self.assertEqual(len(kept), 4)
+            ranking = ai.rank_guesses(k=3)
+        # Kept guesses keep their exact scores
+        self.assertEqual(ranking, [entry for entry in full if entry[0] in {answers[i] for i in kept}][:3])
+        self.assertEqual(ai.prefilter_stats["rankings"], 1)
+        self.assertEqual(ai.prefilter_stats["dropped"], int(full[0][0] not in {answers[i] for i in kept}))